@@ -1,25 +1,27 @@
-"""
-8085 Assembly Language Server Protocol (LSP) implementation.
-
-This package provides a complete LSP server for 8085 assembly language
-with support for:
-- Real-time diagnostics (syntax errors, undefined labels)
-- Code completion (instructions, registers, labels)
-- Hover documentation (detailed instruction information)
-- Go-to-definition (jump to label definitions)
-- Document symbols (outline view of labels)
-- Signature help (parameter hints)
-
-The server is designed to work with any LSP-compatible editor.
-"""
+"""8085 Assembly Language Server (LSP); see README.md for the feature list."""
 
 __version__ = "0.2.1"
 __author__ = "Resty"
 
-from .server import LSPServer, main
-
 __all__ = [
     "LSPServer",
     "main",
     "__version__",
 ]
+
+
+def __getattr__(name):
+    # The server pulls in the parsers and instruction DB; only load it when
+    # LSPServer/main are actually requested (PEP 562).
+    if name in ("LSPServer", "main"):
+        from .server import LSPServer, main
+
+        g = globals()
+        g["LSPServer"] = LSPServer
+        g["main"] = main
+        return g[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return list(__all__)
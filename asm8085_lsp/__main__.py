@@ -1,4 +1,3 @@
-#!/usr/bin/env python3
 """
 Entry point for the 8085 Assembly Language Server.
 
@@ -6,7 +5,9 @@ This module allows the LSP to be run as a package:
     python -m asm8085_lsp
 """
 
-from .server import main
+import sys
+
+from asm8085_lsp.server import main
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main() or 0)
@@ -1,13 +1,25 @@
-"""asm8085 CLI package initialization.
-
-This package contains the assembler and emulator for 8085 assembly programs.
-The emu module is included as part of this package for self-contained distribution.
-"""
-
-from .shared.emu import assembler, emu8085
-from .shared.instruction_db import (
-    INSTRUCTION_DB,  # Ensure metadata ships with the LSP bundle
-)
+"""asm8085 assembler, emulator and CLI (self-contained, no external deps)."""
 
 __all__ = ["assembler", "emu8085", "INSTRUCTION_DB"]
 __version__ = "0.2.0"
+
+
+def __getattr__(name):
+    # Resolve the heavy re-exports on first access so that importing a
+    # subpackage (e.g. the CLI) does not execute the instruction DB module.
+    if name == "INSTRUCTION_DB":
+        from .shared.instruction_db import INSTRUCTION_DB
+
+        globals()["INSTRUCTION_DB"] = INSTRUCTION_DB
+        return INSTRUCTION_DB
+    if name in ("assembler", "emu8085"):
+        from .shared.emu import assembler, emu8085
+
+        globals().update(assembler=assembler, emu8085=emu8085)
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    # Real module globals plus the lazy re-exports not loaded yet
+    return sorted(set(globals()) | set(__all__))
@@ -4,7 +4,9 @@ This allows the package to be executed with:
     python -m asm8085_lsp.asm8085_cli [args]
 """
 
-from .cli import main
+import sys
+
+from asm8085_lsp.asm8085_cli.cli import main
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main() or 0)
@@ -3,43 +3,28 @@
 Usage: asm [-d] <file.asm>
 """
 
-import argparse
 import os
+import re
+import struct
 import sys
 import time
+from functools import lru_cache
 
 try:
     import readline
 except ImportError:
     readline = None
 
-from .commands import (
-    InteractiveREPL,
-    analyze_warnings,
-    create_from_template,
-    disassemble_instruction,
-    explain_instruction,
-    explain_instruction_detailed,
-    explore_symbols,
-    export_cheat_sheet,
-    export_hex,
-    get_instruction_cycles,
-    get_instruction_description,
-    interactive_template_selector,
-    list_symbols_summary,
-    list_templates,
-    run_benchmark_mode,
-    run_coverage_mode,
-    run_debug_mode,
-    run_diff_mode,
-    run_profiler_mode,
-    visualize_memory_map,
-)
 from .shared import (
+    FLAG_STRINGS,
+    INSTRUCTION_CYCLES,
     Colors,
     assemble_or_exit,
     decode_flags,
+    disassemble_instruction,
     emu8085,
+    get_instruction_cycles,
+    get_instruction_description,
     load_config,
     load_source_file,
     parse_address_value,
@@ -50,23 +35,158 @@ from .shared import (
 from .shared.constants import DEFAULT_BENCHMARK_RUNS, PROFILER_DEFAULT_TOP_N
 
 
+# Command-line options as (flags, add_argument kwargs). The usage text lives in
+# helptext, so every option is registered with help=argparse.SUPPRESS
+_ARGSPEC = (
+    # Manual help arguments
+    (("-h",), {"action": "store_true"}),
+    (("--help",), {"action": "store_true"}),
+    (("--help-full",), {"action": "store_true"}),
+    # Positional argument
+    (("filename",), {"nargs": "?"}),
+    # Execution modes
+    (("-s", "--step"), {"action": "store_true"}),
+    (("-t", "--table"), {"action": "store_true"}),
+    (("-e", "--explain"), {"action": "store_true"}),
+    (
+        ("-w", "--auto", "--watch-file"),
+        {"action": "store_true", "dest": "watch_file"},
+    ),
+    # Debugging & Analysis
+    (("--debug",), {"metavar": "FILE"}),
+    (("--no-reverse",), {"action": "store_false", "dest": "reverse"}),
+    (("--diff",), {"nargs": 2, "metavar": ("FILE_A", "FILE_B")}),
+    (("--coverage",), {"action": "store_true"}),
+    (
+        ("-W", "--warnings"),
+        {"action": "store_const", "const": True, "default": None},
+    ),
+    (("--symbols",), {"action": "store_true", "dest": "show_symbols"}),
+    (
+        ("--benchmark",),
+        {"nargs": "+", "metavar": "FILE", "dest": "benchmark_files"},
+    ),
+    (
+        ("--bench-runs",),
+        {
+            "type": int,
+            "default": DEFAULT_BENCHMARK_RUNS,
+            "metavar": "N",
+            "dest": "bench_runs",
+        },
+    ),
+    (("--profile",), {"action": "store_true", "dest": "profile"}),
+    (
+        ("--profile-top",),
+        {
+            "type": int,
+            "default": PROFILER_DEFAULT_TOP_N,
+            "metavar": "N",
+            "dest": "profile_top",
+        },
+    ),
+    # Display
+    (
+        ("-r", "--registers"),
+        {
+            "action": "store_const",
+            "const": True,
+            "default": None,
+            "dest": "show_registers",
+        },
+    ),
+    (
+        ("-H", "--highlight"),
+        {
+            "action": "store_const",
+            "const": True,
+            "default": None,
+            "dest": "highlight_changes",
+        },
+    ),
+    (
+        ("-b", "--binary"),
+        {"action": "store_const", "const": True, "default": None},
+    ),
+    (("--base",), {"choices": ["hex", "dec", "bin"], "default": "hex"}),
+    (
+        ("-v", "--verbose"),
+        {"action": "store_const", "const": True, "default": None},
+    ),
+    # Memory
+    (("-m", "--memory"), {"type": str, "metavar": "RANGE"}),
+    (("-S", "--stack"), {"action": "store_true"}),
+    (("--show-changes",), {"action": "store_true"}),
+    (("--watch",), {"type": str, "metavar": "ADDRS"}),
+    (("--memory-map",), {"action": "store_true"}),
+    # Output
+    (("-d", "--disassemble"), {"action": "store_true"}),
+    (("-x", "--export-hex"), {"action": "store_true"}),
+    (
+        ("--hex-format",),
+        {"choices": ["raw", "intel", "c", "json"], "default": "raw", "metavar": "FMT"},
+    ),
+    # Learning
+    (
+        ("--explain-instr",),
+        {"type": str, "metavar": "INSTR", "dest": "explain_instruction"},
+    ),
+    (("--repl",), {"action": "store_true"}),
+    (
+        ("--cheat-sheet",),
+        {"nargs": 2, "metavar": ("FORMAT", "OUTPUT"), "dest": "cheat_sheet"},
+    ),
+    (("--list-templates",), {"action": "store_true", "dest": "list_templates"}),
+    (
+        ("--new-from-template",),
+        {"nargs": "+", "metavar": ("TEMPLATE", "OUTPUT"), "dest": "new_template"},
+    ),
+    (("--template-wizard",), {"action": "store_true", "dest": "template_wizard"}),
+    # Advanced
+    (
+        ("-u", "--unsafe"),
+        {"nargs": "?", "const": -1, "type": int, "metavar": "N"},
+    ),
+    (("-c", "--clock"), {"type": float, "metavar": "MHZ"}),
+)
+
+
+@lru_cache(maxsize=1)
+def _build_parser():
+    """Build the argument parser once per process from _ARGSPEC."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="8085 assembler and simulator",
+        add_help=False,  # We'll handle help manually
+    )
+    suppress = argparse.SUPPRESS
+    add_argument = parser.add_argument
+    for flags, kwargs in _ARGSPEC:
+        add_argument(*flags, help=suppress, **kwargs)
+    return parser
+
+
+# Valid single-char flags that can be combined (e.g. -sr)
+_VALID_FLAGS = frozenset("stewrbvdWSxhH")
+_FLAG_TOKENS = {c: f"-{c}" for c in _VALID_FLAGS}
+# Deletes every valid flag char; anything left over means "not combinable"
+_VALID_TRANS = str.maketrans("", "", "".join(_VALID_FLAGS))
+
+
 def expand_combined_flags(argv):
     """Expand combined short flags like -sr into -s -r"""
     expanded = []
 
-    # Valid single-char flags that can be combined
-    valid_flags = {"s", "t", "e", "w", "r", "b", "v", "d", "W", "S", "x", "h", "H"}
-
     for arg in argv:
-        if arg.startswith("-") and not arg.startswith("--") and len(arg) > 2:
+        if arg[:1] == "-" and arg[:2] != "--" and len(arg) > 2:
             # This is a combined flag like -sr
             flags = arg[1:]  # Remove the leading '-'
 
             # Check if all characters are valid flags
-            if all(c in valid_flags for c in flags):
+            if not flags.translate(_VALID_TRANS):
                 # Expand into separate flags
-                for flag in flags:
-                    expanded.append(f"-{flag}")
+                expanded.extend([_FLAG_TOKENS[c] for c in flags])
             else:
                 # Not all valid, keep as-is (might be -m, -u, -c with arguments)
                 expanded.append(arg)
@@ -76,371 +196,347 @@ def expand_combined_flags(argv):
     return expanded
 
 
-def main():
-    # Expand combined flags first (e.g., -sr -> -s -r)
-    sys.argv = expand_combined_flags(sys.argv)
+# Options checked against the standalone modes, as (args attribute, label)
+# pairs. Each gets one bit; conflicts are reported in this order.
+_MODE_OPTIONS = (
+    ("filename", "positional filename"),
+    ("step", "-s/--step"),
+    ("table", "-t/--table"),
+    ("explain", "-e/--explain"),
+    ("disassemble", "-d/--disassemble"),
+    ("warnings", "-W/--warnings"),
+    ("stack", "-S/--stack"),
+    ("memory", "-m/--memory"),
+    ("show_changes", "--show-changes"),
+    ("watch", "--watch"),
+    ("watch_file", "--auto/--watch-file"),
+    ("binary", "-b/--binary"),
+    ("highlight_changes", "--highlight"),
+    ("show_registers", "-r/--registers"),
+    ("explain_instruction", "--explain-instr"),
+    ("diff", "--diff"),
+    ("coverage", "--coverage"),
+    ("debug", "--debug"),
+)
+_OPTION_BITS = {attr: 1 << i for i, (attr, _) in enumerate(_MODE_OPTIONS)}
+
+
+def _option_mask(*attrs):
+    mask = 0
+    for attr in attrs:
+        mask |= _OPTION_BITS[attr]
+    return mask
+
+
+_COMMON_INCOMPAT = _option_mask(
+    "step",
+    "table",
+    "explain",
+    "disassemble",
+    "warnings",
+    "stack",
+    "memory",
+    "show_changes",
+    "watch",
+    "watch_file",
+    "binary",
+)
+_INCOMPAT_MASKS = {
+    "--debug": _COMMON_INCOMPAT
+    | _option_mask(
+        "filename", "show_registers", "explain_instruction", "diff", "coverage"
+    ),
+    "--diff": _COMMON_INCOMPAT
+    | _option_mask(
+        "filename",
+        "highlight_changes",
+        "show_registers",
+        "explain_instruction",
+        "coverage",
+    ),
+    "--coverage": _COMMON_INCOMPAT
+    | _option_mask(
+        "highlight_changes", "show_registers", "explain_instruction", "diff", "debug"
+    ),
+}
+
+
+def _reject_incompatible(args, mode):
+    """Exit with an error if any option incompatible with mode is set."""
+    active = 0
+    for attr, bit in _OPTION_BITS.items():
+        if getattr(args, attr):
+            active |= bit
+    conflict = active & _INCOMPAT_MASKS[mode]
+    if conflict:
+        incompatible = [
+            label
+            for attr, label in _MODE_OPTIONS
+            if conflict & _OPTION_BITS[attr]
+        ]
+        print(
+            f"{Colors.RED}Error:{Colors.RESET} {mode} cannot be combined with: {', '.join(incompatible)}"
+        )
+        sys.exit(1)
 
-    # Load configuration files
-    config = load_config()
 
-    # Check for help flags first
-    if "-h" in sys.argv or "--help" in sys.argv:
-        if "--help-full" not in sys.argv:
-            print_short_help()
-            sys.exit(0)
+# Slots of the register snapshots captured by the trace loop; the order
+# matches emu8085.regs, so bytes(cpu.regs) is a snapshot
+_A, _B, _C, _D, _E, _H, _L, _F = range(8)
+_TRACE_REG_SLOTS = (("B", _B), ("C", _C), ("D", _D), ("E", _E), ("H", _H), ("L", _L))
+_REG_SLOTS = {"A": _A, "B": _B, "C": _C, "D": _D, "E": _E, "H": _H, "L": _L}
+
+# Step-mode explanations for a changed accumulator, keyed by mnemonic. old/new
+# are A before/after, src the operand and src_val its value before execution
+_A_CHANGE_FORMATS = {
+    "MVI": "A = immediate {new:02X}H",
+    "MOV": "A = {mov_src}({new:02X}H)",
+    "ADD": "A = {old:02X}H + {src}({src_val:02X}H) = {new:02X}H",
+    "ADC": "A = {old:02X}H + {src}({src_val:02X}H) = {new:02X}H",
+    "SUB": "A = {old:02X}H - {src}({src_val:02X}H) = {new:02X}H",
+    "SBB": "A = {old:02X}H - {src}({src_val:02X}H) = {new:02X}H",
+    "ANA": "A = {old:02X}H AND {src}({src_val:02X}H) = {new:02X}H",
+    "ORA": "A = {old:02X}H OR {src}({src_val:02X}H) = {new:02X}H",
+    "XRA": "A = {old:02X}H XOR {src}({src_val:02X}H) = {new:02X}H",
+    "INR": "A = {old:02X}H + 1 = {new:02X}H",
+    "DCR": "A = {old:02X}H - 1 = {new:02X}H",
+    "CMA": "A = NOT {old:02X}H = {new:02X}H",
+    "RLC": "A = rotated {old:02X}H = {new:02X}H",
+    "RRC": "A = rotated {old:02X}H = {new:02X}H",
+    "RAL": "A = rotated {old:02X}H = {new:02X}H",
+    "RAR": "A = rotated {old:02X}H = {new:02X}H",
+}
+# Mnemonics above that only explain A when A is their destination
+_A_DEST_OPS = frozenset(("MVI", "MOV", "INR", "DCR"))
+# Same for B..L, applied when the changed register is the destination
+_REG_CHANGE_FORMATS = {
+    "MVI": "{reg} = immediate {new:02X}H",
+    "MOV": "{reg} = {mov_src}({new:02X}H)",
+    "INR": "{reg} = {old:02X}H + 1 = {new:02X}H",
+    "DCR": "{reg} = {old:02X}H - 1 = {new:02X}H",
+}
+_REG_CHANGE_DEFAULT = "{reg} = {new:02X}H"
+
+
+@lru_cache(maxsize=1024)
+def _parse_traced_instr(instr):
+    """Split a disassembled instruction for the step-mode change explanations.
+
+    Returns (op, dest, src, src_slot, mov_src, a_fmt): the mnemonic, first
+    operand letter, operand ("M" if none) and its register slot, the MOV
+    source, and the accumulator template from _A_CHANGE_FORMATS (None when
+    the instruction has no specific explanation for A). Loops trace the same
+    instructions over and over, so results are cached.
+    """
+    op, _, operands = instr.partition(" ")
+    dest = operands[:1]
+    src = operands or "M"
+    a_fmt = _A_CHANGE_FORMATS.get(op)
+    if op in _A_DEST_OPS and dest != "A":
+        a_fmt = None
+    return (
+        op,
+        dest,
+        src,
+        _REG_SLOTS.get(src),
+        operands.partition(",")[2].strip(),
+        a_fmt,
+    )
 
-    if "--help-full" in sys.argv:
-        print_full_help()
-        sys.exit(0)
+# IN/OUT talk to the console directly, so buffered trace output must be
+# flushed before they execute
+_IO_OPCODES = frozenset((0xD3, 0xDB))
 
-    parser = argparse.ArgumentParser(
-        description="8085 assembler and simulator",
-        add_help=False,  # We'll handle help manually
-    )
+# Maps every byte to itself if printable ASCII, else to "."
+_PRINTABLE_ASCII = bytes(c if 32 <= c <= 126 else 0x2E for c in range(256))
 
-    # Add manual help arguments
-    parser.add_argument("-h", action="store_true", help=argparse.SUPPRESS)
-    parser.add_argument("--help", action="store_true", help=argparse.SUPPRESS)
-    parser.add_argument("--help-full", action="store_true", help=argparse.SUPPRESS)
+# Runs of non-zero bytes in a memory image or change mask
+_NONZERO_RUNS = re.compile(rb"[^\x00]+")
 
-    # Positional argument
-    parser.add_argument("filename", nargs="?", help=argparse.SUPPRESS)
 
-    # Execution modes
-    parser.add_argument("-s", "--step", action="store_true", help=argparse.SUPPRESS)
-    parser.add_argument("-t", "--table", action="store_true", help=argparse.SUPPRESS)
-    parser.add_argument("-e", "--explain", action="store_true", help=argparse.SUPPRESS)
-    parser.add_argument(
-        "-w",
-        "--auto",
-        "--watch-file",
-        action="store_true",
-        dest="watch_file",
-        help=argparse.SUPPRESS,
-    )
+def _changed_mask(before, after):
+    """Byte-wise XOR of two equal-length memory images; non-zero where they differ."""
+    size = len(after)
+    return (
+        int.from_bytes(before, "little") ^ int.from_bytes(after, "little")
+    ).to_bytes(size, "little")
 
-    # Debugging & Analysis
-    parser.add_argument("--debug", metavar="FILE", help=argparse.SUPPRESS)
-    parser.add_argument(
-        "--diff", nargs=2, metavar=("FILE_A", "FILE_B"), help=argparse.SUPPRESS
-    )
-    parser.add_argument("--coverage", action="store_true", help=argparse.SUPPRESS)
-    parser.add_argument(
-        "-W",
-        "--warnings",
-        action="store_const",
-        const=True,
-        default=None,
-        help=argparse.SUPPRESS,
-    )
-    parser.add_argument(
-        "--symbols",
-        action="store_true",
-        dest="show_symbols",
-        help=argparse.SUPPRESS,
-    )
-    parser.add_argument(
-        "--benchmark",
-        nargs="+",
-        metavar="FILE",
-        dest="benchmark_files",
-        help=argparse.SUPPRESS,
-    )
-    parser.add_argument(
-        "--bench-runs",
-        type=int,
-        default=DEFAULT_BENCHMARK_RUNS,
-        metavar="N",
-        dest="bench_runs",
-        help=argparse.SUPPRESS,
-    )
-    parser.add_argument(
-        "--profile",
-        action="store_true",
-        dest="profile",
-        help=argparse.SUPPRESS,
-    )
-    parser.add_argument(
-        "--profile-top",
-        type=int,
-        default=PROFILER_DEFAULT_TOP_N,
-        metavar="N",
-        dest="profile_top",
-        help=argparse.SUPPRESS,
-    )
 
-    # Display
-    parser.add_argument(
-        "-r",
-        "--registers",
-        action="store_const",
-        const=True,
-        default=None,
-        dest="show_registers",
-        help=argparse.SUPPRESS,
-    )
-    parser.add_argument(
-        "-H",
-        "--highlight",
-        action="store_const",
-        const=True,
-        default=None,
-        dest="highlight_changes",
-        help=argparse.SUPPRESS,
-    )
-    parser.add_argument(
-        "-b",
-        "--binary",
-        action="store_const",
-        const=True,
-        default=None,
-        help=argparse.SUPPRESS,
-    )
-    parser.add_argument(
-        "--base", choices=["hex", "dec", "bin"], default="hex", help=argparse.SUPPRESS
-    )
-    parser.add_argument(
-        "-v",
-        "--verbose",
-        action="store_const",
-        const=True,
-        default=None,
-        help=argparse.SUPPRESS,
-    )
+def _scan_memory(initial, final):
+    """Summarize a memory image against its initial state.
 
-    # Memory
-    parser.add_argument(
-        "-m", "--memory", type=str, metavar="RANGE", help=argparse.SUPPRESS
-    )
-    parser.add_argument("-S", "--stack", action="store_true", help=argparse.SUPPRESS)
-    parser.add_argument("--show-changes", action="store_true", help=argparse.SUPPRESS)
-    parser.add_argument("--watch", type=str, metavar="ADDRS", help=argparse.SUPPRESS)
-    parser.add_argument("--memory-map", action="store_true", help=argparse.SUPPRESS)
+    Returns (regions, used, changed): the inclusive (start, end) ranges of
+    non-zero bytes in final, the number of non-zero bytes, and the number of
+    bytes that differ from initial. Every pass runs in C over the byte images.
+    """
+    regions = [(run.start(), run.end() - 1) for run in _NONZERO_RUNS.finditer(final)]
+    used = len(final) - final.count(0)
+    changed = len(final) - _changed_mask(initial, final).count(0)
+    return regions, used, changed
 
-    # Output
-    parser.add_argument(
-        "-d", "--disassemble", action="store_true", help=argparse.SUPPRESS
-    )
-    parser.add_argument(
-        "-x", "--export-hex", action="store_true", help=argparse.SUPPRESS
-    )
-    parser.add_argument(
-        "--hex-format",
-        choices=["raw", "intel", "c", "json"],
-        default="raw",
-        metavar="FMT",
-        help=argparse.SUPPRESS,
-    )
 
-    # Learning
-    parser.add_argument(
-        "--explain-instr",
-        type=str,
-        metavar="INSTR",
-        dest="explain_instruction",
-        help=argparse.SUPPRESS,
-    )
-    parser.add_argument("--repl", action="store_true", help=argparse.SUPPRESS)
-    parser.add_argument(
-        "--cheat-sheet",
-        nargs=2,
-        metavar=("FORMAT", "OUTPUT"),
-        dest="cheat_sheet",
-        help=argparse.SUPPRESS,
-    )
-    parser.add_argument(
-        "--list-templates",
-        action="store_true",
-        dest="list_templates",
-        help=argparse.SUPPRESS,
-    )
-    parser.add_argument(
-        "--new-from-template",
-        nargs="+",
-        metavar=("TEMPLATE", "OUTPUT"),
-        dest="new_template",
-        help=argparse.SUPPRESS,
+# Number base for each --base choice
+_BASE_MAP = {"hex": 16, "dec": 10, "bin": 2}
+
+# Colors for warning severities in -W output
+_SEVERITY_COLORS = {
+    "error": Colors.RED,
+    "warning": Colors.YELLOW,
+    "info": Colors.BLUE,
+    "hint": Colors.GREEN,
+}
+
+# Per-byte hex strings, built once instead of formatted per traced step
+_HEX2 = tuple(f"{i:02X}" for i in range(256))
+_BIN8 = tuple(f"{i:08b}" for i in range(256))
+
+# (name, bit) of each 8085 flag in F, in display order
+_FLAG_BITS = (("S", 7), ("Z", 6), ("AC", 4), ("P", 2), ("CY", 0))
+
+# "S=1 Z=0 AC=0 P=1 CY=0" texts for every flag byte
+_FLAG_FIELDS = tuple(
+    f"S={d['S']} Z={d['Z']} AC={d['AC']} P={d['P']} CY={d['CY']}"
+    for d in map(decode_flags, range(256))
+)
+# Step-mode flags suffix, plain and highlighted
+_FLAG_LINES = tuple(f"  Flags: {fields}" for fields in _FLAG_FIELDS)
+_FLAG_LINES_HL = tuple(
+    f"  {Colors.HIGHLIGHT}Flags: {fields}{Colors.RESET}" for fields in _FLAG_FIELDS
+)
+
+# Highlighted variants of the per-byte strings
+_HEX2_HL = tuple(f"{Colors.HIGHLIGHT}{text}{Colors.RESET}" for text in _HEX2)
+_BIN8_HL = tuple(f"{Colors.HIGHLIGHT}{text}{Colors.RESET}" for text in _BIN8)
+
+
+# Step-mode register line formatters. Each takes the register tuples after
+# and before the step; the highlighting variants mark registers that changed
+def _fmt_hex(regs, prev):
+    a, b, c, d, e, h, l, f = regs
+    return (
+        f"  A={_HEX2[a]} B={_HEX2[b]} C={_HEX2[c]} D={_HEX2[d]} "
+        f"E={_HEX2[e]} H={_HEX2[h]} L={_HEX2[l]}{_FLAG_LINES[f]}"
     )
-    parser.add_argument(
-        "--template-wizard",
-        action="store_true",
-        dest="template_wizard",
-        help=argparse.SUPPRESS,
+
+
+def _fmt_hex_hl(regs, prev):
+    a, b, c, d, e, h, l, f = regs
+    a0, b0, c0, d0, e0, h0, l0, f0 = prev
+    return (
+        f"  A={(_HEX2_HL if a != a0 else _HEX2)[a]} "
+        f"B={(_HEX2_HL if b != b0 else _HEX2)[b]} "
+        f"C={(_HEX2_HL if c != c0 else _HEX2)[c]} "
+        f"D={(_HEX2_HL if d != d0 else _HEX2)[d]} "
+        f"E={(_HEX2_HL if e != e0 else _HEX2)[e]} "
+        f"H={(_HEX2_HL if h != h0 else _HEX2)[h]} "
+        f"L={(_HEX2_HL if l != l0 else _HEX2)[l]}"
+        f"{(_FLAG_LINES_HL if f != f0 else _FLAG_LINES)[f]}"
     )
 
-    # Advanced
-    parser.add_argument(
-        "-u",
-        "--unsafe",
-        nargs="?",
-        const=-1,
-        type=int,
-        metavar="N",
-        help=argparse.SUPPRESS,
+
+def _fmt_bin(regs, prev):
+    a, b, c, d, e, h, l, _ = regs
+    return (
+        f"  A={_BIN8[a]} B={_BIN8[b]} C={_BIN8[c]} D={_BIN8[d]} "
+        f"E={_BIN8[e]} H={_BIN8[h]} L={_BIN8[l]}"
     )
-    parser.add_argument(
-        "-c", "--clock", type=float, metavar="MHZ", help=argparse.SUPPRESS
+
+
+def _fmt_bin_hl(regs, prev):
+    a, b, c, d, e, h, l, _ = regs
+    a0, b0, c0, d0, e0, h0, l0, _ = prev
+    return (
+        f"  A={(_BIN8_HL if a != a0 else _BIN8)[a]} "
+        f"B={(_BIN8_HL if b != b0 else _BIN8)[b]} "
+        f"C={(_BIN8_HL if c != c0 else _BIN8)[c]} "
+        f"D={(_BIN8_HL if d != d0 else _BIN8)[d]} "
+        f"E={(_BIN8_HL if e != e0 else _BIN8)[e]} "
+        f"H={(_BIN8_HL if h != h0 else _BIN8)[h]} "
+        f"L={(_BIN8_HL if l != l0 else _BIN8)[l]}"
     )
 
-    args = parser.parse_args()
+
+# Keyed by (binary, highlight_changes)
+_STEP_FORMATTERS = {
+    (False, False): _fmt_hex,
+    (False, True): _fmt_hex_hl,
+    (True, False): _fmt_bin,
+    (True, True): _fmt_bin_hl,
+}
+
+
+def _explain_state(cpu):
+    """Register snapshot in the dict form explain_instruction expects."""
+    return {
+        "A": cpu.A.value,
+        "B": cpu.B.value,
+        "C": cpu.C.value,
+        "D": cpu.D.value,
+        "E": cpu.E.value,
+        "H": cpu.H.value,
+        "L": cpu.L.value,
+        "F": cpu.F.value,
+        "PC": cpu.PC.value,
+        "SP": cpu.SP.value,
+    }
+
+
+def main():
+    # Expand combined flags first (e.g., -sr -> -s -r)
+    sys.argv = expand_combined_flags(sys.argv)
+
+    # Check for help flags first, before any config or parser setup
+    if "--help-full" in sys.argv:
+        print_full_help()
+        sys.exit(0)
+
+    if "-h" in sys.argv or "--help" in sys.argv:
+        print_short_help()
+        sys.exit(0)
+
+    # Load configuration files
+    config = load_config()
+
+    args = _build_parser().parse_args()
 
     # Apply configuration file defaults (only for flags not explicitly set by user)
     config.apply_to_args(args)
 
-    # Convert remaining None values to False for boolean flags (after config application)
-    # Config may have set these to True or False, so only convert if still None
-    if args.highlight_changes is None:
-        args.highlight_changes = False
-    if args.show_registers is None:
-        args.show_registers = False
-    if args.binary is None:
-        args.binary = False
-    if args.verbose is None:
-        args.verbose = False
-    if args.warnings is None:
-        args.warnings = False
-
     args.memory_auto = False
 
     # Handle REPL mode
     if args.repl:
+        from .commands import InteractiveREPL
+
         from_repl = InteractiveREPL()
         from_repl.run()
         sys.exit(0)
 
     if args.debug:
-        incompatible = []
-        if args.filename:
-            incompatible.append("positional filename")
-        if args.step:
-            incompatible.append("-s/--step")
-        if args.table:
-            incompatible.append("-t/--table")
-        if args.explain:
-            incompatible.append("-e/--explain")
-        if args.disassemble:
-            incompatible.append("-d/--disassemble")
-        if args.warnings:
-            incompatible.append("-W/--warnings")
-        if args.stack:
-            incompatible.append("-S/--stack")
-        if args.memory:
-            incompatible.append("-m/--memory")
-        if args.show_changes:
-            incompatible.append("--show-changes")
-        if args.watch:
-            incompatible.append("--watch")
-        if args.watch_file:
-            incompatible.append("--auto/--watch-file")
-        if args.binary:
-            incompatible.append("-b/--binary")
-        if args.show_registers:
-            incompatible.append("-r/--registers")
-        if args.explain_instruction:
-            incompatible.append("--explain-instr")
-        if args.diff:
-            incompatible.append("--diff")
-        if args.coverage:
-            incompatible.append("--coverage")
-
-        if incompatible:
-            print(
-                f"{Colors.RED}Error:{Colors.RESET} --debug cannot be combined with: {', '.join(incompatible)}"
-            )
-            sys.exit(1)
+        _reject_incompatible(args, "--debug")
+
+        from .commands import run_debug_mode
 
         run_debug_mode(args.debug, args)
         return
 
     if args.diff:
-        incompatible = []
-        if args.filename:
-            incompatible.append("positional filename")
-        if args.step:
-            incompatible.append("-s/--step")
-        if args.table:
-            incompatible.append("-t/--table")
-        if args.explain:
-            incompatible.append("-e/--explain")
-        if args.disassemble:
-            incompatible.append("-d/--disassemble")
-        if args.warnings:
-            incompatible.append("-W/--warnings")
-        if args.stack:
-            incompatible.append("-S/--stack")
-        if args.memory:
-            incompatible.append("-m/--memory")
-        if args.show_changes:
-            incompatible.append("--show-changes")
-        if args.watch:
-            incompatible.append("--watch")
-        if args.watch_file:
-            incompatible.append("--auto/--watch-file")
-        if args.binary:
-            incompatible.append("-b/--binary")
-        if args.highlight_changes:
-            incompatible.append("--highlight")
-        if args.show_registers:
-            incompatible.append("-r/--registers")
-        if args.explain_instruction:
-            incompatible.append("--explain-instr")
-        if args.coverage:
-            incompatible.append("--coverage")
-
-        if incompatible:
-            print(
-                f"{Colors.RED}Error:{Colors.RESET} --diff cannot be combined with: {', '.join(incompatible)}"
-            )
-            sys.exit(1)
+        _reject_incompatible(args, "--diff")
+
+        from .commands import run_diff_mode
 
         run_diff_mode(args.diff[0], args.diff[1], args)
         return
 
     if args.coverage:
-        incompatible = []
-        if args.step:
-            incompatible.append("-s/--step")
-        if args.table:
-            incompatible.append("-t/--table")
-        if args.explain:
-            incompatible.append("-e/--explain")
-        if args.disassemble:
-            incompatible.append("-d/--disassemble")
-        if args.warnings:
-            incompatible.append("-W/--warnings")
-        if args.stack:
-            incompatible.append("-S/--stack")
-        if args.memory:
-            incompatible.append("-m/--memory")
-        if args.show_changes:
-            incompatible.append("--show-changes")
-        if args.watch:
-            incompatible.append("--watch")
-        if args.watch_file:
-            incompatible.append("--auto/--watch-file")
-        if args.binary:
-            incompatible.append("-b/--binary")
-        if args.highlight_changes:
-            incompatible.append("--highlight")
-        if args.show_registers:
-            incompatible.append("-r/--registers")
-        if args.explain_instruction:
-            incompatible.append("--explain-instr")
-        if args.diff:
-            incompatible.append("--diff")
-        if args.debug:
-            incompatible.append("--debug")
-
-        if incompatible:
-            print(
-                f"{Colors.RED}Error:{Colors.RESET} --coverage cannot be combined with: {', '.join(incompatible)}"
-            )
-            sys.exit(1)
+        _reject_incompatible(args, "--coverage")
 
         if not args.filename:
             print(f"{Colors.RED}Error:{Colors.RESET} --coverage requires a filename")
             sys.exit(1)
 
+        from .commands import run_coverage_mode
+
         run_coverage_mode(args)
         return
 
@@ -449,11 +545,15 @@ def main():
         if not args.filename:
             print(f"{Colors.RED}Error:{Colors.RESET} --symbols requires a filename")
             sys.exit(1)
+        from .commands import explore_symbols
+
         explore_symbols(args.filename, args)
         return
 
     # Handle --benchmark mode
     if args.benchmark_files:
+        from .commands import run_benchmark_mode
+
         run_benchmark_mode(args.benchmark_files, args, runs=args.bench_runs)
         return
 
@@ -462,6 +562,8 @@ def main():
         if not args.filename:
             print(f"{Colors.RED}Error:{Colors.RESET} --memory-map requires a filename")
             sys.exit(1)
+        from .commands import visualize_memory_map
+
         visualize_memory_map(args.filename, args)
         return
 
@@ -470,6 +572,8 @@ def main():
         if not args.filename:
             print(f"{Colors.RED}Error:{Colors.RESET} --profile requires a filename")
             sys.exit(1)
+        from .commands import run_profiler_mode
+
         run_profiler_mode(args.filename, args, top_n=args.profile_top)
         return
 
@@ -483,22 +587,30 @@ def main():
 
     # Handle --explain-instr mode
     if args.explain_instruction:
+        from .commands import explain_instruction_detailed
+
         explain_instruction_detailed(args.explain_instruction)
         sys.exit(0)
 
     # Handle --cheat-sheet mode
     if args.cheat_sheet:
         format_type, output_file = args.cheat_sheet
+        from .commands import export_cheat_sheet
+
         export_cheat_sheet(format_type, output_file)
         sys.exit(0)
 
     # Handle --list-templates mode
     if args.list_templates:
+        from .commands import list_templates
+
         list_templates()
         sys.exit(0)
 
     # Handle --template-wizard mode
     if args.template_wizard:
+        from .commands import create_from_template, interactive_template_selector
+
         selected = interactive_template_selector()
         if selected:
             output = input("\nEnter output filename: ").strip()
@@ -515,6 +627,8 @@ def main():
                 f"{Colors.RED}Error:{Colors.RESET} --new-from-template requires TEMPLATE and OUTPUT arguments"
             )
             sys.exit(1)
+        from .commands import create_from_template
+
         template_name = args.new_template[0]
         output_file = args.new_template[1]
         author = args.new_template[2] if len(args.new_template) > 2 else ""
@@ -540,8 +654,7 @@ def main():
         sys.exit(1)
 
     # Normalize base argument
-    base_map = {"hex": 16, "dec": 10, "bin": 2}
-    args.base_num = base_map[args.base]
+    args.base_num = _BASE_MAP[args.base]
     filename = args.filename
 
     if not os.path.exists(filename):
@@ -554,44 +667,35 @@ def main():
         print(f"Monitoring: {Colors.CYAN}{filename}{Colors.RESET}")
         print(f"Press {Colors.YELLOW}Ctrl+C{Colors.RESET} to exit\n")
 
-        last_mtime = 0
         run_count = 0
 
         try:
-            while True:
-                current_mtime = os.path.getmtime(filename)
+            for _ in _watch_for_changes(filename):
+                run_count += 1
 
-                # File changed or first run
-                if current_mtime != last_mtime:
-                    run_count += 1
-                    last_mtime = current_mtime
+                # Clear screen for clean output
+                os.system("clear" if os.name == "posix" else "cls")
 
-                    # Clear screen for clean output
-                    os.system("clear" if os.name == "posix" else "cls")
-
-                    # Show header
-                    timestamp = time.strftime("%H:%M:%S")
-                    print(f"{Colors.BLUE}{'═' * 70}{Colors.RESET}")
-                    print(
-                        f"{Colors.BLUE}{Colors.BOLD}Run #{run_count} at {timestamp}{Colors.RESET}"
-                    )
-                    print(f"{Colors.BLUE}File: {Colors.CYAN}{filename}{Colors.RESET}")
-                    print(f"{Colors.BLUE}{'═' * 70}{Colors.RESET}\n")
+                # Show header
+                timestamp = time.strftime("%H:%M:%S")
+                print(f"{Colors.BLUE}{'═' * 70}{Colors.RESET}")
+                print(
+                    f"{Colors.BLUE}{Colors.BOLD}Run #{run_count} at {timestamp}{Colors.RESET}"
+                )
+                print(f"{Colors.BLUE}File: {Colors.CYAN}{filename}{Colors.RESET}")
+                print(f"{Colors.BLUE}{'═' * 70}{Colors.RESET}\n")
 
-                    # Run the program
-                    try:
-                        run_program_once(args)
-                    except Exception as e:
-                        print(f"\n{Colors.RED}Error:{Colors.RESET} {e}")
+                # Run the program
+                try:
+                    run_program_once(args)
+                except Exception as e:
+                    print(f"\n{Colors.RED}Error:{Colors.RESET} {e}")
 
-                    # Show footer
-                    print(f"\n{Colors.DIM}{'─' * 70}{Colors.RESET}")
-                    print(
-                        f"{Colors.DIM}Watching for changes... (Ctrl+C to exit){Colors.RESET}"
-                    )
-
-                # Poll every 0.5 seconds
-                time.sleep(0.5)
+                # Show footer
+                print(f"\n{Colors.DIM}{'─' * 70}{Colors.RESET}")
+                print(
+                    f"{Colors.DIM}Watching for changes... (Ctrl+C to exit){Colors.RESET}"
+                )
 
         except KeyboardInterrupt:
             print(f"\n\n{Colors.YELLOW}Watch mode stopped.{Colors.RESET}")
@@ -601,6 +705,63 @@ def main():
         run_program_once(args)
 
 
+def _watch_for_changes(filename, poll_interval=0.5):
+    """Yield once immediately, then again every time filename is modified.
+
+    Uses watchdog filesystem events when the package is installed, so an idle
+    watch costs no wakeups; otherwise falls back to polling the mtime.
+    """
+    try:
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+    except ImportError:
+        Observer = None
+
+    def mtime():
+        try:
+            return os.path.getmtime(filename)
+        except OSError:  # mid-save (e.g. atomic rename); treat as unchanged
+            return None
+
+    last_mtime = mtime()
+    yield
+
+    if Observer is None:
+        while True:
+            time.sleep(poll_interval)
+            current_mtime = mtime()
+            if current_mtime is not None and current_mtime != last_mtime:
+                last_mtime = current_mtime
+                yield
+
+    import threading
+
+    target = os.path.abspath(filename)
+    changed = threading.Event()
+
+    class _Handler(FileSystemEventHandler):
+        def on_any_event(self, event):
+            paths = (event.src_path, getattr(event, "dest_path", ""))
+            if any(p and os.path.abspath(p) == target for p in paths):
+                changed.set()
+
+    observer = Observer()
+    observer.schedule(_Handler(), os.path.dirname(target))
+    observer.start()
+    try:
+        while True:
+            changed.wait()
+            changed.clear()
+            # One save usually fires several events; only rerun on a new mtime
+            current_mtime = mtime()
+            if current_mtime is not None and current_mtime != last_mtime:
+                last_mtime = current_mtime
+                yield
+    finally:
+        observer.stop()
+        observer.join()
+
+
 def run_program_once(args):
     """Execute the assembly program once"""
     filename = args.filename
@@ -612,21 +773,20 @@ def run_program_once(args):
         f"{Colors.GREEN}✓ Assembly successful{Colors.RESET} for {Colors.BOLD}{filename}{Colors.RESET}"
     )
     load_addr = asm.ploadoff
-    program_size = sum(asm.writtenaddresses)
+    program_size = asm.writtencount
+    # Program bounds [prog_lo, prog_hi) for the stack and memory-map views
+    prog_lo = load_addr
+    prog_hi = load_addr + program_size
     if getattr(args, "memory_auto", False) and not args.memory:
         end_addr = (load_addr + 0x1F) & 0xFFFF
         args.memory = f"{load_addr:04X}-{end_addr:04X}"
 
     # Check for warnings if enabled
     if args.warnings:
+        from .commands import analyze_warnings
+
         warnings = analyze_warnings(clean_lines, asm)
         if warnings:
-            severity_colors = {
-                "error": Colors.RED,
-                "warning": Colors.YELLOW,
-                "info": Colors.BLUE,
-                "hint": Colors.GREEN,
-            }
             print(f"\n{Colors.YELLOW}{'─' * 60}{Colors.RESET}")
             print(
                 f"{Colors.YELLOW}{Colors.BOLD}⚠ WARNINGS ({len(warnings)} found){Colors.RESET}"
@@ -644,7 +804,7 @@ def run_program_once(args):
                     warning.get("severity") if isinstance(warning, dict) else None
                 )
                 severity = severity or "warning"
-                color = severity_colors.get(severity, Colors.YELLOW)
+                color = _SEVERITY_COLORS.get(severity, Colors.YELLOW)
                 label = severity.upper()
                 print(f"{color}Line {line_num} [{label}]:{Colors.RESET} {message}")
 
@@ -665,15 +825,19 @@ def run_program_once(args):
         total_cycles = 0
         instruction_count = 0
 
-        while addr < len(asm.writtenaddresses) and asm.writtenaddresses[addr]:
+        written = asm.writtenaddresses
+        written_len = len(written)
+        pmemory = asm.pmemory
+
+        while addr < written_len and written[addr]:
             # Get instruction
-            instr, size = disassemble_instruction(asm.pmemory, addr)
+            instr, size = disassemble_instruction(pmemory, addr)
 
             # Get hex bytes
-            hex_bytes = " ".join(f"{asm.pmemory[addr + i]:02X}" for i in range(size))
+            hex_bytes = bytes(pmemory[addr : addr + size]).hex(" ").upper()
 
             # Get cycle count
-            cycles = get_instruction_cycles(asm.pmemory, addr)
+            cycles = get_instruction_cycles(pmemory, addr)
             total_cycles += cycles
 
             # Get description
@@ -708,6 +872,8 @@ def run_program_once(args):
         else:  # raw
             output_file = f"{base_name}.txt"
 
+        from .commands import export_hex
+
         try:
             export_hex(asm, output_file, format_type)
             format_names = {
@@ -726,18 +892,19 @@ def run_program_once(args):
 
     # Create emulator and load the program
     cpu = emu8085()
-    # Copy assembled memory to emulator (pmemory is int array, need to set c_ubyte values)
-    for i, byte_val in enumerate(asm.pmemory):
-        cpu.memory[i].value = byte_val
+    # Copy assembled memory to emulator in one bulk write
+    cpu.loadbinary(asm.pmemory)
     cpu.PC.value = asm.ploadoff
 
     # Track initial memory state for change detection
-    initial_memory = [cpu.memory[i].value for i in range(len(cpu.memory))]
+    initial_memory = bytes(cpu.mem)
 
     if args.step:
         print(f"{Colors.DIM}(Step trace mode enabled){Colors.RESET}\n")
 
     if args.explain:
+        from .commands import explain_instruction
+
         print(f"{Colors.DIM}(Mathematical explanation mode enabled){Colors.RESET}\n")
 
     if args.table:
@@ -755,367 +922,245 @@ def run_program_once(args):
     total_cycles = 0
 
     # Track previous register values for highlighting changes
-    prev_regs = {"A": 0, "B": 0, "C": 0, "D": 0, "E": 0, "H": 0, "L": 0, "F": 0}
+    prev_regs = bytes(8)
+
+    # Explain mode: the state after one step is the state before the next,
+    # so each iteration only snapshots the CPU once
+    cpu_after = None
+
+    # Bind per-step lookups and build the trace line templates once. The
+    # disassembler and explainers read plain ints from the cpu.mem bytearray
+    mem = cpu.mem
+    regs = cpu.regs
+    get_cycles = get_instruction_cycles
+    disasm = disassemble_instruction
+    highlight, reset = Colors.HIGHLIGHT, Colors.RESET
+    step_fmt = (
+        f"{Colors.CYAN}Step {{}}:{reset} {Colors.BOLD}{{:04X}}{reset}  {{}}  "
+        f"{Colors.DIM}[{{}}T]{reset}\n"
+    )
+    explain_fmt = (
+        f"{Colors.CYAN}{{:<4}}{reset} {Colors.BOLD}{{:04X}}{reset}  {{:<20}} "
+        f"{Colors.DIM}→{reset} {Colors.GREEN}{{}}{reset}\n"
+    )
+    changes_fmt = f"{{}}\n{Colors.DIM}     {{}}{reset}\n\n"
+    # Flags are passed pre-padded to 10 columns so that highlight escape
+    # codes do not break the alignment
+    row_fmt = (
+        f"{{:<5}} {Colors.CYAN}{{:04X}}{reset}  {{:<18}} {{}}  {{}}  {{}}  {{}}  {{}}  "
+        f"{{}}  {{}}  {{:04X}}  {{}}  {Colors.DIM}{{}}{reset}\n"
+    )
 
-    # Start real-time measurement
-    start_time = time.time()
+    # Step mode register line formatter, chosen once for the whole run
+    format_step = _STEP_FORMATTERS[bool(args.binary), bool(args.highlight_changes)]
 
-    # Run until halted or max_steps reached
-    while not cpu.haulted and steps < max_steps:
-        # Get cycles for current instruction before execution
-        cycles = get_instruction_cycles(cpu.memory, cpu.PC.value)
-
-        # Get current instruction for display
-        instr, size = disassemble_instruction(cpu.memory, cpu.PC.value)
-        current_pc = cpu.PC.value
-
-        # Save CPU state before execution for explanation mode
-        if args.explain:
-            cpu_before = {
-                "A": cpu.A.value,
-                "B": cpu.B.value,
-                "C": cpu.C.value,
-                "D": cpu.D.value,
-                "E": cpu.E.value,
-                "H": cpu.H.value,
-                "L": cpu.L.value,
-                "F": cpu.F.value,
-                "PC": cpu.PC.value,
-                "SP": cpu.SP.value,
-            }
+    def fmt_reg(val, old_val):
+        # Format values first, then add color codes to maintain alignment
+        if val != old_val:
+            return f"{highlight}{_HEX2[val]}{reset}"
+        return _HEX2[val]
 
-        # Show step info if trace mode enabled
-        if args.step:
-            print(
-                f"{Colors.CYAN}Step {steps + 1}:{Colors.RESET} {Colors.BOLD}{current_pc:04X}{Colors.RESET}  {instr}  {Colors.DIM}[{cycles}T]{Colors.RESET}"
-            )
+    # Trace lines are collected and written in batches instead of one print()
+    # per line; the batch is flushed early before IN/OUT so that program I/O
+    # stays in order with the trace
+    out = []
+    emit = out.append
 
-        # Save state before execution for highlighting
-        if args.step and args.highlight_changes:
-            pre_exec_regs = {
-                "A": cpu.A.value,
-                "B": cpu.B.value,
-                "C": cpu.C.value,
-                "D": cpu.D.value,
-                "E": cpu.E.value,
-                "H": cpu.H.value,
-                "L": cpu.L.value,
-                "F": cpu.F.value,
-            }
-            pre_exec_instr = disassemble_instruction(cpu.memory, cpu.PC.value)[0]
-
-        cpu.runcrntins()
-        steps += 1
-        total_cycles += cycles
-
-        # Show mathematical explanation if explain mode enabled
-        if args.explain:
-            cpu_after = {
-                "A": cpu.A.value,
-                "B": cpu.B.value,
-                "C": cpu.C.value,
-                "D": cpu.D.value,
-                "E": cpu.E.value,
-                "H": cpu.H.value,
-                "L": cpu.L.value,
-                "F": cpu.F.value,
-                "PC": cpu.PC.value,
-                "SP": cpu.SP.value,
-            }
-            explanation = explain_instruction(
-                instr, cpu_before, cpu_after, cpu.memory, args.base_num
-            )
-            if explanation:
-                print(
-                    f"{Colors.CYAN}{steps:<4}{Colors.RESET} {Colors.BOLD}{current_pc:04X}{Colors.RESET}  {instr:<20} {Colors.DIM}→{Colors.RESET} {Colors.GREEN}{explanation}{Colors.RESET}"
-                )
+    def flush_trace():
+        sys.stdout.write("".join(out))
+        sys.stdout.flush()
+        out.clear()
 
-        # Show table row if table mode enabled
-        if args.table:
-            # Get current register values
-            curr_regs = {
-                "A": cpu.A.value,
-                "B": cpu.B.value,
-                "C": cpu.C.value,
-                "D": cpu.D.value,
-                "E": cpu.E.value,
-                "H": cpu.H.value,
-                "L": cpu.L.value,
-                "F": cpu.F.value,
-            }
+    # Start real-time measurement
+    start_time = time.time()
 
-            # Format flags
-            flags = decode_flags(cpu.F.value)
-            flags_str = f"{'S' if flags['S'] else '-'}{'Z' if flags['Z'] else '-'}{'-'}{'A' if flags['AC'] else '-'}{'-'}{'P' if flags['P'] else '-'}{'-'}{'C' if flags['CY'] else '-'}"
-
-            # Format registers with optional highlighting
-            if args.highlight_changes:
-                # Format values first, then add color codes to maintain alignment
-                def fmt_reg(val, old_val):
-                    val_str = f"{val:02X}"
-                    if val != old_val:
-                        return f"{Colors.HIGHLIGHT}{val_str}{Colors.RESET}"
-                    return val_str
-
-                a_str = fmt_reg(curr_regs["A"], prev_regs["A"])
-                b_str = fmt_reg(curr_regs["B"], prev_regs["B"])
-                c_str = fmt_reg(curr_regs["C"], prev_regs["C"])
-                d_str = fmt_reg(curr_regs["D"], prev_regs["D"])
-                e_str = fmt_reg(curr_regs["E"], prev_regs["E"])
-                h_str = fmt_reg(curr_regs["H"], prev_regs["H"])
-                l_str = fmt_reg(curr_regs["L"], prev_regs["L"])
-
-                # Highlight flags if changed
-                flags_display = flags_str
-                if curr_regs["F"] != prev_regs["F"]:
-                    flags_display = f"{Colors.HIGHLIGHT}{flags_str}{Colors.RESET}"
-
-                # Manual padding for flags to avoid color code alignment issues
-                flags_padded = flags_display + " " * (10 - len(flags_str))
+    # Run until halted or max_steps reached. Without any per-step output the
+    # loop only has to execute and count, so that case gets its own variant
+    if not (args.step or args.table or args.explain):
+        run = cpu.runcrntins
+        pc = cpu.PC
+        cycle_table = INSTRUCTION_CYCLES
+        while not cpu.haulted and steps < max_steps:
+            total_cycles += cycle_table[mem[pc.value]]
+            run()
+            steps += 1
+    else:
+        # Flush whatever is buffered even if the run stops early (emulator
+        # error, Ctrl+C): the trace up to the fault is what the user needs
+        try:
+            while not cpu.haulted and steps < max_steps:
+                current_pc = cpu.PC.value
 
-                print(
-                    f"{steps:<5} {Colors.CYAN}{current_pc:04X}{Colors.RESET}  {instr:<18} {a_str}  {b_str}  {c_str}  {d_str}  {e_str}  {h_str}  {l_str}  {cpu.SP.value:04X}  {flags_padded}  {Colors.DIM}{cycles}{Colors.RESET}"
-                )
-            else:
-                print(
-                    f"{steps:<5} {Colors.CYAN}{current_pc:04X}{Colors.RESET}  {instr:<18} {curr_regs['A']:02X}  {curr_regs['B']:02X}  {curr_regs['C']:02X}  {curr_regs['D']:02X}  {curr_regs['E']:02X}  {curr_regs['H']:02X}  {curr_regs['L']:02X}  {cpu.SP.value:04X}  {flags_str:<10}  {Colors.DIM}{cycles}{Colors.RESET}"
-                )
+                # Get cycles for current instruction before execution
+                cycles = get_cycles(mem, current_pc)
 
-            # Update previous registers for next iteration
-            prev_regs = curr_regs.copy()
-
-        # Show registers after execution if trace mode enabled
-        if args.step:
-            # Get current register values
-            curr_regs = {
-                "A": cpu.A.value,
-                "B": cpu.B.value,
-                "C": cpu.C.value,
-                "D": cpu.D.value,
-                "E": cpu.E.value,
-                "H": cpu.H.value,
-                "L": cpu.L.value,
-                "F": cpu.F.value,
-            }
+                # Get current instruction for display
+                instr, size = disasm(mem, current_pc)
 
-            flags = decode_flags(cpu.F.value)
+                # Save CPU state before execution for explanation mode
+                if args.explain:
+                    cpu_before = cpu_after if cpu_after is not None else _explain_state(cpu)
 
-            if args.binary:
-                # Binary output with optional highlighting
-                if args.highlight_changes:
-                    # Format each register with highlight if changed
-                    def fmt_reg_bin(name, val, changed):
-                        if changed:
-                            return f"{name}={Colors.HIGHLIGHT}{val:08b}{Colors.RESET}"
-                        else:
-                            return f"{name}={val:08b}"
+                # Show step info if trace mode enabled
+                if args.step:
+                    emit(step_fmt.format(steps + 1, current_pc, instr, cycles))
 
-                    a_str = fmt_reg_bin(
-                        "A", curr_regs["A"], curr_regs["A"] != prev_regs["A"]
-                    )
-                    b_str = fmt_reg_bin(
-                        "B", curr_regs["B"], curr_regs["B"] != prev_regs["B"]
-                    )
-                    c_str = fmt_reg_bin(
-                        "C", curr_regs["C"], curr_regs["C"] != prev_regs["C"]
-                    )
-                    d_str = fmt_reg_bin(
-                        "D", curr_regs["D"], curr_regs["D"] != prev_regs["D"]
-                    )
-                    e_str = fmt_reg_bin(
-                        "E", curr_regs["E"], curr_regs["E"] != prev_regs["E"]
-                    )
-                    h_str = fmt_reg_bin(
-                        "H", curr_regs["H"], curr_regs["H"] != prev_regs["H"]
-                    )
-                    l_str = fmt_reg_bin(
-                        "L", curr_regs["L"], curr_regs["L"] != prev_regs["L"]
-                    )
+                # The registers before execution are the previous step's
+                # snapshot (prev_regs), so only the instruction needs saving
+                if args.step and args.highlight_changes:
+                    pre_exec_instr = instr
 
-                    print(f"  {a_str} {b_str} {c_str} {d_str} {e_str} {h_str} {l_str}")
-                else:
-                    print(
-                        f"  A={curr_regs['A']:08b} B={curr_regs['B']:08b} C={curr_regs['C']:08b} "
-                        f"D={curr_regs['D']:08b} E={curr_regs['E']:08b} H={curr_regs['H']:08b} L={curr_regs['L']:08b}"
-                    )
-            else:
-                # Hex output with optional highlighting
-                if args.highlight_changes:
-                    # Format each register with highlight if changed
-                    def fmt_reg(name, val, changed):
-                        if changed:
-                            return f"{name}={Colors.HIGHLIGHT}{val:02X}{Colors.RESET}"
-                        else:
-                            return f"{name}={val:02X}"
-
-                    a_str = fmt_reg(
-                        "A", curr_regs["A"], curr_regs["A"] != prev_regs["A"]
-                    )
-                    b_str = fmt_reg(
-                        "B", curr_regs["B"], curr_regs["B"] != prev_regs["B"]
-                    )
-                    c_str = fmt_reg(
-                        "C", curr_regs["C"], curr_regs["C"] != prev_regs["C"]
-                    )
-                    d_str = fmt_reg(
-                        "D", curr_regs["D"], curr_regs["D"] != prev_regs["D"]
-                    )
-                    e_str = fmt_reg(
-                        "E", curr_regs["E"], curr_regs["E"] != prev_regs["E"]
-                    )
-                    h_str = fmt_reg(
-                        "H", curr_regs["H"], curr_regs["H"] != prev_regs["H"]
-                    )
-                    l_str = fmt_reg(
-                        "L", curr_regs["L"], curr_regs["L"] != prev_regs["L"]
-                    )
+                if out and (not steps & 0xFF or mem[current_pc] in _IO_OPCODES):
+                    flush_trace()
 
-                    f_changed = curr_regs["F"] != prev_regs["F"]
-                    if f_changed:
-                        flags_str = f"  {Colors.HIGHLIGHT}Flags: S={flags['S']} Z={flags['Z']} AC={flags['AC']} P={flags['P']} CY={flags['CY']}{Colors.RESET}"
-                    else:
-                        flags_str = f"  Flags: S={flags['S']} Z={flags['Z']} AC={flags['AC']} P={flags['P']} CY={flags['CY']}"
+                cpu.runcrntins()
+                steps += 1
+                total_cycles += cycles
 
-                    print(
-                        f"  {a_str} {b_str} {c_str} {d_str} {e_str} {h_str} {l_str}{flags_str}"
+                # Show mathematical explanation if explain mode enabled
+                if args.explain:
+                    cpu_after = _explain_state(cpu)
+                    explanation = explain_instruction(
+                        instr, cpu_before, cpu_after, mem, args.base_num
                     )
-                else:
-                    print(
-                        f"  A={curr_regs['A']:02X} B={curr_regs['B']:02X} C={curr_regs['C']:02X} "
-                        f"D={curr_regs['D']:02X} E={curr_regs['E']:02X} H={curr_regs['H']:02X} L={curr_regs['L']:02X}  "
-                        f"Flags: S={flags['S']} Z={flags['Z']} AC={flags['AC']} P={flags['P']} CY={flags['CY']}"
-                    )
-
-            # Show what changed and why (if highlighting enabled)
-            if args.highlight_changes:
-                changes = []
-
-                # Helper to get register value
-                def get_reg_val(reg_name):
-                    reg_map = {
-                        "A": "A",
-                        "B": "B",
-                        "C": "C",
-                        "D": "D",
-                        "E": "E",
-                        "H": "H",
-                        "L": "L",
-                    }
-                    if reg_name in reg_map:
-                        return pre_exec_regs[reg_map[reg_name]]
-                    return 0
-
-                # Check which registers changed and build explanation
-                if curr_regs["A"] != prev_regs["A"]:
-                    if "MVI A" in pre_exec_instr:
-                        changes.append(f"A = immediate {curr_regs['A']:02X}H")
-                    elif "MOV A," in pre_exec_instr:
-                        src = pre_exec_instr.split(",")[1].strip()
-                        changes.append(f"A = {src}({curr_regs['A']:02X}H)")
-                    elif "ADD" in pre_exec_instr or "ADC" in pre_exec_instr:
-                        op = (
-                            pre_exec_instr.split()[1]
-                            if len(pre_exec_instr.split()) > 1
-                            else "M"
-                        )
-                        op_val = get_reg_val(op)
-                        changes.append(
-                            f"A = {prev_regs['A']:02X}H + {op}({op_val:02X}H) = {curr_regs['A']:02X}H"
-                        )
-                    elif "SUB" in pre_exec_instr or "SBB" in pre_exec_instr:
-                        op = (
-                            pre_exec_instr.split()[1]
-                            if len(pre_exec_instr.split()) > 1
-                            else "M"
-                        )
-                        op_val = get_reg_val(op)
-                        changes.append(
-                            f"A = {prev_regs['A']:02X}H - {op}({op_val:02X}H) = {curr_regs['A']:02X}H"
-                        )
-                    elif "ANA" in pre_exec_instr:
-                        op = pre_exec_instr.split()[1]
-                        op_val = get_reg_val(op)
-                        changes.append(
-                            f"A = {prev_regs['A']:02X}H AND {op}({op_val:02X}H) = {curr_regs['A']:02X}H"
-                        )
-                    elif "ORA" in pre_exec_instr:
-                        op = pre_exec_instr.split()[1]
-                        op_val = get_reg_val(op)
-                        changes.append(
-                            f"A = {prev_regs['A']:02X}H OR {op}({op_val:02X}H) = {curr_regs['A']:02X}H"
-                        )
-                    elif "XRA" in pre_exec_instr:
-                        op = pre_exec_instr.split()[1]
-                        op_val = get_reg_val(op)
-                        changes.append(
-                            f"A = {prev_regs['A']:02X}H XOR {op}({op_val:02X}H) = {curr_regs['A']:02X}H"
-                        )
-                    elif "INR A" in pre_exec_instr:
-                        changes.append(
-                            f"A = {prev_regs['A']:02X}H + 1 = {curr_regs['A']:02X}H"
-                        )
-                    elif "DCR A" in pre_exec_instr:
-                        changes.append(
-                            f"A = {prev_regs['A']:02X}H - 1 = {curr_regs['A']:02X}H"
-                        )
-                    elif "CMA" in pre_exec_instr:
-                        changes.append(
-                            f"A = NOT {prev_regs['A']:02X}H = {curr_regs['A']:02X}H"
-                        )
-                    elif (
-                        "RLC" in pre_exec_instr
-                        or "RRC" in pre_exec_instr
-                        or "RAL" in pre_exec_instr
-                        or "RAR" in pre_exec_instr
-                    ):
-                        changes.append(
-                            f"A = rotated {prev_regs['A']:02X}H = {curr_regs['A']:02X}H"
+                    if explanation:
+                        emit(explain_fmt.format(steps, current_pc, instr, explanation))
+
+                # Show table row if table mode enabled
+                if args.table:
+                    # Get current register values
+                    curr_regs = bytes(regs)
+
+                    # Format flags
+                    flags_str = FLAG_STRINGS[curr_regs[_F]]
+
+                    # Format registers with optional highlighting
+                    if args.highlight_changes:
+                        a_str = fmt_reg(curr_regs[_A], prev_regs[_A])
+                        b_str = fmt_reg(curr_regs[_B], prev_regs[_B])
+                        c_str = fmt_reg(curr_regs[_C], prev_regs[_C])
+                        d_str = fmt_reg(curr_regs[_D], prev_regs[_D])
+                        e_str = fmt_reg(curr_regs[_E], prev_regs[_E])
+                        h_str = fmt_reg(curr_regs[_H], prev_regs[_H])
+                        l_str = fmt_reg(curr_regs[_L], prev_regs[_L])
+
+                        # Highlight flags if changed
+                        flags_display = flags_str
+                        if curr_regs[_F] != prev_regs[_F]:
+                            flags_display = f"{highlight}{flags_str}{reset}"
+
+                        # Manual padding for flags to avoid color code alignment issues
+                        flags_padded = flags_display + " " * (10 - len(flags_str))
+
+                        emit(
+                            row_fmt.format(
+                                steps,
+                                current_pc,
+                                instr,
+                                a_str,
+                                b_str,
+                                c_str,
+                                d_str,
+                                e_str,
+                                h_str,
+                                l_str,
+                                cpu.SP.value,
+                                flags_padded,
+                                cycles,
+                            )
                         )
                     else:
-                        changes.append(f"A = {curr_regs['A']:02X}H")
-
-                # Check other registers
-                for reg_name in ["B", "C", "D", "E", "H", "L"]:
-                    if curr_regs[reg_name] != prev_regs[reg_name]:
-                        if f"MVI {reg_name}" in pre_exec_instr:
-                            changes.append(
-                                f"{reg_name} = immediate {curr_regs[reg_name]:02X}H"
+                        emit(
+                            row_fmt.format(
+                                steps,
+                                current_pc,
+                                instr,
+                                _HEX2[curr_regs[_A]],
+                                _HEX2[curr_regs[_B]],
+                                _HEX2[curr_regs[_C]],
+                                _HEX2[curr_regs[_D]],
+                                _HEX2[curr_regs[_E]],
+                                _HEX2[curr_regs[_H]],
+                                _HEX2[curr_regs[_L]],
+                                cpu.SP.value,
+                                f"{flags_str:<10}",
+                                cycles,
                             )
-                        elif f"MOV {reg_name}," in pre_exec_instr:
-                            src = pre_exec_instr.split(",")[1].strip()
-                            changes.append(
-                                f"{reg_name} = {src}({curr_regs[reg_name]:02X}H)"
-                            )
-                        elif f"INR {reg_name}" in pre_exec_instr:
-                            changes.append(
-                                f"{reg_name} = {prev_regs[reg_name]:02X}H + 1 = {curr_regs[reg_name]:02X}H"
-                            )
-                        elif f"DCR {reg_name}" in pre_exec_instr:
-                            changes.append(
-                                f"{reg_name} = {prev_regs[reg_name]:02X}H - 1 = {curr_regs[reg_name]:02X}H"
-                            )
-                        else:
-                            changes.append(f"{reg_name} = {curr_regs[reg_name]:02X}H")
-
-                # Check flags
-                if curr_regs["F"] != prev_regs["F"]:
-                    old_flags = decode_flags(prev_regs["F"])
-                    new_flags = decode_flags(curr_regs["F"])
-                    flag_changes = []
-                    for flag in ["S", "Z", "AC", "P", "CY"]:
-                        if old_flags[flag] != new_flags[flag]:
-                            flag_changes.append(
-                                f"{flag}:{old_flags[flag]}→{new_flags[flag]}"
-                            )
-                    if flag_changes:
-                        changes.append(f"Flags: {', '.join(flag_changes)}")
+                        )
 
-                if changes:
-                    print(f"{Colors.DIM}     {', '.join(changes)}{Colors.RESET}")
+                    # Update previous registers for next iteration
+                    prev_regs = curr_regs
 
-            # Update previous registers for next iteration
-            prev_regs = curr_regs.copy()
-            print()
+                # Show registers after execution if trace mode enabled
+                if args.step:
+                    # Get current register values
+                    curr_regs = bytes(regs)
+
+                    line = format_step(curr_regs, prev_regs)
+
+                    # Show what changed and why (if highlighting enabled). Steps
+                    # that leave every register untouched have nothing to explain
+                    changes = []
+                    if args.highlight_changes and curr_regs != prev_regs:
+                        op, dest, src, src_slot, mov_src, a_fmt = _parse_traced_instr(
+                            pre_exec_instr
+                        )
+
+                        # Check which registers changed and build explanation
+                        if curr_regs[_A] != prev_regs[_A]:
+                            if a_fmt is None:
+                                changes.append(f"A = {curr_regs[_A]:02X}H")
+                            else:
+                                changes.append(
+                                    a_fmt.format(
+                                        old=prev_regs[_A],
+                                        new=curr_regs[_A],
+                                        src=src,
+                                        src_val=(
+                                            prev_regs[src_slot] if src_slot is not None else 0
+                                        ),
+                                        mov_src=mov_src,
+                                    )
+                                )
+
+                        # Check other registers; only the destination register
+                        # gets the mnemonic-specific explanation
+                        dest_fmt = _REG_CHANGE_FORMATS.get(op, _REG_CHANGE_DEFAULT)
+                        changes += [
+                            (dest_fmt if reg_name == dest else _REG_CHANGE_DEFAULT).format(
+                                reg=reg_name,
+                                old=prev_regs[slot],
+                                new=curr_regs[slot],
+                                mov_src=mov_src,
+                            )
+                            for reg_name, slot in _TRACE_REG_SLOTS
+                            if curr_regs[slot] != prev_regs[slot]
+                        ]
+
+                        # Check flags
+                        old_f, new_f = prev_regs[_F], curr_regs[_F]
+                        flag_diff = old_f ^ new_f
+                        if flag_diff:
+                            flag_changes = [
+                                f"{flag}:{(old_f >> bit) & 1}→{(new_f >> bit) & 1}"
+                                for flag, bit in _FLAG_BITS
+                                if (flag_diff >> bit) & 1
+                            ]
+                            if flag_changes:
+                                changes.append(f"Flags: {', '.join(flag_changes)}")
+
+                    # Register line, change explanation and the blank separator
+                    # line go out as one chunk
+                    if changes:
+                        emit(changes_fmt.format(line, ", ".join(changes)))
+                    else:
+                        emit(line + "\n\n")
+
+                    # Update previous registers for next iteration
+                    prev_regs = curr_regs
+        finally:
+            if out:
+                flush_trace()
 
     # End real-time measurement
     end_time = time.time()
@@ -1223,8 +1268,7 @@ def run_program_once(args):
                 f"  {Colors.DIM}SP = 0x{cpu.SP.value:04X}  PC = 0x{cpu.PC.value:04X}{Colors.RESET}"
             )
 
-        flags = decode_flags(cpu.F.value)
-        flag_str = f"S={flags['S']} Z={flags['Z']} AC={flags['AC']} P={flags['P']} CY={flags['CY']}"
+        flag_str = _FLAG_FIELDS[cpu.F.value]
         print(f"\n{Colors.BLUE}{Colors.BOLD}Flags:{Colors.RESET} {flag_str}")
 
     # Show stack (only if -S flag is used)
@@ -1242,12 +1286,13 @@ def run_program_once(args):
             )
             print(f"{Colors.DIM}{'─' * 50}{Colors.RESET}")
 
-            for i in range(stack_entries):
+            # The guard above keeps all 16 bytes below 0xFFFF
+            words = struct.unpack_from(f"<{stack_entries}H", cpu.mem, sp_val)
+            for i, word in enumerate(words):
                 addr = sp_val + (i * 2)
                 if addr < 0xFFFF:
-                    lo_byte = cpu.memory[addr].value
-                    hi_byte = cpu.memory[addr + 1].value if addr + 1 < 0xFFFF else 0
-                    word = (hi_byte << 8) | lo_byte
+                    lo_byte = word & 0xFF
+                    hi_byte = word >> 8
 
                     # Highlight SP position
                     if i == 0:
@@ -1257,11 +1302,7 @@ def run_program_once(args):
 
                     # Check if this looks like a return address (within program range)
                     desc = ""
-                    if (
-                        asm.ploadoff
-                        <= word
-                        < (asm.ploadoff + sum(asm.writtenaddresses))
-                    ):
+                    if prog_lo <= word < prog_hi:
                         desc = f"{Colors.GREEN}(possible return addr){Colors.RESET}"
 
                     print(
@@ -1290,7 +1331,7 @@ def run_program_once(args):
                 f"\n{Colors.BLUE}{Colors.BOLD}Memory [{start_addr:04X}H - {end_addr:04X}H]:{Colors.RESET}"
             )
             for addr in range(start_addr, end_addr + 1):
-                value = cpu.memory[addr].value
+                value = cpu.mem[addr]
                 changed = value != initial_memory[addr]
                 if changed:
                     print(
@@ -1303,10 +1344,14 @@ def run_program_once(args):
 
     # Option 2: Show all changes (--show-changes)
     if args.show_changes:
-        changes = []
-        for addr in range(len(cpu.memory)):
-            if cpu.memory[addr].value != initial_memory[addr]:
-                changes.append((addr, initial_memory[addr], cpu.memory[addr].value))
+        final_memory = bytes(cpu.mem)
+        changes = [
+            (addr, initial_memory[addr], final_memory[addr])
+            for run in _NONZERO_RUNS.finditer(
+                _changed_mask(initial_memory, final_memory)
+            )
+            for addr in range(run.start(), run.end())
+        ]
 
         if changes:
             print(f"\n{Colors.BLUE}{Colors.BOLD}Memory Changes:{Colors.RESET}")
@@ -1325,7 +1370,7 @@ def run_program_once(args):
             ]
             print(f"\n{Colors.BLUE}{Colors.BOLD}Watched Memory:{Colors.RESET}")
             for addr in watch_addrs:
-                value = cpu.memory[addr].value
+                value = cpu.mem[addr]
                 changed = value != initial_memory[addr]
                 if changed:
                     print(
@@ -1343,24 +1388,12 @@ def run_program_once(args):
         print(f"\n{Colors.BLUE}{Colors.BOLD}═══ Memory Map ═══{Colors.RESET}")
 
         # Find all non-zero memory regions
-        regions = []
-        in_region = False
-        region_start = 0
-
-        for addr in range(0x10000):
-            has_data = cpu.memory[addr].value != 0
-            if has_data and not in_region:
-                region_start = addr
-                in_region = True
-            elif not has_data and in_region:
-                regions.append((region_start, addr - 1))
-                in_region = False
-        if in_region:
-            regions.append((region_start, 0xFFFF))
+        final_memory = bytes(cpu.mem)
+        regions, total_used, total_changed = _scan_memory(initial_memory, final_memory)
 
         # Calculate program region
-        prog_start = asm.ploadoff
-        prog_end = asm.ploadoff + sum(asm.writtenaddresses) - 1
+        prog_start = prog_lo
+        prog_end = prog_hi - 1
 
         # Stack region (assume stack grows down from initial SP)
         stack_top = cpu.SP.value
@@ -1405,13 +1438,6 @@ def run_program_once(args):
             print(f"  {Colors.DIM}No non-zero memory regions{Colors.RESET}")
 
         # Show memory usage statistics
-        total_used = sum(1 for addr in range(0x10000) if cpu.memory[addr].value != 0)
-        total_changed = sum(
-            1
-            for addr in range(0x10000)
-            if cpu.memory[addr].value != initial_memory[addr]
-        )
-
         print(f"\n{Colors.CYAN}Memory Statistics:{Colors.RESET}")
         print(f"  Total:    {0x10000} bytes (64 KB)")
         print(f"  Used:     {total_used} bytes ({total_used / 0x10000 * 100:.2f}%)")
@@ -1432,41 +1458,30 @@ def run_program_once(args):
                     f"{Colors.DIM}  (showing first 256 bytes of {end - start + 1}){Colors.RESET}"
                 )
 
-            addr = start
-            bytes_shown = 0
-            while addr <= end and bytes_shown < display_size:
+            shown_end = start + display_size
+            # ASCII column for the whole shown region, sliced per line below
+            ascii_region = (
+                final_memory[start:shown_end].translate(_PRINTABLE_ASCII).decode("ascii")
+            )
+            for line_start in range(start, shown_end, 16):
                 # Show 16 bytes per line
-                line_bytes = []
-                line_ascii = []
-                line_start = addr
-
-                for _ in range(16):
-                    if addr <= end and bytes_shown < display_size:
-                        val = cpu.memory[addr].value
-                        changed = val != initial_memory[addr]
-
-                        if changed:
-                            line_bytes.append(
-                                f"{Colors.HIGHLIGHT}{val:02X}{Colors.RESET}"
-                            )
-                        else:
-                            line_bytes.append(f"{val:02X}")
-
-                        # ASCII representation
-                        if 32 <= val <= 126:
-                            line_ascii.append(chr(val))
-                        else:
-                            line_ascii.append(".")
-
-                        addr += 1
-                        bytes_shown += 1
-                    else:
-                        line_bytes.append("  ")
-                        line_ascii.append(" ")
+                line_end = min(line_start + 16, shown_end)
+                chunk = final_memory[line_start:line_end]
+                initial_chunk = initial_memory[line_start:line_end]
+                line_bytes = chunk.hex(" ").upper().split(" ")
+                if chunk != initial_chunk:
+                    for i, (val, old_val) in enumerate(zip(chunk, initial_chunk)):
+                        if val != old_val:
+                            line_bytes[i] = f"{Colors.HIGHLIGHT}{line_bytes[i]}{Colors.RESET}"
+
+                # ASCII representation
+                padding = 16 - len(chunk)
+                line_bytes += ["  "] * padding
+                offset = line_start - start
+                ascii_part = ascii_region[offset : offset + 16] + " " * padding
 
                 # Print line
                 hex_part = " ".join(line_bytes[:8]) + "  " + " ".join(line_bytes[8:])
-                ascii_part = "".join(line_ascii)
                 print(
                     f"  {Colors.CYAN}{line_start:04X}{Colors.RESET}: {hex_part}  {Colors.DIM}|{ascii_part}|{Colors.RESET}"
                 )
@@ -1,27 +1,29 @@
 """CLI commands for 8085 assembler and emulator."""
 
-from .benchmark.benchmark import run_benchmark_mode
-from .coverage.coverage import run_coverage_mode
-from .debug.debugger import run_debug_mode
-from .diff.diffing import run_diff_mode
-from .disassemble.disasm import (
-    disassemble_instruction,
-    get_instruction_cycles,
-    get_instruction_description,
-)
-from .export.hex_export import export_hex
-from .learning.cheat_sheet import export_cheat_sheet
-from .learning.explain import explain_instruction, explain_instruction_detailed
-from .learning.repl import InteractiveREPL
-from .memory.memory_map import visualize_memory_map
-from .profile.profiler import run_profiler_mode
-from .symbols.symbols import explore_symbols, list_symbols_summary
-from .templates.templates import (
-    create_from_template,
-    interactive_template_selector,
-    list_templates,
-)
-from .warnings.analysis import analyze_warnings
+# Each command drags in its own module tree; resolve names on first access
+# (PEP 562) so a plain `asm file.asm` only loads what it uses.
+_LAZY_EXPORTS = {
+    "run_benchmark_mode": ".benchmark.benchmark",
+    "run_coverage_mode": ".coverage.coverage",
+    "run_debug_mode": ".debug.debugger",
+    "run_diff_mode": ".diff.diffing",
+    "disassemble_instruction": ".disassemble.disasm",
+    "get_instruction_cycles": ".disassemble.disasm",
+    "get_instruction_description": ".disassemble.disasm",
+    "export_hex": ".export.hex_export",
+    "export_cheat_sheet": ".learning.cheat_sheet",
+    "explain_instruction": ".learning.explain",
+    "explain_instruction_detailed": ".learning.explain",
+    "InteractiveREPL": ".learning.repl",
+    "visualize_memory_map": ".memory.memory_map",
+    "run_profiler_mode": ".profile.profiler",
+    "explore_symbols": ".symbols.symbols",
+    "list_symbols_summary": ".symbols.symbols",
+    "create_from_template": ".templates.templates",
+    "interactive_template_selector": ".templates.templates",
+    "list_templates": ".templates.templates",
+    "analyze_warnings": ".warnings.analysis",
+}
 
 __all__ = [
     "run_benchmark_mode",
@@ -45,3 +47,18 @@ __all__ = [
     "list_templates",
     "analyze_warnings",
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return list(__all__)
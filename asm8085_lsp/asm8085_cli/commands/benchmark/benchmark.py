@@ -1,15 +1,62 @@
 """Benchmark mode for comparing program performance."""
 
+import io
+import os
 import sys
 import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
 
 from ...shared.assembly import assemble_or_exit, load_source_file
 from ...shared.colors import Colors
-from ...shared.executor import ProgramExecutor, resolve_step_limit
+from ...shared.executor import ProgramExecutor, gc_paused, resolve_step_limit
 from ...shared.progress import format_duration
 
 
+def _timed_run(executor, limit):
+    """Run an already loaded program to completion.
+
+    Returns:
+        Tuple of (steps, cycles, wall_ns, halted); wall_ns is integer
+        nanoseconds from the monotonic perf counter.
+    """
+    steps = 0
+    total_cycles = 0
+    cpu = executor.cpu
+    step = executor.step_cycles
+
+    with gc_paused():
+        start_ns = time.perf_counter_ns()
+        while not cpu.haulted and (steps < limit):
+            total_cycles += step()
+            steps += 1
+        wall_ns = time.perf_counter_ns() - start_ns
+
+    return steps, total_cycles, wall_ns, cpu.haulted
+
+
+def _new_results(filename, runs):
+    # Counters are signed 64-bit typed arrays rather than lists of ints
+    return {
+        "filename": filename,
+        "runs": runs,
+        "steps": array("q"),
+        "cycles": array("q"),
+        "wall_ns": array("q"),
+        "success": [],
+    }
+
+
+def _add_run(results, run):
+    steps, cycles, wall_ns, halted = run
+    results["steps"].append(steps)
+    results["cycles"].append(cycles)
+    results["wall_ns"].append(wall_ns)
+    results["success"].append(halted)
+
+
 def benchmark_program(filename, args, runs=1):
     """Benchmark a single program.
 
@@ -21,37 +68,104 @@ def benchmark_program(filename, args, runs=1):
     Returns:
         Dictionary with benchmark results
     """
-    results = {
-        "filename": filename,
-        "runs": runs,
-        "steps": [],
-        "cycles": [],
-        "wall_times": [],
-        "success": [],
-    }
-
+    results = _new_results(filename, runs)
+    # Assemble and load once; later runs just rewind the executor
+    executor = ProgramExecutor(filename, args)
+    limit, _ = resolve_step_limit(args)
     for run in range(runs):
-        executor = ProgramExecutor(filename, args)
-        limit, has_limit = resolve_step_limit(args)
+        if run:
+            executor.reset()
+        _add_run(results, _timed_run(executor, limit))
+    return results
 
-        steps = 0
-        total_cycles = 0
-        start_time = time.time()
 
-        while not executor.cpu.haulted and (steps < limit):
-            result = executor.step_instruction()
-            total_cycles += result.get("cycles", 0)
-            steps += 1
+def _benchmark_job(filename, args, runs):
+    """benchmark_program() as run in a pool worker.
 
-        end_time = time.time()
-        wall_time = end_time - start_time
+    Anything the job prints (e.g. assembler diagnostics) is captured so the
+    parent can show it under the file's heading rather than interleaved
+    with other files. A failed assembly ends in SystemExit, which must not
+    turn into an ordinary per-file error on the way back from the worker;
+    its exit code is returned instead so the parent can stop the same way
+    the in-process path does. Returns (results, output, exit_code),
+    exit_code None on success.
+    """
+    output = io.StringIO()
+    with redirect_stdout(output), redirect_stderr(output):
+        try:
+            results, exit_code = benchmark_program(filename, args, runs), None
+        except SystemExit as exc:
+            results, exit_code = None, exc.code
+    return results, output.getvalue(), exit_code
 
-        results["steps"].append(steps)
-        results["cycles"].append(total_cycles)
-        results["wall_times"].append(wall_time)
-        results["success"].append(executor.cpu.haulted)
 
-    return results
+def _print_heading(filename):
+    print(f"{Colors.CYAN}Benchmarking:{Colors.RESET} {filename}")
+
+
+def _iter_benchmarks(files, args, runs):
+    """Benchmark files, yielding results as they finish.
+
+    The emulator is CPU-bound pure Python, so with two or more files and
+    cores each file's benchmark_program() runs in its own process and
+    results stream back in completion order. Otherwise files run here, in
+    order. Each file's "Benchmarking:" heading is printed here, ahead of
+    any output its run produced; a missing file is reported in input order,
+    once every file before it has been. Yields (index, filename, results,
+    error); exactly one of results and error is None.
+    """
+    present = [Path(filename).exists() for filename in files]
+    reported = [not found for found in present]
+    next_index = 0
+
+    def report_missing():
+        nonlocal next_index
+        while next_index < len(files) and reported[next_index]:
+            if not present[next_index]:
+                print(f"{Colors.RED}✗ File not found:{Colors.RESET} {files[next_index]}")
+            next_index += 1
+
+    indexed_files = [(i, f) for i, f in enumerate(files) if present[i]]
+    workers = min(len(indexed_files), os.cpu_count() or 1)
+    pool = None
+    if workers >= 2:
+        try:
+            pool = ProcessPoolExecutor(max_workers=workers)
+        except (OSError, NotImplementedError):
+            pool = None
+
+    report_missing()
+    if pool is None:
+        for index, filename in indexed_files:
+            _print_heading(filename)
+            try:
+                outcome = (benchmark_program(filename, args, runs), None)
+            except Exception as e:
+                outcome = (None, e)
+            yield (index, filename) + outcome
+            reported[index] = True
+            report_missing()
+        return
+
+    with pool:
+        futures = {
+            pool.submit(_benchmark_job, filename, args, runs): (index, filename)
+            for index, filename in indexed_files
+        }
+        for future in as_completed(futures):
+            index, filename = futures[future]
+            _print_heading(filename)
+            error = future.exception()
+            results = None
+            if error is None:
+                results, output, exit_code = future.result()
+                sys.stdout.write(output)
+                if results is None:
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    raise SystemExit(exit_code)
+            yield index, filename, results, error
+            reported[index] = True
+            report_missing()
 
 
 def compare_programs(files, args, runs=3):
@@ -65,27 +179,23 @@ def compare_programs(files, args, runs=3):
     print(f"\n{Colors.BLUE}{Colors.BOLD}Benchmark Mode{Colors.RESET}")
     print(f"{Colors.DIM}Running each program {runs} times...{Colors.RESET}\n")
 
-    all_results = []
-
-    for filename in files:
-        if not Path(filename).exists():
-            print(f"{Colors.RED}✗ File not found:{Colors.RESET} {filename}")
+    finished = []
+    for index, filename, results, error in _iter_benchmarks(files, args, runs):
+        if error is not None:
+            print(f"  {Colors.RED}✗ Error:{Colors.RESET} {error}")
             continue
+        finished.append((index, results))
 
-        print(f"{Colors.CYAN}Benchmarking:{Colors.RESET} {filename}")
+        # Show quick stats
+        avg_cycles = sum(results["cycles"]) / len(results["cycles"])
+        avg_time = sum(results["wall_ns"]) * 1e-9 / len(results["wall_ns"])
+        print(
+            f"  {Colors.GREEN}✓{Colors.RESET} Avg: {int(avg_cycles)} cycles, {format_duration(avg_time)}"
+        )
 
-        try:
-            results = benchmark_program(filename, args, runs)
-            all_results.append(results)
-
-            # Show quick stats
-            avg_cycles = sum(results["cycles"]) / len(results["cycles"])
-            avg_time = sum(results["wall_times"]) / len(results["wall_times"])
-            print(
-                f"  {Colors.GREEN}✓{Colors.RESET} Avg: {int(avg_cycles)} cycles, {format_duration(avg_time)}"
-            )
-        except Exception as e:
-            print(f"  {Colors.RED}✗ Error:{Colors.RESET} {e}")
+    # Compare in command-line order, whatever order the runs finished in
+    finished.sort(key=lambda item: item[0])
+    all_results = [results for _, results in finished]
 
     if len(all_results) < 2:
         print(f"\n{Colors.YELLOW}Need at least 2 programs to compare{Colors.RESET}")
@@ -94,28 +204,24 @@ def compare_programs(files, args, runs=3):
     print(f"\n{Colors.BLUE}{Colors.BOLD}Comparison Results{Colors.RESET}")
     print(f"{Colors.DIM}{'─' * 80}{Colors.RESET}\n")
 
+    # Per-program averages, computed once and indexed below
+    avg_cycles = [sum(r["cycles"]) / len(r["cycles"]) for r in all_results]
+    avg_times = [sum(r["wall_ns"]) * 1e-9 / len(r["wall_ns"]) for r in all_results]
+
     # Find best/worst
-    best_cycles_idx = min(
-        range(len(all_results)), key=lambda i: sum(all_results[i]["cycles"])
-    )
-    best_time_idx = min(
-        range(len(all_results)), key=lambda i: sum(all_results[i]["wall_times"])
-    )
+    best_cycles_idx = min(range(len(avg_cycles)), key=avg_cycles.__getitem__)
 
     print(
         f"{Colors.BOLD}{'Program':<30} {'Cycles':>12} {'Time':>12} {'Speedup':>10}{Colors.RESET}"
     )
     print(f"{Colors.DIM}{'─' * 80}{Colors.RESET}")
 
-    baseline_cycles = sum(all_results[0]["cycles"]) / len(all_results[0]["cycles"])
+    baseline_cycles = avg_cycles[0]
 
     for idx, results in enumerate(all_results):
-        avg_cycles = sum(results["cycles"]) / len(results["cycles"])
-        avg_time = sum(results["wall_times"]) / len(results["wall_times"])
-
         # Calculate speedup relative to first program
         if baseline_cycles > 0:
-            speedup = baseline_cycles / avg_cycles
+            speedup = baseline_cycles / avg_cycles[idx]
         else:
             speedup = 1.0
 
@@ -129,17 +235,15 @@ def compare_programs(files, args, runs=3):
         speedup_str = f"{speedup:>6.2f}x" if speedup != 1.0 else "baseline"
 
         print(
-            f"{prefix} {filename_short:<28} {int(avg_cycles):>12} {format_duration(avg_time):>12} {speedup_str:>10}"
+            f"{prefix} {filename_short:<28} {int(avg_cycles[idx]):>12} {format_duration(avg_times[idx]):>12} {speedup_str:>10}"
         )
 
     print(f"{Colors.DIM}{'─' * 80}{Colors.RESET}")
 
     # Summary
     best_name = Path(all_results[best_cycles_idx]["filename"]).name
-    best_cycles = sum(all_results[best_cycles_idx]["cycles"]) / len(
-        all_results[best_cycles_idx]["cycles"]
-    )
-    worst_cycles = max(sum(r["cycles"]) / len(r["cycles"]) for r in all_results)
+    best_cycles = avg_cycles[best_cycles_idx]
+    worst_cycles = max(avg_cycles)
 
     if worst_cycles > 0 and best_cycles > 0:
         improvement = ((worst_cycles - best_cycles) / worst_cycles) * 100
@@ -175,9 +279,9 @@ def run_benchmark_mode(files, args, runs=3):
         min_cycles = min(results["cycles"])
         max_cycles = max(results["cycles"])
 
-        avg_time = sum(results["wall_times"]) / len(results["wall_times"])
-        min_time = min(results["wall_times"])
-        max_time = max(results["wall_times"])
+        avg_time = sum(results["wall_ns"]) * 1e-9 / len(results["wall_ns"])
+        min_time = min(results["wall_ns"]) * 1e-9
+        max_time = max(results["wall_ns"]) * 1e-9
 
         print(f"{Colors.BOLD}Cycles (T-states):{Colors.RESET}")
         print(f"  Average: {Colors.CYAN}{int(avg_cycles)}{Colors.RESET}")
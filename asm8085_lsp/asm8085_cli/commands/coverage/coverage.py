@@ -3,103 +3,278 @@
 import contextlib
 import os
 import sys
+from array import array
+from itertools import groupby
 
 from ...shared.assembly import assemble_or_exit, load_source_file
 from ...shared.colors import Colors
-from ...shared.executor import ProgramExecutor, resolve_step_limit
+from ...shared.executor import ProgramExecutor, gc_paused, resolve_step_limit
 from ...shared.progress import spinner
 from ...shared.syntax import CONDITIONAL_BRANCHES, strip_label_prefix
 
 
+# Per-line branch outcome bits
+_TAKEN = 1
+_NOT_TAKEN = 2
+_BOTH_OUTCOMES = _TAKEN | _NOT_TAKEN
+
+# Single-pass escaping for source text in the HTML report
+_HTML_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
+
+_CONDITIONAL_MNEMONICS = frozenset(CONDITIONAL_BRANCHES)
+
+
 def is_conditional_line(line_text):
-    stripped = strip_label_prefix(line_text).strip().upper()
+    stripped = strip_label_prefix(line_text).lstrip()
     if not stripped:
         return False
-    mnemonic = stripped.split()[0]
-    return mnemonic in CONDITIONAL_BRANCHES
+    # Split off just the mnemonic and upper-case only that
+    mnemonic = stripped.split(None, 1)[0].upper()
+    return mnemonic in _CONDITIONAL_MNEMONICS
 
 
 def build_line_coverage_maps(asm_obj, clean_lines):
-    addr_to_line = {}
+    # Flat PC -> line table over the 64K address space; 0 means "no line"
+    addr_to_line = array("i", [0]) * 0x10000
     executable_lines = set()
     conditional_lines = set()
-    for idx, line in enumerate(clean_lines):
-        line_num = idx + 1
-        size = asm_obj.plsize[idx] if idx < len(asm_obj.plsize) else 0
+    # zip() stops at the shortest sequence, which covers lines past the end
+    # of the assembler's size/offset tables
+    for line_num, line, size, start_addr in zip(
+        range(1, len(clean_lines) + 1), clean_lines, asm_obj.plsize, asm_obj.poffset
+    ):
         if size <= 0:
             continue
-        if idx >= len(asm_obj.poffset):
-            continue
-        start_addr = asm_obj.poffset[idx]
         executable_lines.add(line_num)
-        for disp in range(size):
-            addr_to_line[start_addr + disp] = line_num
+        end_addr = min(start_addr + size, 0x10000)
+        addr_to_line[start_addr:end_addr] = array("i", [line_num]) * (
+            end_addr - start_addr
+        )
         if is_conditional_line(line):
             conditional_lines.add(line_num)
     return addr_to_line, executable_lines, conditional_lines
 
 
 def group_line_ranges(lines):
-    if not lines:
-        return []
-    lines = sorted(lines)
+    """Collapse ascending line numbers into (start, end) runs.
+
+    The input must already be sorted (stats() produces it that way).
+    Consecutive numbers share the same line - index key.
+    """
     ranges = []
-    start = prev = lines[0]
-    for line in lines[1:]:
-        if line == prev + 1:
-            prev = line
-            continue
-        ranges.append((start, prev))
-        start = prev = line
-    ranges.append((start, prev))
+    for _, run in groupby(enumerate(lines), key=lambda item: item[1] - item[0]):
+        start = end = next(run)[1]
+        for _, end in run:
+            pass
+        ranges.append((start, end))
     return ranges
 
 
+# Static parts of the HTML coverage report; only the title and the stats
+# block are filled in per export
+_HTML_HEAD = """<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>8085 Coverage Report - {title}</title>
+"""
+
+_HTML_STYLE = """    <style>
+        body {
+            font-family: 'Monaco', 'Menlo', 'Consolas', monospace;
+            background: #1e1e1e;
+            color: #d4d4d4;
+            padding: 20px;
+            margin: 0;
+        }
+        .header {
+            background: #252526;
+            padding: 20px;
+            border-radius: 8px;
+            margin-bottom: 20px;
+        }
+        h1 {
+            margin: 0 0 10px 0;
+            color: #4fc3f7;
+        }
+        .stats {
+            font-size: 14px;
+            color: #a0a0a0;
+        }
+        .stats-bar {
+            background: #333;
+            height: 30px;
+            border-radius: 4px;
+            overflow: hidden;
+            margin: 10px 0;
+        }
+        .stats-fill {
+            background: linear-gradient(90deg, #4caf50, #8bc34a);
+            height: 100%;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            color: white;
+            font-weight: bold;
+        }
+        pre {
+            background: #252526;
+            padding: 20px;
+            border-radius: 8px;
+            overflow-x: auto;
+            margin: 0;
+            line-height: 1.5;
+        }
+        .line {
+            display: block;
+            padding: 2px 8px;
+            border-left: 3px solid transparent;
+        }
+        .line-num {
+            display: inline-block;
+            width: 50px;
+            color: #858585;
+            text-align: right;
+            margin-right: 15px;
+            user-select: none;
+        }
+        .covered {
+            background: rgba(76, 175, 80, 0.15);
+            border-left-color: #4caf50;
+        }
+        .uncovered {
+            background: rgba(244, 67, 54, 0.15);
+            border-left-color: #f44336;
+        }
+        .non-executable {
+            color: #666;
+        }
+        .partial {
+            background: rgba(255, 193, 7, 0.15);
+            border-left-color: #ffc107;
+        }
+        .legend {
+            margin: 20px 0;
+            padding: 15px;
+            background: #252526;
+            border-radius: 8px;
+        }
+        .legend-item {
+            display: inline-block;
+            margin-right: 20px;
+            padding: 5px 10px;
+            border-radius: 3px;
+        }
+    </style>
+</head>
+<body>
+    <div class="header">
+        <h1>8085 Coverage Report</h1>
+        <div class="stats">
+"""
+
+_HTML_LEGEND = """        </div>
+    </div>
+
+    <div class="legend">
+        <span class="legend-item covered">✓ Covered</span>
+        <span class="legend-item uncovered">✗ Not Covered</span>
+        <span class="legend-item partial">~ Partially Covered (Branch)</span>
+        <span class="legend-item non-executable">◦ Non-Executable</span>
+    </div>
+
+    <pre><code>"""
+
+_HTML_FOOTER = """</code></pre>
+</body>
+</html>"""
+
+
 class CoverageTracker:
     def __init__(
-        self, addr_to_line, executable_lines, conditional_lines, line_text_map
+        self, addr_to_line, executable_lines, conditional_lines, line_text
     ):
         self.addr_to_line = addr_to_line
         self.executable_lines = set(executable_lines)
         self.conditional_lines = set(conditional_lines)
-        self.line_text_map = line_text_map
-        self.lines_hit = set()
-        self.branch_outcomes = {
-            line: {"taken": False, "not_taken": False}
-            for line in self.conditional_lines
-        }
+        # Source text indexed by line number; entry 0 is an unused ""
+        self.line_text = line_text
+        # Byte per line: lines_hit and is_branch are 0/1 maps, branch_flags
+        # accumulates the _TAKEN/_NOT_TAKEN bits seen for each branch line
+        size = max(self.executable_lines | self.conditional_lines, default=0) + 1
+        self.lines_hit = bytearray(size)
+        self.is_branch = bytearray(size)
+        for line in self.conditional_lines:
+            self.is_branch[line] = 1
+        self.branch_flags = bytearray(size)
 
     def record(self, step_result):
-        line = self.addr_to_line.get(step_result["pc"])
+        line = self.addr_to_line[step_result.pc]
         if line:
-            self.lines_hit.add(line)
-            if line in self.branch_outcomes:
-                if step_result["branch_taken"]:
-                    self.branch_outcomes[line]["taken"] = True
-                else:
-                    self.branch_outcomes[line]["not_taken"] = True
+            self.lines_hit[line] = 1
+            if self.is_branch[line]:
+                self.branch_flags[line] |= (
+                    _TAKEN if step_result.branch_taken else _NOT_TAKEN
+                )
+
+    def run(self, executor, limit):
+        """Run the program under coverage until it halts or hits the limit.
+
+        Same bookkeeping as calling record() on every step_instruction()
+        result, fused into one loop: only conditional-branch lines need the
+        full step result, every other instruction uses the cycles-only step.
+
+        Returns:
+            Number of steps executed
+        """
+        cpu = executor.cpu
+        pc_reg = cpu.PC
+        step_cycles = executor.step_cycles
+        step_instruction = executor.step_instruction
+        addr_to_line = self.addr_to_line
+        is_branch = self.is_branch
+        branch_flags = self.branch_flags
+        lines_hit = self.lines_hit
+
+        steps = 0
+        while not cpu.haulted and steps < limit:
+            line = addr_to_line[pc_reg.value]
+            if line:
+                lines_hit[line] = 1
+                if is_branch[line]:
+                    taken = step_instruction().branch_taken
+                    branch_flags[line] |= _TAKEN if taken else _NOT_TAKEN
+                    steps += 1
+                    continue
+            step_cycles()
+            steps += 1
+        return steps
 
     def stats(self):
         total_lines = len(self.executable_lines)
-        hit_lines = len(self.lines_hit)
+        # Only executable lines are ever marked, so the count is exact
+        hit_lines = self.lines_hit.count(1)
         line_pct = (hit_lines / total_lines * 100) if total_lines else 100
 
-        total_branch_outcomes = len(self.branch_outcomes) * 2
-        covered_outcomes = 0
-        for flags in self.branch_outcomes.values():
-            covered_outcomes += int(flags["taken"])
-            covered_outcomes += int(flags["not_taken"])
+        total_branch_outcomes = len(self.conditional_lines) * 2
+        covered_outcomes = sum(
+            (flags & _TAKEN) + (flags >> 1) for flags in self.branch_flags
+        )
         branch_pct = (
             covered_outcomes / total_branch_outcomes * 100
             if total_branch_outcomes
             else 100
         )
 
-        uncovered_lines = sorted(self.executable_lines - self.lines_hit)
+        lines_hit = self.lines_hit
+        uncovered_lines = [
+            line for line in sorted(self.executable_lines) if not lines_hit[line]
+        ]
         incomplete_branches = [
-            (line, flags)
-            for line, flags in sorted(self.branch_outcomes.items())
-            if not (flags["taken"] and flags["not_taken"])
+            (line, self.branch_flags[line])
+            for line in sorted(self.conditional_lines)
+            if self.branch_flags[line] != _BOTH_OUTCOMES
         ]
 
         return {
@@ -139,7 +314,7 @@ class CoverageTracker:
         else:
             for start, end in group_line_ranges(uncovered):
                 label = f"Line {start}" if start == end else f"Line {start}-{end}"
-                text = self.line_text_map.get(start, "").strip()
+                text = self.line_text[start].strip()
                 preview = f": {text}" if text else ""
                 print(f"  {label}{preview}")
 
@@ -148,11 +323,11 @@ class CoverageTracker:
             print("\nBranches missing outcomes:")
             for line, flags in missing:
                 outcomes = []
-                if not flags["taken"]:
+                if not flags & _TAKEN:
                     outcomes.append("taken")
-                if not flags["not_taken"]:
+                if not flags & _NOT_TAKEN:
                     outcomes.append("not taken")
-                text = self.line_text_map.get(line, "").strip()
+                text = self.line_text[line].strip()
                 preview = f" ({text})" if text else ""
                 print(
                     f"  Line {line}: missing {', '.join(outcomes)} outcome(s){preview}"
@@ -162,104 +337,7 @@ class CoverageTracker:
         """Export coverage report as HTML with syntax highlighting"""
         stats = self.stats()
 
-        html = f"""<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <title>8085 Coverage Report - {source_filename}</title>
-    <style>
-        body {{
-            font-family: 'Monaco', 'Menlo', 'Consolas', monospace;
-            background: #1e1e1e;
-            color: #d4d4d4;
-            padding: 20px;
-            margin: 0;
-        }}
-        .header {{
-            background: #252526;
-            padding: 20px;
-            border-radius: 8px;
-            margin-bottom: 20px;
-        }}
-        h1 {{
-            margin: 0 0 10px 0;
-            color: #4fc3f7;
-        }}
-        .stats {{
-            font-size: 14px;
-            color: #a0a0a0;
-        }}
-        .stats-bar {{
-            background: #333;
-            height: 30px;
-            border-radius: 4px;
-            overflow: hidden;
-            margin: 10px 0;
-        }}
-        .stats-fill {{
-            background: linear-gradient(90deg, #4caf50, #8bc34a);
-            height: 100%;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            color: white;
-            font-weight: bold;
-        }}
-        pre {{
-            background: #252526;
-            padding: 20px;
-            border-radius: 8px;
-            overflow-x: auto;
-            margin: 0;
-            line-height: 1.5;
-        }}
-        .line {{
-            display: block;
-            padding: 2px 8px;
-            border-left: 3px solid transparent;
-        }}
-        .line-num {{
-            display: inline-block;
-            width: 50px;
-            color: #858585;
-            text-align: right;
-            margin-right: 15px;
-            user-select: none;
-        }}
-        .covered {{
-            background: rgba(76, 175, 80, 0.15);
-            border-left-color: #4caf50;
-        }}
-        .uncovered {{
-            background: rgba(244, 67, 54, 0.15);
-            border-left-color: #f44336;
-        }}
-        .non-executable {{
-            color: #666;
-        }}
-        .partial {{
-            background: rgba(255, 193, 7, 0.15);
-            border-left-color: #ffc107;
-        }}
-        .legend {{
-            margin: 20px 0;
-            padding: 15px;
-            background: #252526;
-            border-radius: 8px;
-        }}
-        .legend-item {{
-            display: inline-block;
-            margin-right: 20px;
-            padding: 5px 10px;
-            border-radius: 3px;
-        }}
-    </style>
-</head>
-<body>
-    <div class="header">
-        <h1>8085 Coverage Report</h1>
-        <div class="stats">
-            <strong>File:</strong> {source_filename}<br>
+        stats_block = f"""            <strong>File:</strong> {source_filename}<br>
             <strong>Line Coverage:</strong> {stats["line_hit"]}/{stats["line_total"]} ({stats["line_pct"]:.1f}%)<br>
             <strong>Branch Coverage:</strong> {stats["branch_hit"]}/{stats["branch_total"]} ({stats["branch_pct"]:.1f}%)
         </div>
@@ -267,65 +345,51 @@ class CoverageTracker:
             <div class="stats-fill" style="width: {stats["line_pct"]}%">
                 {stats["line_pct"]:.1f}%
             </div>
-        </div>
-    </div>
-
-    <div class="legend">
-        <span class="legend-item covered">✓ Covered</span>
-        <span class="legend-item uncovered">✗ Not Covered</span>
-        <span class="legend-item partial">~ Partially Covered (Branch)</span>
-        <span class="legend-item non-executable">◦ Non-Executable</span>
-    </div>
+"""
 
-    <pre><code>"""
-
-        # Get all lines from source
-        all_lines = sorted(
-            set(self.line_text_map.keys())
-            | self.executable_lines
-            | set(self.branch_outcomes.keys())
-        )
+        # Every source line, in order (executable lines are a subset)
+        all_lines = range(1, len(self.line_text))
 
-        for line_num in all_lines:
-            text = self.line_text_map.get(line_num, "").rstrip()
-
-            # Determine coverage status
-            if line_num not in self.executable_lines:
-                css_class = "non-executable"
-                marker = "◦"
-            elif line_num in self.lines_hit:
-                # Check if it's a branch with incomplete coverage
-                if line_num in self.branch_outcomes:
-                    flags = self.branch_outcomes[line_num]
-                    if flags["taken"] and flags["not_taken"]:
+        # Stream the rows straight into the file rather than growing one string
+        with open(filename, "w", encoding="utf-8") as f:
+            write = f.write
+            write(_HTML_HEAD.format(title=source_filename))
+            write(_HTML_STYLE)
+            write(stats_block)
+            write(_HTML_LEGEND)
+            for line_num in all_lines:
+                text = self.line_text[line_num].rstrip()
+
+                # Determine coverage status
+                if line_num not in self.executable_lines:
+                    css_class = "non-executable"
+                    marker = "◦"
+                elif self.lines_hit[line_num]:
+                    # Check if it's a branch with incomplete coverage
+                    if line_num in self.conditional_lines:
+                        if self.branch_flags[line_num] == _BOTH_OUTCOMES:
+                            css_class = "covered"
+                            marker = "✓"
+                        else:
+                            css_class = "partial"
+                            marker = "~"
+                    else:
                         css_class = "covered"
                         marker = "✓"
-                    else:
-                        css_class = "partial"
-                        marker = "~"
                 else:
-                    css_class = "covered"
-                    marker = "✓"
-            else:
-                css_class = "uncovered"
-                marker = "✗"
-
-            # HTML escape the text
-            text_escaped = (
-                text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-            )
+                    css_class = "uncovered"
+                    marker = "✗"
 
-            html += f'<span class="line {css_class}">'
-            html += f'<span class="line-num">{marker} {line_num:4d}</span>'
-            html += text_escaped
-            html += "</span>\n"
+                # HTML escape the text
+                text_escaped = text.translate(_HTML_ESCAPE)
 
-        html += """</code></pre>
-</body>
-</html>"""
+                write(
+                    f'<span class="line {css_class}">'
+                    f'<span class="line-num">{marker} {line_num:4d}</span>'
+                    f"{text_escaped}</span>\n"
+                )
 
-        with open(filename, "w", encoding="utf-8") as f:
-            f.write(html)
+            write(_HTML_FOOTER)
 
 
 def run_coverage_mode(args):
@@ -341,14 +405,14 @@ def run_coverage_mode(args):
     addr_map, executable_lines, conditional_lines = build_line_coverage_maps(
         asm_obj, clean_lines
     )
-    line_text_map = dict(original_lines)
+    line_text = [""]
+    line_text.extend(text for _, text in original_lines)
 
     tracker = CoverageTracker(
-        addr_map, executable_lines, conditional_lines, line_text_map
+        addr_map, executable_lines, conditional_lines, line_text
     )
     executor = ProgramExecutor(filename, args)
     limit, has_limit = resolve_step_limit(args)
-    steps = 0
 
     # Show progress for long-running programs
     show_progress = has_limit and limit > 1000
@@ -360,10 +424,8 @@ def run_coverage_mode(args):
         if show_progress
         else contextlib.nullcontext()
     ):
-        while not executor.cpu.haulted and (steps < limit):
-            result = executor.step_instruction()
-            tracker.record(result)
-            steps += 1
+        with gc_paused():
+            steps = tracker.run(executor, limit)
 
     if has_limit and (not executor.cpu.haulted) and steps >= limit:
         print(
@@ -1,18 +1,140 @@
 """Interactive debugger helpers."""
 
 import shlex
+import sys
+from array import array
+from collections import deque
+from functools import lru_cache
 
 from ...shared.colors import Colors
 from ...shared.disasm import disassemble_instruction, get_instruction_cycles
 from ...shared.executor import ProgramExecutor, resolve_step_limit
 from ...shared.parsing import parse_address_value
 from ...shared.registers import (
+    FLAG_LETTERS,
+    Registers,
     decode_flags,
     format_flags,
     format_register_summary,
     snapshot_registers,
 )
 
+# Register order of the packed snapshots kept in the execution history
+_REG_SLOTS = ("A", "B", "C", "D", "E", "H", "L", "SP", "PC", "F")
+_PC_SLOT = _REG_SLOTS.index("PC")
+
+# Block size for the memory comparison that seals an unsealed history slot:
+# whole blocks are compared in C and only blocks that differ are scanned byte
+# by byte
+_DIFF_BLOCK = 256
+
+
+def _memory_diff(before, after, out):
+    """Append (addr, old_byte) to out for every byte that differs."""
+    for base in range(0, len(before), _DIFF_BLOCK):
+        end = base + _DIFF_BLOCK
+        if before[base:end] != after[base:end]:
+            out.extend(
+                (addr, before[addr])
+                for addr in range(base, end)
+                if before[addr] != after[addr]
+            )
+
+
+# CALL and the conditional Cxx calls, stepped over by command_next()
+_CALL_OPCODES = frozenset((0xCD, 0xC4, 0xCC, 0xD4, 0xDC, 0xE4, 0xEC, 0xF4, 0xFC))
+
+# Opcodes whose emu8085 handler writes memory (see _step_writes())
+_HL_WRITES = frozenset((0x34, 0x35, 0x36, 0x70, 0x71, 0x72, 0x73, 0x74, 0x75, 0x77))
+_STACK_WRITES = _CALL_OPCODES | {0xC5, 0xD5, 0xE5, 0xF5}  # calls and PUSH
+
+
+def _step_writes(cpu):
+    """Addresses the instruction at PC may write when emu8085 executes it.
+
+    Mirrors the emulator's handlers: M writes (MOV M,r, MVI M, INR/DCR M),
+    STA, SHLD, STAX and the two bytes pushed by PUSH and the calls (at SP
+    and SP-1, emu8085 stores before decrementing). Conditional calls count
+    as taken; listing a byte that is not written is harmless.
+    """
+    mem = cpu.mem
+    regs = cpu.regs  # A B C D E H L F
+    pc = cpu.PC.value
+    opcode = mem[pc]
+    if opcode in _HL_WRITES:
+        return ((regs[5] << 8) | regs[6],)
+    if opcode in _STACK_WRITES:
+        sp = cpu.SP.value
+        return (sp, (sp - 1) & 0xFFFF)
+    if opcode == 0x32 or opcode == 0x22:  # STA a16, SHLD a16
+        addr = mem[(pc + 1) & 0xFFFF] | mem[(pc + 2) & 0xFFFF] << 8
+        if opcode == 0x32:
+            return (addr,)
+        return (addr, (addr + 1) & 0xFFFF)
+    if opcode == 0x02:  # STAX B
+        return ((regs[1] << 8) | regs[2],)
+    if opcode == 0x12:  # STAX D
+        return ((regs[3] << 8) | regs[4],)
+    return ()
+
+
+# command_dump(): bytes outside printable ASCII show as "."
+_ASCII_TABLE = bytes(c if 32 <= c <= 126 else 46 for c in range(256))
+
+# show_instruction_context() templates; Colors are fixed at import time
+_CONTEXT_REGS = Registers._fields[:7]  # A..L, the leading Registers slots
+_CONTEXT_HEADER = (
+    f"\n{Colors.BLUE}{Colors.BOLD}{'PC':<8} {'Instruction':<20} {'A':<4} {'B':<4} "
+    f"{'C':<4} {'D':<4} {'E':<4} {'H':<4} {'L':<4} {'SP':<6} {'Flags':<10} [T]"
+    f"{Colors.RESET}"
+)
+_CONTEXT_RULE = f"{Colors.DIM}{'─' * 87}{Colors.RESET}"
+_INSTR = "{:<20}"
+_PLAIN2 = "{:02X}H"
+_PLAIN4 = "{:04X}H"
+_PLAIN_FLAGS = "{:<10}"
+# Trace rows are dim: a changed value leaves DIM for the highlight, then
+# re-enters it
+_TRACE_ADDR = f"{Colors.DIM}  {{:04X}}H"
+_TRACE_HI2 = f"{Colors.RESET}{Colors.HIGHLIGHT}{{:02X}}H{Colors.RESET}{Colors.DIM}"
+_TRACE_HI4 = f"{Colors.RESET}{Colors.HIGHLIGHT}{{:04X}}H{Colors.RESET}{Colors.DIM}"
+_TRACE_HI_FLAGS = f"{Colors.RESET}{Colors.HIGHLIGHT}{{:<10}}{Colors.RESET}{Colors.DIM}"
+_TRACE_CYCLES = f"{{}}{Colors.RESET}"
+_CURRENT_ADDR = f"{Colors.CYAN}→ {{:04X}}H{Colors.RESET}"
+_CURRENT_INSTR = f"{Colors.BOLD}{{:<20}}{Colors.RESET}"
+_HI2 = f"{Colors.HIGHLIGHT}{{:02X}}H{Colors.RESET}"
+_HI4 = f"{Colors.HIGHLIGHT}{{:04X}}H{Colors.RESET}"
+_HI_FLAGS = f"{Colors.HIGHLIGHT}{{:<10}}{Colors.RESET}"
+_UPCOMING_ROW = "  ".join(
+    [_TRACE_ADDR, _INSTR] + ["··"] * 7 + ["····", "·····", _TRACE_CYCLES]
+)
+
+
+@lru_cache(maxsize=4096)
+def _decode(b0, b1, b2):
+    """(text, size, cycles) for the instruction encoded by bytes b0 b1 b2."""
+    code = (b0, b1, b2)
+    text, size = disassemble_instruction(code, 0)
+    return text, size, get_instruction_cycles(code, 0)
+
+
+def _decode_at(mem, addr):
+    """Decode the instruction at addr, memoized on its (up to) three bytes.
+
+    The key is the bytes themselves, so writes to program memory never leave
+    a stale entry behind. Operand bytes past FFFFH come through as None and
+    make multi-byte instructions fail there, as reading them always did.
+    """
+    code = mem[addr : addr + 3]
+    if len(code) == 3:
+        return _decode(*code)
+    return _decode(*code, *(None,) * (3 - len(code)))
+
+
+def _write_lines(lines):
+    """Emit a whole block of output lines with a single stdout write."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
 
 class InteractiveDebugger:
     """Full-featured step-by-step debugger for 8085 programs with reverse execution."""
@@ -21,220 +143,223 @@ class InteractiveDebugger:
         self.args = args
         self.executor = ProgramExecutor(filename, args)
         self.breakpoints = set()
+        # Mirror of breakpoints indexed by address, for the run loops
+        self._bp_bitmap = bytearray(0x10000)
         self.watchpoints = {}  # addr -> last value
         self.step_limit, self.has_limit = resolve_step_limit(args)
-        self.execution_history = []  # Stack of execution states for reverse stepping
-        self.execution_trace = []  # Trace of executed instructions for display
         self.max_history = 1000  # Maximum history entries to keep
         self.max_trace = 4  # Keep last 4 executed instructions for display
+        # Bounded trace: appending past maxlen drops the oldest entry
+        self.execution_trace = deque(maxlen=self.max_trace)  # Executed StepResults
+        # --no-reverse (or max_history == 0) turns history off entirely, so
+        # steps skip the per-step snapshot
+        self._record_history = getattr(args, "reverse", True) and self.max_history > 0
+        # Reverse-stepping history: a ring of max_history preallocated slots
+        # (registers, counters, memory diff), reused as the ring wraps
+        slots = self.max_history if self._record_history else 0
+        reg_bytes = bytes(2 * len(_REG_SLOTS))
+        self._hist_regs = [array("H", reg_bytes) for _ in range(slots)]
+        self._hist_cycles = array("q", bytes(8 * slots))
+        self._hist_steps = array("q", bytes(8 * slots))
+        self._hist_diff = [[] for _ in range(slots)]
+        # Full memory image of the newest slot, only while it is unsealed
+        # (see _unseal_memory_diff()); diffed back into its list once the
+        # next state is saved
+        self._hist_before = bytearray(0x10000 if slots else 0)
+        self._hist_unsealed = False
+        self._hist_head = 0  # Next slot to write
+        self._hist_len = 0  # Number of saved states
         self.show_context = True  # Show upcoming instructions
         self.context_lines = 4  # Number of upcoming instructions to show
         self.auto_display = True  # Automatically show state after each command
+        self._commands = self._build_commands()  # name/alias -> handler(args)
+
+    def _seal_memory_diff(self):
+        """Turn the newest slot's memory image back into a diff.
+
+        Memory has moved on since the slot was unsealed, so only the bytes
+        changed in between need to be kept to rewind it.
+        """
+        if self._hist_unsealed:
+            slot = (self._hist_head - 1) % self.max_history
+            mem = self.executor.cpu.mem
+            _memory_diff(self._hist_before, mem, self._hist_diff[slot])
+            self._hist_unsealed = False
+
+    def _unseal_memory_diff(self):
+        """Turn the newest slot's diff back into a full memory image.
+
+        Needed before memory is changed outside of a recorded step (``set
+        [addr]``, ``continue``, a ``next`` over a call): the diff only covers
+        bytes the step itself wrote, so rewinding with it would leave such
+        changes in place.
+        """
+        if self._hist_len and not self._hist_unsealed:
+            slot = (self._hist_head - 1) % self.max_history
+            before = self._hist_before
+            before[:] = self.executor.cpu.mem
+            diff = self._hist_diff[slot]
+            for addr, val in diff:
+                before[addr] = val
+            diff.clear()
+            self._hist_unsealed = True
 
     def save_state_to_history(self):
         """Save current CPU state to execution history for reverse stepping."""
-        state = {
-            "registers": {
-                "A": self.executor.cpu.A.value,
-                "B": self.executor.cpu.B.value,
-                "C": self.executor.cpu.C.value,
-                "D": self.executor.cpu.D.value,
-                "E": self.executor.cpu.E.value,
-                "H": self.executor.cpu.H.value,
-                "L": self.executor.cpu.L.value,
-                "SP": self.executor.cpu.SP.value,
-                "PC": self.executor.cpu.PC.value,
-                "F": self.executor.cpu.F.value,
-            },
-            "memory_snapshot": {},  # Only store changed memory for efficiency
-            "cycles": self.executor.total_cycles,
-            "steps": self.executor.steps_executed,
-        }
-
-        # Save only non-zero or changed memory regions (efficient)
-        for addr in range(0x10000):
-            val = self.executor.cpu.memory[addr].value
-            if val != 0 or val != self.executor.initial_memory[addr]:
-                state["memory_snapshot"][addr] = val
-
-        self.execution_history.append(state)
-
-        # Limit history size
-        if len(self.execution_history) > self.max_history:
-            self.execution_history.pop(0)
+        if not self._record_history:
+            return
+        self._seal_memory_diff()
+        cpu = self.executor.cpu
+        slot = self._hist_head
+
+        regs = self._hist_regs[slot]
+        for index, reg in enumerate(_REG_SLOTS):
+            regs[index] = getattr(cpu, reg).value
+        self._hist_cycles[slot] = self.executor.total_cycles
+        self._hist_steps[slot] = self.executor.steps_executed
+        # Keep the old value of just the bytes the next instruction can
+        # write; anything else that changes memory unseals the slot first
+        diff = self._hist_diff[slot]
+        diff.clear()
+        mem = cpu.mem
+        for addr in _step_writes(cpu):
+            diff.append((addr, mem[addr]))
+
+        # A full ring overwrites its oldest slot
+        self._hist_head = (slot + 1) % self.max_history
+        self._hist_len = min(self._hist_len + 1, self.max_history)
+
+    def clear_history(self):
+        """Forget all saved states (slots are kept for reuse)."""
+        self._hist_head = 0
+        self._hist_len = 0
+        self._hist_unsealed = False
+
+    def _iter_history_slots(self, count):
+        """Yield the ring slots of the last `count` saved states, oldest first."""
+        count = min(self._hist_len, count)
+        slots = self.max_history
+        slot = (self._hist_head - count) % slots
+        for _ in range(count):
+            yield slot
+            slot = slot + 1 if slot + 1 < slots else 0
 
     def restore_state_from_history(self):
         """Restore CPU state from execution history (reverse step)."""
-        if not self.execution_history:
+        if not self._hist_len:
             return False
 
-        state = self.execution_history.pop()
+        slot = (self._hist_head - 1) % self.max_history
 
         # Restore registers
-        self.executor.cpu.A.value = state["registers"]["A"]
-        self.executor.cpu.B.value = state["registers"]["B"]
-        self.executor.cpu.C.value = state["registers"]["C"]
-        self.executor.cpu.D.value = state["registers"]["D"]
-        self.executor.cpu.E.value = state["registers"]["E"]
-        self.executor.cpu.H.value = state["registers"]["H"]
-        self.executor.cpu.L.value = state["registers"]["L"]
-        self.executor.cpu.SP.value = state["registers"]["SP"]
-        self.executor.cpu.PC.value = state["registers"]["PC"]
-        self.executor.cpu.F.value = state["registers"]["F"]
-
-        # Restore memory from snapshot
-        for addr, val in state["memory_snapshot"].items():
-            self.executor.cpu.memory[addr].value = val
+        cpu = self.executor.cpu
+        for reg, value in zip(_REG_SLOTS, self._hist_regs[slot]):
+            getattr(cpu, reg).value = value
+
+        # Restore memory: the newest slot may still hold its full image
+        mem = cpu.mem
+        if self._hist_unsealed:
+            mem[:] = self._hist_before
+            self._hist_unsealed = False
+        else:
+            for addr, val in self._hist_diff[slot]:
+                mem[addr] = val
 
         # Restore counters
-        self.executor.total_cycles = state["cycles"]
-        self.executor.steps_executed = state["steps"]
+        self.executor.total_cycles = self._hist_cycles[slot]
+        self.executor.steps_executed = self._hist_steps[slot]
 
         # Mark CPU as not halted (in case we stepped back from HLT)
-        self.executor.cpu.haulted = False
+        cpu.haulted = False
 
+        self._hist_head = slot
+        self._hist_len -= 1
         return True
 
     def show_instruction_context(self):
         """Show execution history (last 4) and upcoming instructions (next 4) in table format."""
         pc = self.executor.cpu.PC.value
         regs = snapshot_registers(self.executor.cpu)
-        flags = decode_flags(regs["FLAGS"])
 
-        print(
-            f"\n{Colors.BLUE}{Colors.BOLD}{'PC':<8} {'Instruction':<20} {'A':<4} {'B':<4} {'C':<4} {'D':<4} {'E':<4} {'H':<4} {'L':<4} {'SP':<6} {'Flags':<10} [T]{Colors.RESET}"
-        )
-        print(f"{Colors.DIM}{'─' * 87}{Colors.RESET}")
+        out = [_CONTEXT_HEADER, _CONTEXT_RULE]
 
         # Show last 4 executed instructions from trace
-        trace_start = max(0, len(self.execution_trace) - self.max_trace)
         prev_regs = None
 
-        for i in range(trace_start, len(self.execution_trace)):
-            entry = self.execution_trace[i]
-            addr = entry["pc"]
-            instr = entry["instr"]
-            cycles = entry["cycles"]
-            r = entry["regs"]
-            f = decode_flags(r["FLAGS"])
-            flags_str = f"{'S' if f['S'] else '-'}{'Z' if f['Z'] else '-'}{'A' if f['AC'] else '-'}{'P' if f['P'] else '-'}{'C' if f['CY'] else '-'}"
+        for entry in self.execution_trace:
+            r = entry.regs
+            flags_str = FLAG_LETTERS[r.FLAGS]
 
             # Build line with individual register highlighting - use consistent spacing
-            parts = []
-            parts.append(f"{Colors.DIM}  {addr:04X}H")
-            parts.append(f"{instr:<20}")
+            parts = [_TRACE_ADDR.format(entry.pc), _INSTR.format(entry.instr)]
 
             # Compare each register with previous and highlight if changed
-            for reg_name in ["A", "B", "C", "D", "E", "H", "L"]:
-                val = r[reg_name]
-                if prev_regs and prev_regs[reg_name] != val:
-                    parts.append(
-                        f"{Colors.RESET}{Colors.HIGHLIGHT}{val:02X}H{Colors.RESET}{Colors.DIM}"
-                    )
-                else:
-                    parts.append(f"{val:02X}H")
-
-            # SP handling
-            if prev_regs and prev_regs["SP"] != r["SP"]:
-                parts.append(
-                    f"{Colors.RESET}{Colors.HIGHLIGHT}{r['SP']:04X}H{Colors.RESET}{Colors.DIM}"
-                )
-            else:
-                parts.append(f"{r['SP']:04X}H")
-
-            # Flags handling
-            if prev_regs and prev_regs["FLAGS"] != r["FLAGS"]:
-                parts.append(
-                    f"{Colors.RESET}{Colors.HIGHLIGHT}{flags_str:<10}{Colors.RESET}{Colors.DIM}"
-                )
-            else:
-                parts.append(f"{flags_str:<10}")
-
-            parts.append(f"{cycles}{Colors.RESET}")
-            print("  ".join(parts))
-            prev_regs = r.copy()
+            for index in range(len(_CONTEXT_REGS)):
+                val = r[index]
+                changed = prev_regs and prev_regs[index] != val
+                parts.append((_TRACE_HI2 if changed else _PLAIN2).format(val))
+            changed = prev_regs and prev_regs.SP != r.SP
+            parts.append((_TRACE_HI4 if changed else _PLAIN4).format(r.SP))
+            changed = prev_regs and prev_regs.FLAGS != r.FLAGS
+            parts.append((_TRACE_HI_FLAGS if changed else _PLAIN_FLAGS).format(flags_str))
+
+            parts.append(_TRACE_CYCLES.format(entry.cycles))
+            out.append("  ".join(parts))
+            prev_regs = r
 
         # Show current instruction (highlighted row marker, but individual register colors)
         try:
-            curr_instr, size = disassemble_instruction(self.executor.cpu.memory, pc)
-            curr_cycles = get_instruction_cycles(self.executor.cpu.memory, pc)
-            flags_str = f"{'S' if flags['S'] else '-'}{'Z' if flags['Z'] else '-'}{'A' if flags['AC'] else '-'}{'P' if flags['P'] else '-'}{'C' if flags['CY'] else '-'}"
+            curr_instr, size, curr_cycles = _decode_at(self.executor.cpu.mem, pc)
+            flags_str = FLAG_LETTERS[regs.FLAGS]
 
-            parts = []
-            parts.append(f"{Colors.CYAN}→ {pc:04X}H{Colors.RESET}")
-            parts.append(f"{Colors.BOLD}{curr_instr:<20}{Colors.RESET}")
+            parts = [_CURRENT_ADDR.format(pc), _CURRENT_INSTR.format(curr_instr)]
 
             # Compare with last trace entry
-            last_trace = self.execution_trace[-1] if self.execution_trace else None
-
-            for reg_name in ["A", "B", "C", "D", "E", "H", "L"]:
-                val = regs[reg_name]
-                if last_trace and last_trace["regs"][reg_name] != val:
-                    parts.append(f"{Colors.HIGHLIGHT}{val:02X}H{Colors.RESET}")
-                else:
-                    parts.append(f"{val:02X}H")
-
-            # SP
-            if last_trace and last_trace["regs"]["SP"] != regs["SP"]:
-                parts.append(f"{Colors.HIGHLIGHT}{regs['SP']:04X}H{Colors.RESET}")
-            else:
-                parts.append(f"{regs['SP']:04X}H")
-
-            # Flags
-            if last_trace and last_trace["regs"]["FLAGS"] != regs["FLAGS"]:
-                parts.append(f"{Colors.HIGHLIGHT}{flags_str:<10}{Colors.RESET}")
-            else:
-                parts.append(f"{flags_str:<10}")
-
-            parts.append(f"{curr_cycles}")
-            print("  ".join(parts))
+            last = self.execution_trace[-1].regs if self.execution_trace else None
+
+            for index in range(len(_CONTEXT_REGS)):
+                val = regs[index]
+                changed = last and last[index] != val
+                parts.append((_HI2 if changed else _PLAIN2).format(val))
+            changed = last and last.SP != regs.SP
+            parts.append((_HI4 if changed else _PLAIN4).format(regs.SP))
+            changed = last and last.FLAGS != regs.FLAGS
+            parts.append((_HI_FLAGS if changed else _PLAIN_FLAGS).format(flags_str))
+
+            parts.append(str(curr_cycles))
+            out.append("  ".join(parts))
         except:
-            print(f"{Colors.CYAN}→ {pc:04X}H  <invalid>{Colors.RESET}")
+            out.append(f"{Colors.CYAN}→ {pc:04X}H  <invalid>{Colors.RESET}")
 
         # Show next 4 upcoming instructions
         addr = pc
         try:
-            _, size = disassemble_instruction(self.executor.cpu.memory, addr)
+            _, size, _ = _decode_at(self.executor.cpu.mem, addr)
             addr = (addr + size) & 0xFFFF
         except:
             pass
 
         for i in range(self.context_lines):
             try:
-                instr, size = disassemble_instruction(self.executor.cpu.memory, addr)
-                cycles = get_instruction_cycles(self.executor.cpu.memory, addr)
-
-                parts = [
-                    f"{Colors.DIM}  {addr:04X}H",
-                    f"{instr:<20}",
-                    "··",
-                    "··",
-                    "··",
-                    "··",
-                    "··",
-                    "··",
-                    "··",
-                    "····",
-                    "·····",
-                    f"{cycles}{Colors.RESET}",
-                ]
-                print("  ".join(parts))
-
+                instr, size, cycles = _decode_at(self.executor.cpu.mem, addr)
+                out.append(_UPCOMING_ROW.format(addr, instr, cycles))
                 addr = (addr + size) & 0xFFFF
             except:
                 break
 
-        print(f"{Colors.DIM}{'─' * 87}{Colors.RESET}")
+        out.append(_CONTEXT_RULE)
 
         # Show stack and memory preview
-        sp = regs["SP"]
-        hl = (regs["H"] << 8) | regs["L"]
+        sp = regs.SP
+        hl = (regs.H << 8) | regs.L
+
+        mem = self.executor.cpu.mem
 
         # Stack preview (4 entries)
         stack_items = []
         for i in range(4):
             addr = (sp + i) & 0xFFFF
-            val = self.executor.cpu.memory[addr].value
+            val = mem[addr]
             if i == 0:
                 stack_items.append(
                     f"{Colors.HIGHLIGHT}SP→{addr:04X}:{val:02X}H{Colors.RESET}"
@@ -246,7 +371,7 @@ class InteractiveDebugger:
         mem_items = []
         for i in range(4):
             addr = (hl + i) & 0xFFFF
-            val = self.executor.cpu.memory[addr].value
+            val = mem[addr]
             if i == 0:
                 mem_items.append(
                     f"{Colors.HIGHLIGHT}HL→{addr:04X}:{val:02X}H{Colors.RESET}"
@@ -254,12 +379,13 @@ class InteractiveDebugger:
             else:
                 mem_items.append(f"{addr:04X}:{val:02X}H")
 
-        print(
+        out.append(
             f"{Colors.CYAN}Stack:{Colors.RESET} {' '.join(stack_items)}  {Colors.CYAN}Memory:{Colors.RESET} {' '.join(mem_items)}"
         )
-        print(
+        out.append(
             f"{Colors.CYAN}Steps:{Colors.RESET} {self.executor.steps_executed}  {Colors.CYAN}Cycles:{Colors.RESET} {self.executor.total_cycles}"
         )
+        _write_lines(out)
 
     def repl(self):
         print(
@@ -314,46 +440,40 @@ class InteractiveDebugger:
         cmd = parts[0].lower()
         args = parts[1:]
 
-        if cmd in {"help", "h", "?"}:
-            self.print_help()
-        elif cmd in {"run", "r", "restart"}:
-            self.command_restart()
-        elif cmd in {"continue", "c"}:
-            self.execute_until_break(skip_current_break=True)
-        elif cmd in {"step", "s"}:
-            self.command_step()
-        elif cmd in {"back", "reverse", "undo", "u"}:
-            self.command_back()
-        elif cmd in {"next", "n"}:
-            self.command_next()
-        elif cmd in {"break", "b"}:
-            self.command_break(args)
-        elif cmd in {"delete", "del"}:
-            self.command_delete(args)
-        elif cmd == "print" or cmd == "p":
-            self.command_print(args)
-        elif cmd in {"dump", "x"}:
-            self.command_dump(args)
-        elif cmd in {"watch", "w"}:
-            self.command_watch(args)
-        elif cmd in {"unwatch", "unw"}:
-            self.command_unwatch(args)
-        elif cmd == "info":
-            self.command_info(args)
-        elif cmd in {"list", "l"}:
-            self.command_list(args)
-        elif cmd in {"disasm", "disassemble"}:
-            self.command_disasm(args)
-        elif cmd == "set":
-            self.command_set(args)
-        elif cmd in {"where", "bt", "backtrace"}:
-            self.command_where()
-        elif cmd == "history":
-            self.command_history()
-        elif cmd in {"quit", "exit", "q"}:
+        if cmd in {"quit", "exit", "q"}:
             raise SystemExit
-        else:
+        handler = self._commands.get(cmd)
+        if handler is None:
             print(f"Unknown command '{cmd}'. Type 'help' for a list of commands.")
+        else:
+            handler(args)
+
+    def _build_commands(self):
+        """Map every command name and alias to a handler taking the args list."""
+        table = (
+            (("help", "h", "?"), lambda args: self.print_help()),
+            (("run", "r", "restart"), lambda args: self.command_restart()),
+            (
+                ("continue", "c"),
+                lambda args: self.execute_until_break(skip_current_break=True),
+            ),
+            (("step", "s"), lambda args: self.command_step()),
+            (("back", "reverse", "undo", "u"), lambda args: self.command_back()),
+            (("next", "n"), lambda args: self.command_next()),
+            (("break", "b"), self.command_break),
+            (("delete", "del"), self.command_delete),
+            (("print", "p"), self.command_print),
+            (("dump", "x"), self.command_dump),
+            (("watch", "w"), self.command_watch),
+            (("unwatch", "unw"), self.command_unwatch),
+            (("info",), self.command_info),
+            (("list", "l"), self.command_list),
+            (("disasm", "disassemble"), self.command_disasm),
+            (("set",), self.command_set),
+            (("where", "bt", "backtrace"), lambda args: self.command_where()),
+            (("history",), lambda args: self.command_history()),
+        )
+        return {name: handler for names, handler in table for name in names}
 
     def command_step(self):
         """Execute one instruction and save state for reverse stepping."""
@@ -372,30 +492,21 @@ class InteractiveDebugger:
         # Execute instruction
         result = self.executor.step_instruction()
 
-        # Add executed instruction to trace for display
-        trace_entry = {
-            "pc": result["pc"],
-            "instr": result["instr"],
-            "cycles": result["cycles"],
-            "regs": result["regs"].copy(),
-        }
-        self.execution_trace.append(trace_entry)
-
-        # Keep trace size limited
-        if len(self.execution_trace) > self.max_trace:
-            self.execution_trace.pop(0)
+        # Add executed instruction to trace for display; the StepResult
+        # already carries pc/instr/cycles/regs and is immutable
+        self.execution_trace.append(result)
 
         # Show what changed
-        regs_after = result["regs"]
+        regs_after = result.regs
         changes = []
-        for reg in ["A", "B", "C", "D", "E", "H", "L"]:
-            if regs_before[reg] != regs_after[reg]:
+        for reg, old, new in zip(_CONTEXT_REGS, regs_before, regs_after):
+            if old != new:
                 changes.append(
-                    f"{reg}: {regs_before[reg]:02X}H → {Colors.HIGHLIGHT}{regs_after[reg]:02X}H{Colors.RESET}"
+                    f"{reg}: {old:02X}H → {Colors.HIGHLIGHT}{new:02X}H{Colors.RESET}"
                 )
-        if regs_before["SP"] != regs_after["SP"]:
+        if regs_before.SP != regs_after.SP:
             changes.append(
-                f"SP: {regs_before['SP']:04X}H → {Colors.HIGHLIGHT}{regs_after['SP']:04X}H{Colors.RESET}"
+                f"SP: {regs_before.SP:04X}H → {Colors.HIGHLIGHT}{regs_after.SP:04X}H{Colors.RESET}"
             )
 
         if changes:
@@ -409,16 +520,21 @@ class InteractiveDebugger:
                     f"{Colors.YELLOW}  Watch {addr:04X}H: {old:02X}H → {new:02X}H{Colors.RESET}"
                 )
 
-        if result["halted"]:
+        if result.halted:
             print(f"\n{Colors.GREEN}✓ Program halted.{Colors.RESET}")
 
-        # Always show instruction context table
-        if self.show_context:
+        # Show instruction context table unless display is switched off
+        if self.show_context and self.auto_display:
             self.show_instruction_context()
 
     def command_back(self):
         """Reverse (undo) the last step."""
-        if not self.execution_history:
+        if not self._record_history:
+            print(
+                f"{Colors.YELLOW}Reverse stepping is disabled (--no-reverse).{Colors.RESET}"
+            )
+            return
+        if not self._hist_len:
             print(
                 f"{Colors.YELLOW}No execution history. Cannot step backwards.{Colors.RESET}"
             )
@@ -432,7 +548,7 @@ class InteractiveDebugger:
             print(
                 f"\n{Colors.CYAN}Stepped back to:{Colors.RESET} Step {self.executor.steps_executed}, PC={self.executor.cpu.PC.value:04X}H"
             )
-            if self.show_context:
+            if self.show_context and self.auto_display:
                 self.show_instruction_context()
         else:
             print(f"{Colors.RED}Failed to restore state{Colors.RESET}")
@@ -444,39 +560,43 @@ class InteractiveDebugger:
             return
 
         pc = self.executor.cpu.PC.value
-        opcode = self.executor.cpu.memory[pc].value
+        opcode = self.executor.cpu.mem[pc]
 
         # Check if current instruction is CALL (CD) or conditional call
-        is_call = opcode in [0xCD, 0xC4, 0xCC, 0xD4, 0xDC, 0xE4, 0xEC, 0xF4, 0xFC]
+        is_call = opcode in _CALL_OPCODES
 
         if is_call:
             # Get the address of the instruction after the CALL
-            instr, size = disassemble_instruction(self.executor.cpu.memory, pc)
+            instr, size, _ = _decode_at(self.executor.cpu.mem, pc)
             next_addr = (pc + size) & 0xFFFF
 
-            # Execute until we reach that address or hit a breakpoint
+            # Execute until we reach that address or hit a breakpoint. The
+            # return address acts as a temporary breakpoint, so the loop only
+            # does one bitmap lookup per step; history gets a single entry,
+            # and 'back' undoes the whole step-over at once
             print(f"{Colors.CYAN}Stepping over {instr}...{Colors.RESET}")
+            self.save_state_to_history()
+            # Like `continue`, the run itself records no history
+            self._unseal_memory_diff()
+            cpu = self.executor.cpu
+            step = self.executor.step_cycles
+            stop_at = bytearray(self._bp_bitmap)
+            stop_at[next_addr] = 1
             steps_taken = 0
-            while (
-                not self.executor.cpu.haulted
-                and self.executor.cpu.PC.value != next_addr
-            ):
-                self.save_state_to_history()
-                result = self.executor.step_instruction()
+            while True:
+                step()
                 steps_taken += 1
-
-                # Check breakpoints
-                if self.executor.cpu.PC.value in self.breakpoints:
-                    print(
-                        f"{Colors.YELLOW}Breakpoint hit at {self.executor.cpu.PC.value:04X}H{Colors.RESET}"
-                    )
+                pc = cpu.PC.value
+                if stop_at[pc] or cpu.haulted or steps_taken > 10000:
                     break
 
-                if steps_taken > 10000:
-                    print(
-                        f"{Colors.RED}Step limit reached (possible infinite loop){Colors.RESET}"
-                    )
-                    break
+            # Check breakpoints
+            if pc in self.breakpoints:
+                print(f"{Colors.YELLOW}Breakpoint hit at {pc:04X}H{Colors.RESET}")
+            elif steps_taken > 10000:
+                print(
+                    f"{Colors.RED}Step limit reached (possible infinite loop){Colors.RESET}"
+                )
 
             print(f"{Colors.CYAN}Took {steps_taken} steps{Colors.RESET}")
         else:
@@ -486,8 +606,8 @@ class InteractiveDebugger:
     def command_restart(self):
         """Restart program execution from the beginning."""
         self.executor.reload_program()
-        self.execution_history = []
-        self.execution_trace = []
+        self.clear_history()
+        self.execution_trace.clear()
         for addr in list(self.watchpoints.keys()):
             self.watchpoints[addr] = None
         print(f"{Colors.GREEN}✓ Program restarted{Colors.RESET}")
@@ -539,31 +659,28 @@ class InteractiveDebugger:
             addr = self.executor.cpu.PC.value
             count = 10
 
-        print(f"\n{Colors.CYAN}Disassembly at {addr:04X}H:{Colors.RESET}")
+        out = [f"\n{Colors.CYAN}Disassembly at {addr:04X}H:{Colors.RESET}"]
         for _ in range(count):
             try:
-                instr, size = disassemble_instruction(self.executor.cpu.memory, addr)
-                cycles = get_instruction_cycles(self.executor.cpu.memory, addr)
+                instr, size, cycles = _decode_at(self.executor.cpu.mem, addr)
 
                 # Get machine code bytes
-                bytes_hex = " ".join(
-                    f"{self.executor.cpu.memory[addr + i].value:02X}"
-                    for i in range(size)
-                )
+                bytes_hex = self.executor.cpu.mem[addr : addr + size].hex(" ").upper()
 
                 # Highlight current PC
                 if addr == self.executor.cpu.PC.value:
-                    print(
+                    out.append(
                         f"  {Colors.HIGHLIGHT}→ {addr:04X}: {bytes_hex:<12} {instr:<20} [{cycles}T]{Colors.RESET}"
                     )
                 else:
-                    print(
+                    out.append(
                         f"    {addr:04X}: {bytes_hex:<12} {instr:<20} {Colors.DIM}[{cycles}T]{Colors.RESET}"
                     )
 
                 addr = (addr + size) & 0xFFFF
             except:
                 break
+        _write_lines(out)
 
     def command_set(self, args):
         """Set register or memory value."""
@@ -583,7 +700,9 @@ class InteractiveDebugger:
         if target.startswith("[") and target.endswith("]"):
             try:
                 addr = parse_address_value(target[1:-1])
-                self.executor.cpu.memory[addr & 0xFFFF].value = value & 0xFF
+                # Keep the edit undoable by the next `back`
+                self._unseal_memory_diff()
+                self.executor.cpu.mem[addr & 0xFFFF] = value & 0xFF
                 print(f"{Colors.GREEN}✓ [{addr:04X}H] = {value:02X}H{Colors.RESET}")
                 return
             except ValueError as exc:
@@ -604,14 +723,14 @@ class InteractiveDebugger:
 
     def command_where(self):
         """Show execution history/call stack."""
-        if not self.execution_history:
+        if not self._hist_len:
             print(f"{Colors.YELLOW}No execution history yet{Colors.RESET}")
             return
 
         print(f"\n{Colors.CYAN}Execution History (last 10 states):{Colors.RESET}")
-        for i, state in enumerate(self.execution_history[-10:]):
-            step = state["steps"]
-            pc = state["registers"]["PC"]
+        for i, slot in enumerate(self._iter_history_slots(10)):
+            step = self._hist_steps[slot]
+            pc = self._hist_regs[slot][_PC_SLOT]
             print(f"  {Colors.DIM}#{i}: Step {step}, PC={pc:04X}H{Colors.RESET}")
 
     def command_history(self):
@@ -619,10 +738,10 @@ class InteractiveDebugger:
         print(f"\n{Colors.CYAN}Execution Statistics:{Colors.RESET}")
         print(f"  Steps:    {self.executor.steps_executed}")
         print(f"  Cycles:   {self.executor.total_cycles}")
-        print(f"  History:  {len(self.execution_history)} saved states")
+        print(f"  History:  {self._hist_len} saved states")
         print(f"  Max hist: {self.max_history}")
-        if self.execution_history:
-            print(f"  Can undo: {len(self.execution_history)} steps")
+        if self._hist_len:
+            print(f"  Can undo: {self._hist_len} steps")
 
     def command_break(self, args):
         if not args:
@@ -630,6 +749,8 @@ class InteractiveDebugger:
             return
         addr = self.parse_address_arg(args[0])
         self.breakpoints.add(addr)
+        if 0 <= addr <= 0xFFFF:
+            self._bp_bitmap[addr] = 1
         print(f"Breakpoint set at {addr:04X}H")
 
     def command_delete(self, args):
@@ -639,11 +760,14 @@ class InteractiveDebugger:
         token = args[0].lower()
         if token == "all":
             self.breakpoints.clear()
+            self._bp_bitmap[:] = bytes(0x10000)
             print("Removed all breakpoints.")
             return
         addr = self.parse_address_arg(token)
         if addr in self.breakpoints:
             self.breakpoints.remove(addr)
+            if 0 <= addr <= 0xFFFF:
+                self._bp_bitmap[addr] = 0
             print(f"Removed breakpoint at {addr:04X}H")
         else:
             print("Breakpoint not found.")
@@ -653,7 +777,7 @@ class InteractiveDebugger:
             self.list_watchpoints()
             return
         addr = self.parse_address_arg(args[0])
-        value = self.executor.cpu.memory[addr].value
+        value = self.executor.cpu.mem[addr]
         self.watchpoints[addr] = value
         print(f"Watching address {addr:04X}H (current value {value:02X}H)")
 
@@ -691,22 +815,22 @@ class InteractiveDebugger:
             print(format_register_summary(regs))
             return
         target = args[0].upper()
-        if target in regs:
-            value = regs[target]
+        if target in Registers._fields:
+            value = getattr(regs, target)
             width = 4 if target == "SP" else 2
             print(f"{target} = {value:0{width}X}H ({value})")
             return
         if target == "PC":
             pc = self.executor.cpu.PC.value
-            instr, _ = disassemble_instruction(self.executor.cpu.memory, pc)
+            instr, _, _ = _decode_at(self.executor.cpu.mem, pc)
             print(f"PC = {pc:04X}H -> {instr}")
             return
         if target == "FLAGS":
-            print(format_flags(regs["FLAGS"]))
+            print(format_flags(regs.FLAGS))
             return
         if target.startswith("[") and target.endswith("]"):
             addr = self.parse_address_arg(target[1:-1])
-            value = self.executor.cpu.memory[addr].value
+            value = self.executor.cpu.mem[addr]
             print(f"[{addr:04X}H] = {value:02X}H ({value})")
             return
         print(f"Unknown print target '{target}'.")
@@ -747,40 +871,30 @@ class InteractiveDebugger:
             )
             end = start + 1023
 
-        print(f"{Colors.BLUE}Memory Dump [{start:04X}H - {end:04X}H]:{Colors.RESET}\n")
+        out = [f"{Colors.BLUE}Memory Dump [{start:04X}H - {end:04X}H]:{Colors.RESET}\n"]
 
+        mem = self.executor.cpu.mem
         addr = start
         while addr <= end:
             # Address column
-            print(f"{Colors.CYAN}{addr:04X}:{Colors.RESET}  ", end="")
-
-            # Hex dump
-            hex_values = []
-            ascii_values = []
-            for i in range(bytes_per_line):
-                if addr + i <= end:
-                    value = self.executor.cpu.memory[addr + i].value
-                    hex_values.append(f"{value:02X}")
-                    # ASCII representation (printable chars only)
-                    if 32 <= value <= 126:
-                        ascii_values.append(chr(value))
-                    else:
-                        ascii_values.append(".")
-                else:
-                    hex_values.append("  ")
-                    ascii_values.append(" ")
+            line = f"{Colors.CYAN}{addr:04X}:{Colors.RESET}  "
+
+            row = mem[addr : min(addr + bytes_per_line, end + 1)]
+            pad = bytes_per_line - len(row)
 
-            # Print hex values in groups of 4
-            for i in range(0, len(hex_values), 4):
-                group = hex_values[i : i + 4]
-                print(" ".join(group), end="  ")
+            # Hex dump: every byte takes a fixed 3-char "XX " cell, so groups
+            # of 4 are 12-char slices, each followed by one extra space
+            cells = row.hex(" ").upper() + "   " * pad + " "
+            line += "".join(cells[i : i + 12] + " " for i in range(0, len(cells), 12))
 
-            # Print ASCII representation
-            print(f" {Colors.DIM}|{''.join(ascii_values)}|{Colors.RESET}")
+            # ASCII representation (printable chars only)
+            ascii_text = row.translate(_ASCII_TABLE).decode("ascii") + " " * pad
+            out.append(f"{line} {Colors.DIM}|{ascii_text}|{Colors.RESET}")
 
             addr += bytes_per_line
 
-        print()
+        out.append("")
+        _write_lines(out)
 
     def parse_address_arg(self, token):
         label_map = self.executor.get_label_map()
@@ -793,32 +907,41 @@ class InteractiveDebugger:
             )
             return
 
+        # The run records no history: let the next `back` rewind all of it
+        self._unseal_memory_diff()
+
         steps_run = 0
         limit = self.step_limit if self.has_limit else float("inf")
         skip_break = skip_current_break
+        bp_bitmap = self._bp_bitmap
+        cpu = self.executor.cpu
+        step = self.executor.step_instruction
+        # The watch list cannot change mid-run; without one, skip the refresh
+        has_watch = bool(self.watchpoints)
 
         while steps_run < limit:
-            pc = self.executor.cpu.PC.value
-            if pc in self.breakpoints and not skip_break:
+            pc = cpu.PC.value
+            if bp_bitmap[pc] and not skip_break:
                 print(f"{Colors.YELLOW}Breakpoint hit at {pc:04X}H{Colors.RESET}")
                 self.display_state()
                 return
             skip_break = False
 
-            result = self.executor.step_instruction()
+            result = step()
             steps_run += 1
 
-            changes = self.refresh_watchpoints(report_changes=True)
-            if changes:
-                for addr, old, new in changes:
-                    print(
-                        f"{Colors.YELLOW}Watch {addr:04X}H:{Colors.RESET} "
-                        f"{old:02X}H → {Colors.HIGHLIGHT}{new:02X}H{Colors.RESET}"
-                    )
-                self.display_step(result)
-                return
-
-            if result["halted"]:
+            if has_watch:
+                changes = self.refresh_watchpoints(report_changes=True)
+                if changes:
+                    for addr, old, new in changes:
+                        print(
+                            f"{Colors.YELLOW}Watch {addr:04X}H:{Colors.RESET} "
+                            f"{old:02X}H → {Colors.HIGHLIGHT}{new:02X}H{Colors.RESET}"
+                        )
+                    self.display_step(result)
+                    return
+
+            if result.halted:
                 print(
                     f"{Colors.GREEN}Program halted after {self.executor.steps_executed} steps.{Colors.RESET}"
                 )
@@ -832,15 +955,23 @@ class InteractiveDebugger:
     def refresh_watchpoints(self, report_changes=False):
         """Check watchpoints and return changes."""
         changes = []
-        for addr in list(self.watchpoints.keys()):
-            current = self.executor.cpu.memory[addr].value
-            last = self.watchpoints[addr]
+        watchpoints = self.watchpoints
+        if not watchpoints:
+            return changes
+        # Read every watched byte in one C-level pass; when nothing moved
+        # (the usual case) a single list comparison settles it. A None
+        # (unprimed) entry never compares equal, so it takes the slow path
+        currents = list(map(self.executor.cpu.mem.__getitem__, watchpoints))
+        if currents == list(watchpoints.values()):
+            return changes
+        for addr, current in zip(list(watchpoints), currents):
+            last = watchpoints[addr]
             if last is None:
-                self.watchpoints[addr] = current
+                watchpoints[addr] = current
                 continue
             if current != last:
                 changes.append((addr, last, current))
-                self.watchpoints[addr] = current
+                watchpoints[addr] = current
                 if report_changes:
                     print(
                         f"{Colors.YELLOW}Watchpoint: {addr:04X}H changed from {last:02X}H to {current:02X}H{Colors.RESET}"
@@ -865,24 +996,24 @@ class InteractiveDebugger:
             print(f"  - {addr:04X}H (last={display})")
 
     def display_step(self, result):
-        regs = result["regs"]
+        regs = result.regs
         print(
-            f"{Colors.CYAN}{result['pc']:04X}{Colors.RESET}  {result['instr']:<20}  "
+            f"{Colors.CYAN}{result.pc:04X}{Colors.RESET}  {result.instr:<20}  "
             f"{format_register_summary(regs)}"
         )
 
     def display_state(self):
         """Show current CPU state with registers and flags."""
         regs = snapshot_registers(self.executor.cpu)
-        flags = decode_flags(regs["FLAGS"])
+        flags = decode_flags(regs.FLAGS)
         pc = self.executor.cpu.PC.value
 
         print(f"\n{Colors.CYAN}Registers:{Colors.RESET}")
         print(
-            f"  A={Colors.HIGHLIGHT}{regs['A']:02X}H{Colors.RESET} ({regs['A']:3d})  B={regs['B']:02X}H  C={regs['C']:02X}H  D={regs['D']:02X}H  E={regs['E']:02X}H  H={regs['H']:02X}H  L={regs['L']:02X}H"
+            f"  A={Colors.HIGHLIGHT}{regs.A:02X}H{Colors.RESET} ({regs.A:3d})  B={regs.B:02X}H  C={regs.C:02X}H  D={regs.D:02X}H  E={regs.E:02X}H  H={regs.H:02X}H  L={regs.L:02X}H"
         )
         print(
-            f"  SP={Colors.HIGHLIGHT}{regs['SP']:04X}H{Colors.RESET}  PC={Colors.HIGHLIGHT}{pc:04X}H{Colors.RESET}"
+            f"  SP={Colors.HIGHLIGHT}{regs.SP:04X}H{Colors.RESET}  PC={Colors.HIGHLIGHT}{pc:04X}H{Colors.RESET}"
         )
 
         print(f"\n{Colors.CYAN}Flags:{Colors.RESET} ", end="")
@@ -2,12 +2,16 @@
 
 import os
 import sys
+from array import array
+from operator import ne, or_
 
 from ...shared import emu8085
 from ...shared.assembly import assemble_or_exit, load_source_file
 from ...shared.colors import Colors
 from ...shared.executor import resolve_step_limit
 from ...shared.registers import (
+    FLAG_LETTERS,
+    Registers,
     compute_register_differences,
     format_register_summary,
     snapshot_registers,
@@ -15,42 +19,76 @@ from ...shared.registers import (
 from ..disassemble.disasm import disassemble_instruction, get_instruction_cycles
 
 
+# Side-by-side table layout, built once; Colors are fixed at import time
+_DIVIDER = "│"
+_TABLE_HEADER = (
+    f"{'Step':<4} {'PC':<4} {'Instruction':<14} {'A':<2} {'B':<2} {'C':<2} "
+    f"{'Flags':<5} {'T':>2}"
+)
+_TABLE_WIDTH = len(_TABLE_HEADER)  # 42
+_RULE = "─" * _TABLE_WIDTH
+_BOLD_RULE_LINE = f"{Colors.BLUE}{Colors.BOLD}{_RULE} {_DIVIDER} {_RULE}{Colors.RESET}"
+_DIM_RULE_LINE = f"{Colors.DIM}{_RULE} {_DIVIDER} {_RULE}{Colors.RESET}"
+_HEADER_LINE = (
+    f"{Colors.BOLD}{_TABLE_HEADER}{Colors.RESET} {_DIVIDER} "
+    f"{Colors.BOLD}{_TABLE_HEADER}{Colors.RESET}"
+)
+# Step, PC, instruction, A, B, C, SZAPC flags, T-states
+_ROW_TEMPLATE = (
+    f"{{:<4}} {Colors.CYAN}{{:04X}}{Colors.RESET} {{:<14}} {{:02X}} {{:02X}} {{:02X}} "
+    f"{{:<5}} {Colors.DIM}{{:>2}}{Colors.RESET}"
+)
+
+
 def simulate_program(filename, args):
-    """Assemble and execute a program, capturing register state after each step."""
+    """Assemble and execute a program, capturing register state after each step.
+
+    The trace is stored column-wise: one compact array per field, indexed by
+    step, instead of a dict per step. "regs" packs the eight register bytes
+    (A B C D E H L F, the layout of cpu.regs) of every step back to back.
+    """
     clean_lines, original_lines = load_source_file(filename)
     asm_obj = assemble_or_exit(filename, clean_lines, original_lines, args)
 
     cpu = emu8085()
-    for i, byte_val in enumerate(asm_obj.pmemory):
-        cpu.memory[i].value = byte_val
+    cpu.loadbinary(asm_obj.pmemory)
     cpu.PC.value = asm_obj.ploadoff
 
     max_steps, _ = resolve_step_limit(args)
-    steps = []
+    pcs = array("H")
+    instrs = []
+    cycle_counts = array("B")
+    sps = array("H")
+    regs = bytearray()
+    cpu_regs = cpu.regs
+    count = 0
     total_cycles = 0
 
-    while not cpu.haulted and len(steps) < max_steps:
+    while not cpu.haulted and count < max_steps:
         current_pc = cpu.PC.value
-        instr, _ = disassemble_instruction(cpu.memory, current_pc)
-        cycles = get_instruction_cycles(cpu.memory, current_pc)
+        instr, _ = disassemble_instruction(cpu.mem, current_pc)
+        cycles = get_instruction_cycles(cpu.mem, current_pc)
         cpu.runcrntins()
         total_cycles += cycles
 
-        steps.append(
-            {
-                "pc": current_pc,
-                "instr": instr,
-                "cycles": cycles,
-                "regs": snapshot_registers(cpu),
-            }
-        )
+        pcs.append(current_pc)
+        instrs.append(instr)
+        cycle_counts.append(cycles)
+        sps.append(cpu.SP.value)
+        regs += cpu_regs
+        count += 1
 
     reached_limit = (
-        (not cpu.haulted) and (len(steps) >= max_steps) and (max_steps != float("inf"))
+        (not cpu.haulted) and (count >= max_steps) and (max_steps != float("inf"))
     )
 
     return {
-        "steps": steps,
+        "count": count,
+        "pc": pcs,
+        "instr": instrs,
+        "cycles": cycle_counts,
+        "sp": sps,
+        "regs": regs,
         "halted": cpu.haulted,
         "reached_limit": reached_limit,
         "total_cycles": total_cycles,
@@ -59,9 +97,15 @@ def simulate_program(filename, args):
     }
 
 
-def format_diff_step(label, step, is_different=False):
+def step_registers(trace, idx):
+    """Registers snapshot after step `idx` of a simulated trace."""
+    a, b, c, d, e, h, l, f = trace["regs"][idx * 8 : idx * 8 + 8]
+    return Registers(a, b, c, d, e, h, l, trace["sp"][idx], f)
+
+
+def format_diff_step(label, trace, idx, is_different=False):
     """Return a formatted diff row for a specific program."""
-    if not step:
+    if idx >= trace["count"]:
         return f"{Colors.DIM}{label:<16}{Colors.RESET} {Colors.DIM}<< halted >>{Colors.RESET}"
 
     # Use different colors for different instructions
@@ -70,78 +114,71 @@ def format_diff_step(label, step, is_different=False):
 
     return (
         f"{color}{indicator} {Colors.BOLD}{label:<15}{Colors.RESET} "
-        f"{Colors.CYAN}{step['pc']:04X}{Colors.RESET}  "
-        f"{color}{step['instr']:<20}{Colors.RESET}  {format_register_summary(step['regs'])}"
+        f"{Colors.CYAN}{trace['pc'][idx]:04X}{Colors.RESET}  "
+        f"{color}{trace['instr'][idx]:<20}{Colors.RESET}  "
+        f"{format_register_summary(step_registers(trace, idx))}"
     )
 
 
-def format_table_row(step_num, step, width=42):
+def format_table_row(step_num, trace, idx, width=42):
     """Format a single table row for diff mode.
 
     Args:
         step_num: Step number
-        step: Step data dict or None
+        trace: Trace returned by simulate_program()
+        idx: Step index into the trace (past its end means halted)
         width: Total width the row should occupy (default 42 to match header)
     """
-    if not step:
+    if idx >= trace["count"]:
         halted_msg = "<< halted >>"
         # Pad to exact width
         content = f"{step_num:<4} {halted_msg}"
         return f"{content:<{width}}"
 
-    regs = step["regs"]
-    # Decode flags from FLAGS byte value
-    from .registers import decode_flags
-
-    flags = decode_flags(regs["FLAGS"])
-    flags_str = (
-        f"{'S' if flags['S'] else '-'}"
-        f"{'Z' if flags['Z'] else '-'}"
-        f"{'A' if flags['AC'] else '-'}"
-        f"{'P' if flags['P'] else '-'}"
-        f"{'C' if flags['CY'] else '-'}"
-    )
-
+    regs = trace["regs"]
+    base = idx * 8
     # Format matching header: Step PC Instruction A B C Flags T
     # Without color codes, this should be exactly 42 chars
-    row = (
-        f"{step_num:<4} "
-        f"{Colors.CYAN}{step['pc']:04X}{Colors.RESET} "
-        f"{step['instr']:<14} "
-        f"{regs['A']:02X} {regs['B']:02X} {regs['C']:02X} "
-        f"{flags_str:<5} "
-        f"{Colors.DIM}{step['cycles']:>2}{Colors.RESET}"
+    return _ROW_TEMPLATE.format(
+        step_num,
+        trace["pc"][idx],
+        trace["instr"][idx],
+        regs[base],
+        regs[base + 1],
+        regs[base + 2],
+        FLAG_LETTERS[regs[base + 7]],
+        trace["cycles"][idx],
     )
-    return row
 
 
-def highlight_differences(step_a, step_b, row_a, row_b):
-    """Add color highlighting for differences between two steps."""
-    if not step_a or not step_b:
-        return row_a, row_b
+def diff_masks(trace_a, trace_b):
+    """Per-step difference flags for the steps both traces executed.
 
+    Returns (instr_diff, reg_diff, sp_diff), bytearrays holding 1 where the
+    two programs differ at that step. Each is built by one C-level map over
+    the trace columns; the eight packed register bytes of a step are
+    compared as a single 64-bit word.
+    """
+    common = min(trace_a["count"], trace_b["count"])
+    instr_a, instr_b = trace_a["instr"][:common], trace_b["instr"][:common]
+    instr_diff = bytearray(map(ne, instr_a, instr_b))
+    words_a = memoryview(trace_a["regs"]).cast("Q")
+    words_b = memoryview(trace_b["regs"]).cast("Q")
+    with words_a, words_b:
+        reg_diff = bytearray(map(ne, words_a[:common], words_b[:common]))
+    sp_diff = bytearray(map(ne, trace_a["sp"][:common], trace_b["sp"][:common]))
+    return instr_diff, reg_diff, sp_diff
+
+
+def highlight_differences(instr_differs, regs_differ, row_a, row_b):
+    """Add color highlighting for differences between two steps."""
     # Check if instructions differ
-    if step_a["instr"] != step_b["instr"]:
+    if instr_differs:
         # Highlight entire rows in yellow
         row_a = f"{Colors.YELLOW}{row_a}{Colors.RESET}"
         row_b = f"{Colors.YELLOW}{row_b}{Colors.RESET}"
-        return row_a, row_b
-
-    # Check for register differences
-    regs_a = step_a["regs"]
-    regs_b = step_b["regs"]
-
-    has_diff = False
-    for reg in ["A", "B", "C", "D", "E", "H", "L"]:
-        if regs_a[reg] != regs_b[reg]:
-            has_diff = True
-            break
-
-    if not has_diff and regs_a["FLAGS"] != regs_b["FLAGS"]:
-        has_diff = True
-
-    if has_diff:
-        # Subtle highlight for register differences
+    elif regs_differ:
+        # Subtle highlight for register differences (A..L and FLAGS)
         row_a = f"{Colors.GREEN}{row_a}{Colors.RESET}"
         row_b = f"{Colors.GREEN}{row_b}{Colors.RESET}"
 
@@ -162,62 +199,47 @@ def run_diff_mode(file_a, file_b, args):
     trace_a = simulate_program(file_a, args)
     trace_b = simulate_program(file_b, args)
 
-    steps_a = trace_a["steps"]
-    steps_b = trace_b["steps"]
-    max_steps = max(len(steps_a), len(steps_b))
+    max_steps = max(trace_a["count"], trace_b["count"])
 
     if max_steps == 0:
         print(f"{Colors.DIM}No instructions executed in either program.{Colors.RESET}")
         return
 
     # Print header
-    divider = "│"
-    # Calculate exact width from header format
-    header = f"{'Step':<4} {'PC':<4} {'Instruction':<14} {'A':<2} {'B':<2} {'C':<2} {'Flags':<5} {'T':>2}"
-    header_width = len(header)  # Should be 42
-
-    print(
-        f"\n{Colors.BLUE}{Colors.BOLD}{'─' * header_width} {divider} {'─' * header_width}{Colors.RESET}"
-    )
+    header_width = _TABLE_WIDTH
+    print(f"\n{_BOLD_RULE_LINE}")
     print(
-        f"{Colors.BOLD}{label_a:^{header_width}}{Colors.RESET} {divider} {Colors.BOLD}{label_b:^{header_width}}{Colors.RESET}"
-    )
-    print(
-        f"{Colors.BLUE}{Colors.BOLD}{'─' * header_width} {divider} {'─' * header_width}{Colors.RESET}"
+        f"{Colors.BOLD}{label_a:^{header_width}}{Colors.RESET} {_DIVIDER} {Colors.BOLD}{label_b:^{header_width}}{Colors.RESET}"
     )
+    print(_BOLD_RULE_LINE)
 
     # Table headers
-    print(
-        f"{Colors.BOLD}{header}{Colors.RESET} {divider} {Colors.BOLD}{header}{Colors.RESET}"
-    )
-    print(
-        f"{Colors.DIM}{'─' * header_width} {divider} {'─' * header_width}{Colors.RESET}"
-    )
+    print(_HEADER_LINE)
+    print(_DIM_RULE_LINE)
+
+    # Compare both traces up front; the row loop only indexes the masks
+    instr_diff, reg_diff, sp_diff = diff_masks(trace_a, trace_b)
+    common = len(instr_diff)
+    # Steps differing in instruction, A..L/FLAGS or SP
+    step_diff = bytes(map(or_, map(or_, instr_diff, reg_diff), sp_diff))
+    diff_count = common - step_diff.count(0)
 
     # Print rows
-    diff_count = 0
     for idx in range(max_steps):
         step_num = idx + 1
-        step_a = steps_a[idx] if idx < len(steps_a) else None
-        step_b = steps_b[idx] if idx < len(steps_b) else None
-
-        row_a = format_table_row(step_num, step_a, header_width)
-        row_b = format_table_row(step_num, step_b, header_width)
+        row_a = format_table_row(step_num, trace_a, idx, header_width)
+        row_b = format_table_row(step_num, trace_b, idx, header_width)
 
         # Highlight differences
-        row_a, row_b = highlight_differences(step_a, step_b, row_a, row_b)
-
-        # Track differences
-        if step_a and step_b:
-            if step_a["instr"] != step_b["instr"] or step_a["regs"] != step_b["regs"]:
-                diff_count += 1
+        if idx < common:
+            row_a, row_b = highlight_differences(
+                instr_diff[idx], reg_diff[idx], row_a, row_b
+            )
 
-        print(f"{row_a} {divider} {row_b}")
+        print(f"{row_a} {_DIVIDER} {row_b}")
 
     # Table footer
-    print(
-        f"{Colors.BLUE}{Colors.BOLD}{'─' * header_width} {divider} {'─' * header_width}{Colors.RESET}"
-    )
+    print(_BOLD_RULE_LINE)
 
     def summarize(label, trace):
         status_icon = "✓" if trace["halted"] else "⚠"
@@ -228,7 +250,7 @@ def run_diff_mode(file_a, file_b, args):
             status_color = Colors.YELLOW
         return (
             f"  {status_color}{status_icon}{Colors.RESET} {Colors.BOLD}{label:<20}{Colors.RESET} "
-            f"{Colors.CYAN}{len(trace['steps']):>4}{Colors.RESET} steps  "
+            f"{Colors.CYAN}{trace['count']:>4}{Colors.RESET} steps  "
             f"{Colors.CYAN}{trace['total_cycles']:>5}{Colors.RESET} T-states  "
             f"{Colors.DIM}{status}{Colors.RESET}"
         )
@@ -245,7 +267,7 @@ def run_diff_mode(file_a, file_b, args):
     print(summary_line_b)
 
     # Calculate deltas
-    step_diff = len(trace_b["steps"]) - len(trace_a["steps"])
+    step_diff = trace_b["count"] - trace_a["count"]
     cycle_diff = trace_b["total_cycles"] - trace_a["total_cycles"]
 
     # Show differences
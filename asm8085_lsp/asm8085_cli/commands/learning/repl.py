@@ -7,7 +7,7 @@ import shutil
 import sys
 from contextlib import redirect_stderr, redirect_stdout
 
-from ...shared import assembler, emu8085
+from ...shared.emu import assembler, emu8085
 from ...shared.colors import Colors, strip_ansi
 from ...shared.disasm import disassemble_instruction, get_instruction_cycles
 from ...shared.parsing import parse_address_value
@@ -92,7 +92,7 @@ class InteractiveREPL:
         memory_snapshot = {}
         for start, end in save_ranges:
             for i in range(start, end + 1):
-                memory_snapshot[i] = self.cpu.memory[i].value
+                memory_snapshot[i] = self.cpu.mem[i]
 
         return {
             "A": self.cpu.A.value,
@@ -126,11 +126,11 @@ class InteractiveREPL:
         memory_snapshot = state.get("memory", {})
         if isinstance(memory_snapshot, dict):
             for addr, value in memory_snapshot.items():
-                self.cpu.memory[addr].value = value
+                self.cpu.mem[addr] = value & 0xFF
         else:
             # Fallback for old format (full array)
             for i in range(min(len(memory_snapshot), 65536)):
-                self.cpu.memory[i].value = memory_snapshot[i]
+                self.cpu.mem[i] = memory_snapshot[i] & 0xFF
 
         self.current_addr = self.cpu.PC.value
 
@@ -483,7 +483,7 @@ class InteractiveREPL:
                 self.append_log(f"{Colors.RED}{err}{Colors.RESET}")
 
     def read_memory(self, addr):
-        return self.cpu.memory[addr & 0xFFFF].value
+        return self.cpu.mem[addr & 0xFFFF]
 
     def render_panel(self, mode, **kwargs):
         regs = self.get_register_snapshot()
@@ -651,7 +651,7 @@ class InteractiveREPL:
             cycles = get_instruction_cycles(asm_obj.pmemory, pc)
 
             for i in range(size):
-                self.cpu.memory[self.current_addr + i].value = asm_obj.pmemory[pc + i]
+                self.cpu.mem[self.current_addr + i] = asm_obj.pmemory[pc + i]
 
             self.cpu.PC.value = self.current_addr
             self.cpu.runcrntins()
@@ -833,7 +833,7 @@ class InteractiveREPL:
             if cpu.haulted:
                 break
             pc = cpu.PC.value
-            cycles += get_instruction_cycles(cpu.memory, pc)
+            cycles += get_instruction_cycles(cpu.mem, pc)
             cpu.runcrntins()
             steps += 1
         return steps, cycles
@@ -857,7 +857,7 @@ class InteractiveREPL:
             return
         cpu = emu8085()
         for offset in range(asm_obj.cprogmemoff):
-            cpu.memory[asm_obj.ploadoff + offset].value = asm_obj.pmemory[
+            cpu.mem[asm_obj.ploadoff + offset] = asm_obj.pmemory[
                 asm_obj.ploadoff + offset
             ]
         cpu.PC.value = asm_obj.ploadoff
@@ -940,7 +940,7 @@ class InteractiveREPL:
         while addr <= end:
             chunk = []
             for _ in range(min(8, end - addr + 1)):
-                chunk.append(self.cpu.memory[addr].value)
+                chunk.append(self.cpu.mem[addr])
                 addr += 1
             print(self.format_memory_row(addr - len(chunk), chunk))
 
@@ -962,7 +962,7 @@ class InteractiveREPL:
         if target.startswith("[") and target.endswith("]"):
             try:
                 addr = parse_address_value(target[1:-1])
-                self.cpu.memory[addr & 0xFFFF].value = value & 0xFF
+                self.cpu.mem[addr & 0xFFFF] = value & 0xFF
                 print(f"{Colors.GREEN}✓{Colors.RESET} [{addr:04X}H] = {value:02X}H")
                 self.unsaved_changes = True
                 return
@@ -1044,7 +1044,7 @@ class InteractiveREPL:
         if self.instruction_count == 0:
             self.cpu = emu8085()
             for offset in range(asm_obj.cprogmemoff):
-                self.cpu.memory[asm_obj.ploadoff + offset].value = asm_obj.pmemory[
+                self.cpu.mem[asm_obj.ploadoff + offset] = asm_obj.pmemory[
                     asm_obj.ploadoff + offset
                 ]
             self.cpu.PC.value = asm_obj.ploadoff
@@ -1061,8 +1061,8 @@ class InteractiveREPL:
                 break
 
             before_regs = self.get_register_snapshot()
-            instr, _ = disassemble_instruction(self.cpu.memory, pc)
-            cycles = get_instruction_cycles(self.cpu.memory, pc)
+            instr, _ = disassemble_instruction(self.cpu.mem, pc)
+            cycles = get_instruction_cycles(self.cpu.mem, pc)
 
             self.cpu.runcrntins()
             self.instruction_count += 1
@@ -1104,8 +1104,8 @@ class InteractiveREPL:
             addr = start & 0xFFFF
             for _ in range(count):
                 try:
-                    instr, size = disassemble_instruction(self.cpu.memory, addr)
-                    cycles = get_instruction_cycles(self.cpu.memory, addr)
+                    instr, size = disassemble_instruction(self.cpu.mem, addr)
+                    cycles = get_instruction_cycles(self.cpu.mem, addr)
                     print(
                         f"{addr:04X}:  {instr:<20}  {Colors.DIM}[{cycles}T]{Colors.RESET}"
                     )
@@ -1151,7 +1151,7 @@ class InteractiveREPL:
         while addr <= (end & 0xFFFF) - len(pattern) + 1:
             match = True
             for i, byte_val in enumerate(pattern):
-                if self.cpu.memory[(addr + i) & 0xFFFF].value != byte_val:
+                if self.cpu.mem[(addr + i) & 0xFFFF] != byte_val:
                     match = False
                     break
             if match:
@@ -26,11 +26,14 @@ def visualize_memory_map(filename, args):
     limit, has_limit = resolve_step_limit(args)
     steps = 0
 
-    while not executor.cpu.haulted and (steps < limit):
-        executor.step_instruction()
+    # Only the final memory matters here, so use the cycles-only step
+    cpu = executor.cpu
+    step = executor.step_cycles
+    while not cpu.haulted and (steps < limit):
+        step()
         steps += 1
 
-    if has_limit and (not executor.cpu.haulted) and steps >= limit:
+    if has_limit and (not cpu.haulted) and steps >= limit:
         print(
             f"{Colors.YELLOW}Warning:{Colors.RESET} Program did not halt before step limit. "
             "Memory map may be incomplete."
@@ -49,7 +52,7 @@ def visualize_memory_map(filename, args):
     for addr in range(0x10000):
         # Check if memory was modified (not zero or in code section)
         if addr < load_addr or addr >= code_end:
-            if executor.cpu.memory[addr].value != 0:
+            if executor.cpu.mem[addr] != 0:
                 modified_addresses.add(addr)
 
     # Build memory regions
@@ -48,11 +48,11 @@ class PerformanceProfiler:
         """Record a step execution.
 
         Args:
-            step_result: Dictionary with pc, cycles, instr, etc.
+            step_result: StepResult from ProgramExecutor.step_instruction()
         """
-        pc = step_result.get("pc")
-        cycles = step_result.get("cycles", 0)
-        instruction = step_result.get("instr", "")
+        pc = step_result.pc
+        cycles = step_result.cycles
+        instruction = step_result.instr
 
         self.total_steps += 1
         self.total_cycles += cycles
@@ -244,12 +244,14 @@ def run_profiler_mode(filename, args, top_n=PROFILER_DEFAULT_TOP_N):
     limit, has_limit = resolve_step_limit(args)
     steps = 0
 
-    while not executor.cpu.haulted and (steps < limit):
-        result = executor.step_instruction()
-        profiler.record(result)
+    cpu = executor.cpu
+    step = executor.step_instruction
+    record = profiler.record
+    while not cpu.haulted and (steps < limit):
+        record(step())
         steps += 1
 
-    if has_limit and (not executor.cpu.haulted) and steps >= limit:
+    if has_limit and (not cpu.haulted) and steps >= limit:
         print(
             f"{Colors.YELLOW}Warning:{Colors.RESET} Program did not halt before step limit. "
             "Profile may be incomplete."
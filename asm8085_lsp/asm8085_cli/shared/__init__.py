@@ -5,6 +5,7 @@ from .colors import Colors
 from .config import load_config
 from .constants import *
 from .disasm import (
+    INSTRUCTION_CYCLES,
     disassemble_instruction,
     get_instruction_cycles,
     get_instruction_description,
@@ -13,12 +14,14 @@ from .emu import emu8085
 from .executor import resolve_step_limit
 from .helptext import print_full_help, print_short_help
 from .parsing import parse_address_value
-from .registers import decode_flags
+from .registers import FLAG_STRINGS, decode_flags, decode_flags_str
 
 __all__ = [
     "emu8085",
     "Colors",
     "decode_flags",
+    "decode_flags_str",
+    "FLAG_STRINGS",
     "assemble_or_exit",
     "load_source_file",
     "resolve_step_limit",
@@ -28,5 +31,6 @@ __all__ = [
     "load_config",
     "disassemble_instruction",
     "get_instruction_cycles",
+    "INSTRUCTION_CYCLES",
     "get_instruction_description",
 ]
@@ -3,7 +3,7 @@
 import re
 import sys
 
-from . import assembler
+from .emu import assembler
 from .colors import Colors
 from .syntax import (
     VALID_DIRECTIVES,
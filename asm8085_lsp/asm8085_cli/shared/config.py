@@ -1,9 +1,28 @@
 """Configuration file parser for asm8085."""
 
 import configparser
+from functools import lru_cache
 from pathlib import Path
 
 
+def _config_locations():
+    """Config file paths in order of priority (later overrides earlier)."""
+    return [
+        Path.home() / ".asmrc",  # Global config
+        Path.cwd() / ".asmrc",  # Project-local config
+    ]
+
+
+# Boolean CLI flags (args attribute, [defaults] key) that fall back to config
+_BOOL_DEFAULTS = (
+    ("highlight_changes", "highlight"),
+    ("show_registers", "show_registers"),
+    ("binary", "binary"),
+    ("verbose", "verbose"),
+    ("warnings", "warnings"),
+)
+
+
 class Config:
     """Handle configuration from ~/.asmrc and .asmrc files."""
 
@@ -14,12 +33,7 @@ class Config:
 
     def _load_configs(self):
         """Load configuration files in order of priority (lower overrides higher)."""
-        config_locations = [
-            Path.home() / ".asmrc",  # Global config
-            Path.cwd() / ".asmrc",  # Project-local config
-        ]
-
-        for config_path in config_locations:
+        for config_path in _config_locations():
             if config_path.exists():
                 try:
                     self.config.read(config_path)
@@ -56,21 +70,11 @@ class Config:
         """Apply config values to argparse args object (if not already set by CLI)."""
         # Only apply config if the argument wasn't explicitly set on command line
 
-        # [defaults] section
-        if hasattr(args, "highlight_changes") and args.highlight_changes is None:
-            args.highlight_changes = self.get_bool("defaults", "highlight", False)
-
-        if hasattr(args, "show_registers") and args.show_registers is None:
-            args.show_registers = self.get_bool("defaults", "show_registers", False)
-
-        if hasattr(args, "binary") and args.binary is None:
-            args.binary = self.get_bool("defaults", "binary", False)
-
-        if hasattr(args, "verbose") and args.verbose is None:
-            args.verbose = self.get_bool("defaults", "verbose", False)
-
-        if hasattr(args, "warnings") and args.warnings is None:
-            args.warnings = self.get_bool("defaults", "warnings", False)
+        # [defaults] section. Flags still unset after this end up False, so
+        # callers never see None for them
+        for attr, key in _BOOL_DEFAULTS:
+            if getattr(args, attr, False) is None:
+                setattr(args, attr, self.get_bool("defaults", key, False))
 
         # Base format (hex, decimal, binary) - only apply if using default
         if hasattr(args, "base") and args.base == "hex":
@@ -130,7 +134,30 @@ clock = 5.0
         f.write(config_content)
 
 
+def _config_stamp() -> tuple:
+    """(path, mtime_ns) of every config file that currently exists."""
+    stamp = []
+    for config_path in _config_locations():
+        try:
+            stamp.append((str(config_path), config_path.stat().st_mtime_ns))
+        except OSError:
+            pass
+    return tuple(stamp)
+
+
+@lru_cache(maxsize=1)
+def _load_config_cached(stamp: tuple) -> Config:
+    return Config()
+
+
 # Convenience function
 def load_config() -> Config:
-    """Load configuration from standard locations."""
-    return Config()
+    """Load configuration from standard locations.
+
+    The parsed Config is reused until a config file is created, removed or
+    modified (keyed on the files' mtimes).
+    """
+    return _load_config_cached(_config_stamp())
+
+
+load_config.cache_clear = _load_config_cached.cache_clear
@@ -156,6 +156,12 @@ def get_instruction_cycles(memory, addr, jump_taken=None):
     return 4  # Default
 
 
+# T-states per opcode, with conditional jumps/calls/returns counted as taken
+# (the get_instruction_cycles default). Lets hot loops replace the function
+# call with a single index into the byte at PC
+INSTRUCTION_CYCLES = bytes(get_instruction_cycles((op,), 0) for op in range(256))
+
+
 def get_instruction_description(instruction):
     """Get a brief description of what an instruction does
 
@@ -277,18 +277,24 @@ def misc_getele(line: str) -> list:
 
 class emu8085:
     def __init__(self) -> None:
-        self.memory = []
+        # 64K address space as plain bytes: handlers index mem directly and
+        # bulk ops (slicing, bytes(), loadbinary) need no per-cell objects
+        self.mem = bytearray(0xFFFF + 1)
+        self._memarr = (c_ubyte * len(self.mem)).from_buffer(self.mem)  # pins mem
         self.ploadaddress = c_ushort()
         self.ploadaddress.value = 0x0800
 
-        self.A: c_ubyte = c_ubyte()
-        self.F: c_ubyte = c_ubyte()
-        self.B: c_ubyte = c_ubyte()
-        self.C: c_ubyte = c_ubyte()
-        self.D: c_ubyte = c_ubyte()
-        self.E: c_ubyte = c_ubyte()
-        self.H: c_ubyte = c_ubyte()
-        self.L: c_ubyte = c_ubyte()
+        # 8-bit registers packed in regs as A B C D E H L F; each register
+        # is a c_ubyte view into it, so bytes(regs) snapshots all of them
+        self.regs = bytearray(8)
+        self.A: c_ubyte = c_ubyte.from_buffer(self.regs, 0)
+        self.B: c_ubyte = c_ubyte.from_buffer(self.regs, 1)
+        self.C: c_ubyte = c_ubyte.from_buffer(self.regs, 2)
+        self.D: c_ubyte = c_ubyte.from_buffer(self.regs, 3)
+        self.E: c_ubyte = c_ubyte.from_buffer(self.regs, 4)
+        self.H: c_ubyte = c_ubyte.from_buffer(self.regs, 5)
+        self.L: c_ubyte = c_ubyte.from_buffer(self.regs, 6)
+        self.F: c_ubyte = c_ubyte.from_buffer(self.regs, 7)
 
         self.SP = c_ushort()
         self.PC = c_ushort()
@@ -298,14 +304,11 @@ class emu8085:
         self.haulted = False
         self.wasexecerr = False
         self.plugin: PluginExternal = PluginExternal()
-        for i in range(0xFFFF + 1):
-            self.memory.append(c_ubyte())
         self.reset()
         self.connectplugin()
 
     def reset(self) -> None:
-        for cell in self.memory:
-            cell.value = 0x00  # default mem value
+        memset(self._memarr, 0x00, len(self.mem))  # default mem value
 
         self.A.value = 0x00
         self.F.value = 0x00
@@ -349,1210 +352,1212 @@ class emu8085:
             return 1
 
     def loadbinary(self, binary) -> None:
-        boff = 0
-        for bbyte in binary:
-            self.memory[boff].value = bbyte
-            boff += 1
+        self.mem[: len(binary)] = bytes(binary)
 
     def pop(self) -> int:
         self.SP.value = self.SP.value + 1
-        bval = self.memory[self.SP.value].value
+        bval = self.mem[self.SP.value]
         return bval
 
     def push(self, bval: int) -> None:
-        self.memory[self.SP.value].value = bval
+        self.mem[self.SP.value] = bval & 0xFF
         self.SP.value = self.SP.value - 1
 
     def runcrntins(self):
         if self.haulted == True:
             Exception("cpu cannot process instruction haulted!")
             return
-        ins = self.memory[self.PC.value].value
+        ins = self.mem[self.PC.value]
         self.incpc()  # program counter inc for opcode read
         # #hlt
         # if(ins == 0x76):
         #     self.haulted = True
         #     return
 
-        # nop
-        if ins == 0x00:
-            return
-        # mov b, r/m
-        elif ins & 0xF8 == 0x40:
-            sreg = ins - 0x40
-            if sreg == 0x0:
-                tval = self.B.value
-                self.B.value = tval
-            elif sreg == 0x1:
-                tval = self.C.value
-                self.B.value = tval
-            elif sreg == 0x2:
-                tval = self.D.value
-                self.B.value = tval
-            elif sreg == 0x3:
-                tval = self.E.value
-                self.B.value = tval
-            elif sreg == 0x4:
-                tval = self.H.value
-                self.B.value = tval
-            elif sreg == 0x5:
-                tval = self.L.value
-                self.B.value = tval
-            elif sreg == 0x6:
-                tval = self.getM()
-                self.B.value = tval
-            elif sreg == 0x7:
-                tval = self.A.value
-                self.B.value = tval
-            return
-        # mov c, r/m
-        elif ins & 0xF8 == 0x48:
-            sreg = ins - 0x48
-            if sreg == 0x0:
-                tval = self.B.value
-                self.C.value = tval
-            elif sreg == 0x1:
-                tval = self.C.value
-                self.C.value = tval
-            elif sreg == 0x2:
-                tval = self.D.value
-                self.C.value = tval
-            elif sreg == 0x3:
-                tval = self.E.value
-                self.C.value = tval
-            elif sreg == 0x4:
-                tval = self.H.value
-                self.C.value = tval
-            elif sreg == 0x5:
-                tval = self.L.value
-                self.C.value = tval
-            elif sreg == 0x6:
-                tval = self.getM()
-                self.C.value = tval
-            elif sreg == 0x7:
-                tval = self.A.value
-                self.C.value = tval
-            return
-        # mov d, r/m
-        elif ins & 0xF8 == 0x50:
-            sreg = ins - 0x50
-            if sreg == 0x0:
-                tval = self.B.value
-                self.D.value = tval
-            elif sreg == 0x1:
-                tval = self.C.value
-                self.D.value = tval
-            elif sreg == 0x2:
-                tval = self.D.value
-                self.D.value = tval
-            elif sreg == 0x3:
-                tval = self.E.value
-                self.D.value = tval
-            elif sreg == 0x4:
-                tval = self.H.value
-                self.D.value = tval
-            elif sreg == 0x5:
-                tval = self.L.value
-                self.D.value = tval
-            elif sreg == 0x6:
-                tval = self.getM()
-                self.D.value = tval
-            elif sreg == 0x7:
-                tval = self.A.value
-                self.D.value = tval
-            return
-        # mov e, r/m
-        elif ins & 0xF8 == 0x58:
-            sreg = ins - 0x58
-            if sreg == 0x0:
-                tval = self.B.value
-                self.E.value = tval
-            elif sreg == 0x1:
-                tval = self.C.value
-                self.E.value = tval
-            elif sreg == 0x2:
-                tval = self.D.value
-                self.E.value = tval
-            elif sreg == 0x3:
-                tval = self.E.value
-                self.E.value = tval
-            elif sreg == 0x4:
-                tval = self.H.value
-                self.E.value = tval
-            elif sreg == 0x5:
-                tval = self.L.value
-                self.E.value = tval
-            elif sreg == 0x6:
-                tval = self.getM()
-                self.E.value = tval
-            elif sreg == 0x7:
-                tval = self.A.value
-                self.E.value = tval
-            return
-        # mov h, r/m
-        elif ins & 0xF8 == 0x60:
-            sreg = ins - 0x60
-            if sreg == 0x0:
-                tval = self.B.value
-                self.H.value = tval
-            elif sreg == 0x1:
-                tval = self.C.value
-                self.H.value = tval
-            elif sreg == 0x2:
-                tval = self.D.value
-                self.H.value = tval
-            elif sreg == 0x3:
-                tval = self.E.value
-                self.H.value = tval
-            elif sreg == 0x4:
-                tval = self.H.value
-                self.H.value = tval
-            elif sreg == 0x5:
-                tval = self.L.value
-                self.H.value = tval
-            elif sreg == 0x6:
-                tval = self.getM()
-                self.H.value = tval
-            elif sreg == 0x7:
-                tval = self.A.value
-                self.H.value = tval
-            return
-        # mov l, r/m
-        elif ins & 0xF8 == 0x68:
-            sreg = ins - 0x68
-            if sreg == 0x0:
-                tval = self.B.value
-                self.L.value = tval
-            elif sreg == 0x1:
-                tval = self.C.value
-                self.L.value = tval
-            elif sreg == 0x2:
-                tval = self.D.value
-                self.L.value = tval
-            elif sreg == 0x3:
-                tval = self.E.value
-                self.L.value = tval
-            elif sreg == 0x4:
-                tval = self.H.value
-                self.L.value = tval
-            elif sreg == 0x5:
-                tval = self.L.value
-                self.L.value = tval
-            elif sreg == 0x6:
-                tval = self.getM()
-                self.L.value = tval
-            elif sreg == 0x7:
-                tval = self.A.value
-                self.L.value = tval
-            return
-        # mov m, r/m
-        elif ins & 0xF8 == 0x70:
-            sreg = ins - 0x70
-            if sreg == 0x0:
-                tval = self.B.value
-                self.setM(tval)
-            elif sreg == 0x1:
-                tval = self.C.value
-                self.setM(tval)
-            elif sreg == 0x2:
-                tval = self.D.value
-                self.setM(tval)
-            elif sreg == 0x3:
-                tval = self.E.value
-                self.setM(tval)
-            elif sreg == 0x4:
-                tval = self.H.value
-                self.setM(tval)
-            elif sreg == 0x5:
-                tval = self.L.value
-                self.setM(tval)
-            elif sreg == 0x6:
-                self.haulted = True
-            elif sreg == 0x7:
-                tval = self.A.value
-                self.setM(tval)
-            return
-        # mov a, r/m
-        elif ins & 0xF8 == 0x78:
-            sreg = ins - 0x78
-            if sreg == 0x0:
-                tval = self.B.value
-                self.A.value = tval
-            elif sreg == 0x1:
-                tval = self.C.value
-                self.A.value = tval
-            elif sreg == 0x2:
-                tval = self.D.value
-                self.A.value = tval
-            elif sreg == 0x3:
-                tval = self.E.value
-                self.A.value = tval
-            elif sreg == 0x4:
-                tval = self.H.value
-                self.A.value = tval
-            elif sreg == 0x5:
-                tval = self.L.value
-                self.A.value = tval
-            elif sreg == 0x6:
-                tval = self.getM()
-                self.A.value = tval
-            elif sreg == 0x7:
-                tval = self.A.value
-                self.A.value = tval
-            return
-        # mvi r/m, db
-        elif (ins & 0xCF == 0x06) or (ins & 0xCF == 0x0E):
-            # print('pass')
-            sreg = ((ins & 0x30) >> 3) + ((ins & 0x08) >> 3)
-            # print(hex(sreg))
-            tval = self.memory[self.PC.value].value
-            self.incpc()
-            if sreg == 0x0:
-                self.B.value = tval
-            elif sreg == 0x1:
-                self.C.value = tval
-            elif sreg == 0x2:
-                self.D.value = tval
-            elif sreg == 0x3:
-                self.E.value = tval
-            elif sreg == 0x4:
-                self.H.value = tval
-            elif sreg == 0x5:
-                self.L.value = tval
-            elif sreg == 0x6:
-                self.setM(tval)
-            elif sreg == 0x7:
-                self.A.value = tval
-            return
-        # lxi rp, ds
-        elif (ins & 0xCF) == 0x01:
-            # print('pass')
-            sreg = ins >> 4
-            lval = self.memory[self.PC.value].value
-            self.incpc()
-            hval = self.memory[self.PC.value].value
-            self.incpc()
-            if sreg == 0x0:
-                self.B.value = hval
-                self.C.value = lval
-            elif sreg == 0x1:
-                self.D.value = hval
-                self.E.value = lval
-            elif sreg == 0x2:
-                self.H.value = hval
-                self.L.value = lval
-            elif sreg == 0x7:
-                self.SP.value = (hval << 8) + lval
-            return
-        # lda ds
-        elif ins == 0x3A:
-            lval = self.memory[self.PC.value].value
-            self.incpc()
-            hval = self.memory[self.PC.value].value
-            self.incpc()
-            self.A.value = self.memory[(hval << 8) + lval].value
-            return
-        # ldax b
-        elif ins == 0x0A:
-            self.A.value = self.memory[(self.B.value << 8) + self.C.value].value
-            return
-        # ldax d
-        elif ins == 0x1A:
-            self.A.value = self.memory[(self.D.value << 8) + self.E.value].value
-            return
-        # sta ds
-        elif ins == 0x32:
-            lval = self.memory[self.PC.value].value
-            self.incpc()
-            hval = self.memory[self.PC.value].value
-            self.incpc()
-            self.memory[(hval << 8) + lval].value = self.A.value
-            return
-        # stax b
-        elif ins == 0x02:
-            self.memory[(self.B.value << 8) + self.C.value].value = self.A.value
-            return
-        # stax d
-        elif ins == 0x12:
-            self.memory[(self.D.value << 8) + self.E.value].value = self.A.value
-            return
-        # in db
-        elif ins == 0xDB:
-            pval = self.memory[self.PC.value].value
-            self.incpc()
-            if self.plugin.isconnected:
-                rstat, rbyte = self.plugin.inport(pval)
-                self.A.value = rbyte
-            return
-        # out db
-        elif ins == 0xD3:
-            pval = self.memory[self.PC.value].value
-            self.incpc()
-            if self.plugin.isconnected:
-                rstat = self.plugin.outport(pval, self.A.value)
-            return
-        # lhld ds
-        elif ins == 0x2A:
-            lval = self.memory[self.PC.value].value
-            self.incpc()
-            hval = self.memory[self.PC.value].value
-            self.incpc()
-            self.L.value = self.memory[(hval << 8) + lval].value
-            self.H.value = self.memory[(hval << 8) + lval + 1].value
-            return
-        # shld ds
-        elif ins == 0x22:
-            lval = self.memory[self.PC.value].value
-            self.incpc()
-            hval = self.memory[self.PC.value].value
-            self.incpc()
-            self.memory[(hval << 8) + lval].value = self.L.value
-            self.memory[(hval << 8) + lval + 1].value = self.H.value
-        # xchg
-        elif ins == 0xEB:
-            tmp = self.H.value
-            self.H.value = self.D.value
-            self.D.value = tmp
-            tmp = self.L.value
-            self.L.value = self.E.value
-            self.E.value = tmp
-        # add r
-        elif ins & 0xF8 == 0x80:
-            sreg = ins - 0x80
-            opval = 0
-            if sreg == 0x0:
-                opval = self.B.value
-            elif sreg == 0x1:
-                opval = self.C.value
-            elif sreg == 0x2:
-                opval = self.D.value
-            elif sreg == 0x3:
-                opval = self.E.value
-            elif sreg == 0x4:
-                opval = self.H.value
-            elif sreg == 0x5:
-                opval = self.L.value
-            elif sreg == 0x6:
-                opval = self.getM()
-            elif sreg == 0x7:
-                opval = self.A.value
-            fval = self.A.value + opval
-            self.resetflags()
-            self.setsignflag(fval)
-            self.setzeroflag(fval)
-            self.setauxicarryflag(self.iscaseauxcarry(opval, self.A.value))
-            self.setparityflag(fval)
-            if fval > 0xFF:
-                self.setcarryflag(1)
-            self.A.value = fval
-            return
-        # adi db
-        elif ins == 0xC6:
-            opval = self.memory[self.PC.value].value
-            self.incpc()
-            fval = self.A.value + opval
-            self.resetflags()
-            self.setsignflag(fval)
-            self.setzeroflag(fval)
-            self.setauxicarryflag(self.iscaseauxcarry(opval, self.A.value))
-            self.setparityflag(fval)
-            if fval > 0xFF:
-                self.setcarryflag(1)
+        _OPCODE_TABLE[ins](self, ins)
+
+    # nop
+    def _op_nop(self, ins):
+        pass
+
+    # mov b, r/m
+    def _op_mov_b(self, ins):
+        sreg = ins - 0x40
+        if sreg == 0x0:
+            tval = self.B.value
+            self.B.value = tval
+        elif sreg == 0x1:
+            tval = self.C.value
+            self.B.value = tval
+        elif sreg == 0x2:
+            tval = self.D.value
+            self.B.value = tval
+        elif sreg == 0x3:
+            tval = self.E.value
+            self.B.value = tval
+        elif sreg == 0x4:
+            tval = self.H.value
+            self.B.value = tval
+        elif sreg == 0x5:
+            tval = self.L.value
+            self.B.value = tval
+        elif sreg == 0x6:
+            tval = self.getM()
+            self.B.value = tval
+        elif sreg == 0x7:
+            tval = self.A.value
+            self.B.value = tval
+
+    # mov c, r/m
+    def _op_mov_c(self, ins):
+        sreg = ins - 0x48
+        if sreg == 0x0:
+            tval = self.B.value
+            self.C.value = tval
+        elif sreg == 0x1:
+            tval = self.C.value
+            self.C.value = tval
+        elif sreg == 0x2:
+            tval = self.D.value
+            self.C.value = tval
+        elif sreg == 0x3:
+            tval = self.E.value
+            self.C.value = tval
+        elif sreg == 0x4:
+            tval = self.H.value
+            self.C.value = tval
+        elif sreg == 0x5:
+            tval = self.L.value
+            self.C.value = tval
+        elif sreg == 0x6:
+            tval = self.getM()
+            self.C.value = tval
+        elif sreg == 0x7:
+            tval = self.A.value
+            self.C.value = tval
+
+    # mov d, r/m
+    def _op_mov_d(self, ins):
+        sreg = ins - 0x50
+        if sreg == 0x0:
+            tval = self.B.value
+            self.D.value = tval
+        elif sreg == 0x1:
+            tval = self.C.value
+            self.D.value = tval
+        elif sreg == 0x2:
+            tval = self.D.value
+            self.D.value = tval
+        elif sreg == 0x3:
+            tval = self.E.value
+            self.D.value = tval
+        elif sreg == 0x4:
+            tval = self.H.value
+            self.D.value = tval
+        elif sreg == 0x5:
+            tval = self.L.value
+            self.D.value = tval
+        elif sreg == 0x6:
+            tval = self.getM()
+            self.D.value = tval
+        elif sreg == 0x7:
+            tval = self.A.value
+            self.D.value = tval
+
+    # mov e, r/m
+    def _op_mov_e(self, ins):
+        sreg = ins - 0x58
+        if sreg == 0x0:
+            tval = self.B.value
+            self.E.value = tval
+        elif sreg == 0x1:
+            tval = self.C.value
+            self.E.value = tval
+        elif sreg == 0x2:
+            tval = self.D.value
+            self.E.value = tval
+        elif sreg == 0x3:
+            tval = self.E.value
+            self.E.value = tval
+        elif sreg == 0x4:
+            tval = self.H.value
+            self.E.value = tval
+        elif sreg == 0x5:
+            tval = self.L.value
+            self.E.value = tval
+        elif sreg == 0x6:
+            tval = self.getM()
+            self.E.value = tval
+        elif sreg == 0x7:
+            tval = self.A.value
+            self.E.value = tval
+
+    # mov h, r/m
+    def _op_mov_h(self, ins):
+        sreg = ins - 0x60
+        if sreg == 0x0:
+            tval = self.B.value
+            self.H.value = tval
+        elif sreg == 0x1:
+            tval = self.C.value
+            self.H.value = tval
+        elif sreg == 0x2:
+            tval = self.D.value
+            self.H.value = tval
+        elif sreg == 0x3:
+            tval = self.E.value
+            self.H.value = tval
+        elif sreg == 0x4:
+            tval = self.H.value
+            self.H.value = tval
+        elif sreg == 0x5:
+            tval = self.L.value
+            self.H.value = tval
+        elif sreg == 0x6:
+            tval = self.getM()
+            self.H.value = tval
+        elif sreg == 0x7:
+            tval = self.A.value
+            self.H.value = tval
+
+    # mov l, r/m
+    def _op_mov_l(self, ins):
+        sreg = ins - 0x68
+        if sreg == 0x0:
+            tval = self.B.value
+            self.L.value = tval
+        elif sreg == 0x1:
+            tval = self.C.value
+            self.L.value = tval
+        elif sreg == 0x2:
+            tval = self.D.value
+            self.L.value = tval
+        elif sreg == 0x3:
+            tval = self.E.value
+            self.L.value = tval
+        elif sreg == 0x4:
+            tval = self.H.value
+            self.L.value = tval
+        elif sreg == 0x5:
+            tval = self.L.value
+            self.L.value = tval
+        elif sreg == 0x6:
+            tval = self.getM()
+            self.L.value = tval
+        elif sreg == 0x7:
+            tval = self.A.value
+            self.L.value = tval
+
+    # mov m, r/m
+    def _op_mov_m(self, ins):
+        sreg = ins - 0x70
+        if sreg == 0x0:
+            tval = self.B.value
+            self.setM(tval)
+        elif sreg == 0x1:
+            tval = self.C.value
+            self.setM(tval)
+        elif sreg == 0x2:
+            tval = self.D.value
+            self.setM(tval)
+        elif sreg == 0x3:
+            tval = self.E.value
+            self.setM(tval)
+        elif sreg == 0x4:
+            tval = self.H.value
+            self.setM(tval)
+        elif sreg == 0x5:
+            tval = self.L.value
+            self.setM(tval)
+        elif sreg == 0x6:
+            self.haulted = True
+        elif sreg == 0x7:
+            tval = self.A.value
+            self.setM(tval)
+
+    # mov a, r/m
+    def _op_mov_a(self, ins):
+        sreg = ins - 0x78
+        if sreg == 0x0:
+            tval = self.B.value
+            self.A.value = tval
+        elif sreg == 0x1:
+            tval = self.C.value
+            self.A.value = tval
+        elif sreg == 0x2:
+            tval = self.D.value
+            self.A.value = tval
+        elif sreg == 0x3:
+            tval = self.E.value
+            self.A.value = tval
+        elif sreg == 0x4:
+            tval = self.H.value
+            self.A.value = tval
+        elif sreg == 0x5:
+            tval = self.L.value
+            self.A.value = tval
+        elif sreg == 0x6:
+            tval = self.getM()
+            self.A.value = tval
+        elif sreg == 0x7:
+            tval = self.A.value
+            self.A.value = tval
+
+    # mvi r/m, db
+    def _op_mvi(self, ins):
+        # print('pass')
+        sreg = ((ins & 0x30) >> 3) + ((ins & 0x08) >> 3)
+        # print(hex(sreg))
+        tval = self.mem[self.PC.value]
+        self.incpc()
+        if sreg == 0x0:
+            self.B.value = tval
+        elif sreg == 0x1:
+            self.C.value = tval
+        elif sreg == 0x2:
+            self.D.value = tval
+        elif sreg == 0x3:
+            self.E.value = tval
+        elif sreg == 0x4:
+            self.H.value = tval
+        elif sreg == 0x5:
+            self.L.value = tval
+        elif sreg == 0x6:
+            self.setM(tval)
+        elif sreg == 0x7:
+            self.A.value = tval
+
+    # lxi rp, ds
+    def _op_lxi(self, ins):
+        # print('pass')
+        sreg = ins >> 4
+        lval = self.mem[self.PC.value]
+        self.incpc()
+        hval = self.mem[self.PC.value]
+        self.incpc()
+        if sreg == 0x0:
+            self.B.value = hval
+            self.C.value = lval
+        elif sreg == 0x1:
+            self.D.value = hval
+            self.E.value = lval
+        elif sreg == 0x2:
+            self.H.value = hval
+            self.L.value = lval
+        elif sreg == 0x7:
+            self.SP.value = (hval << 8) + lval
+
+    # lda ds
+    def _op_lda(self, ins):
+        lval = self.mem[self.PC.value]
+        self.incpc()
+        hval = self.mem[self.PC.value]
+        self.incpc()
+        self.A.value = self.mem[(hval << 8) + lval]
+
+    # ldax b
+    def _op_ldax_b(self, ins):
+        self.A.value = self.mem[(self.B.value << 8) + self.C.value]
+
+    # ldax d
+    def _op_ldax_d(self, ins):
+        self.A.value = self.mem[(self.D.value << 8) + self.E.value]
+
+    # sta ds
+    def _op_sta(self, ins):
+        lval = self.mem[self.PC.value]
+        self.incpc()
+        hval = self.mem[self.PC.value]
+        self.incpc()
+        self.mem[(hval << 8) + lval] = self.A.value
+
+    # stax b
+    def _op_stax_b(self, ins):
+        self.mem[(self.B.value << 8) + self.C.value] = self.A.value
+
+    # stax d
+    def _op_stax_d(self, ins):
+        self.mem[(self.D.value << 8) + self.E.value] = self.A.value
+
+    # in db
+    def _op_in(self, ins):
+        pval = self.mem[self.PC.value]
+        self.incpc()
+        if self.plugin.isconnected:
+            rstat, rbyte = self.plugin.inport(pval)
+            self.A.value = rbyte
+
+    # out db
+    def _op_out(self, ins):
+        pval = self.mem[self.PC.value]
+        self.incpc()
+        if self.plugin.isconnected:
+            rstat = self.plugin.outport(pval, self.A.value)
+
+    # lhld ds
+    def _op_lhld(self, ins):
+        lval = self.mem[self.PC.value]
+        self.incpc()
+        hval = self.mem[self.PC.value]
+        self.incpc()
+        self.L.value = self.mem[(hval << 8) + lval]
+        self.H.value = self.mem[(hval << 8) + lval + 1]
+
+    # shld ds
+    def _op_shld(self, ins):
+        lval = self.mem[self.PC.value]
+        self.incpc()
+        hval = self.mem[self.PC.value]
+        self.incpc()
+        self.mem[(hval << 8) + lval] = self.L.value
+        self.mem[(hval << 8) + lval + 1] = self.H.value
+
+    # xchg
+    def _op_xchg(self, ins):
+        tmp = self.H.value
+        self.H.value = self.D.value
+        self.D.value = tmp
+        tmp = self.L.value
+        self.L.value = self.E.value
+        self.E.value = tmp
+
+    # add r
+    def _op_add(self, ins):
+        sreg = ins - 0x80
+        opval = 0
+        if sreg == 0x0:
+            opval = self.B.value
+        elif sreg == 0x1:
+            opval = self.C.value
+        elif sreg == 0x2:
+            opval = self.D.value
+        elif sreg == 0x3:
+            opval = self.E.value
+        elif sreg == 0x4:
+            opval = self.H.value
+        elif sreg == 0x5:
+            opval = self.L.value
+        elif sreg == 0x6:
+            opval = self.getM()
+        elif sreg == 0x7:
+            opval = self.A.value
+        fval = self.A.value + opval
+        self.resetflags()
+        self.setsignflag(fval)
+        self.setzeroflag(fval)
+        self.setauxicarryflag(self.iscaseauxcarry(opval, self.A.value))
+        self.setparityflag(fval)
+        if fval > 0xFF:
+            self.setcarryflag(1)
+        self.A.value = fval
+
+    # adi db
+    def _op_adi(self, ins):
+        opval = self.mem[self.PC.value]
+        self.incpc()
+        fval = self.A.value + opval
+        self.resetflags()
+        self.setsignflag(fval)
+        self.setzeroflag(fval)
+        self.setauxicarryflag(self.iscaseauxcarry(opval, self.A.value))
+        self.setparityflag(fval)
+        if fval > 0xFF:
+            self.setcarryflag(1)
+        self.A.value = fval
+
+    # sub r
+    def _op_sub(self, ins):
+        sreg = ins - 0x90
+        opval = 0
+        if sreg == 0x0:
+            opval = self.B.value
+        elif sreg == 0x1:
+            opval = self.C.value
+        elif sreg == 0x2:
+            opval = self.D.value
+        elif sreg == 0x3:
+            opval = self.E.value
+        elif sreg == 0x4:
+            opval = self.H.value
+        elif sreg == 0x5:
+            opval = self.L.value
+        elif sreg == 0x6:
+            opval = self.getM()
+        elif sreg == 0x7:
+            opval = self.A.value
+        fval = self.A.value - opval
+        self.resetflags()
+        self.setsignflag(fval)
+        self.setzeroflag(fval)
+        self.setauxicarryflag(
+            self.iscaseauxcarry(self.ln2comp(opval), self.A.value)
+        )
+        self.setparityflag(fval)
+        if self.A.value < opval:
+            self.setcarryflag(1)
+        self.A.value = fval
+
+    # sui db
+    def _op_sui(self, ins):
+        opval = self.mem[self.PC.value]
+        self.incpc()
+        fval = self.A.value - opval
+        self.resetflags()
+        self.setsignflag(fval)
+        self.setzeroflag(fval)
+        self.setauxicarryflag(
+            self.iscaseauxcarry(self.ln2comp(opval), self.A.value)
+        )
+        self.setparityflag(fval)
+        if self.A.value < opval:
+            self.setcarryflag(1)
+        self.A.value = fval
+
+    # inr r
+    def _op_inr(self, ins):
+        sreg = ((ins & 0x30) >> 3) + ((ins & 0x08) >> 3)
+        fval = 0
+        if sreg == 0x0:
+            fval = self.B.value + 0x01
+            self.setauxicarryflag(self.iscaseauxcarry(0x01, self.B.value))
+            self.B.value = fval
+        elif sreg == 0x1:
+            fval = self.C.value + 0x01
+            self.setauxicarryflag(self.iscaseauxcarry(0x01, self.C.value))
+            self.C.value = fval
+        elif sreg == 0x2:
+            fval = self.D.value + 0x01
+            self.setauxicarryflag(self.iscaseauxcarry(0x01, self.D.value))
+            self.D.value = fval
+        elif sreg == 0x3:
+            fval = self.E.value + 0x01
+            self.setauxicarryflag(self.iscaseauxcarry(0x01, self.E.value))
+            self.E.value = fval
+        elif sreg == 0x4:
+            fval = self.H.value + 0x01
+            self.setauxicarryflag(self.iscaseauxcarry(0x01, self.H.value))
+            self.H.value = fval
+        elif sreg == 0x5:
+            fval = self.L.value + 0x01
+            self.setauxicarryflag(self.iscaseauxcarry(0x01, self.L.value))
+            self.L.value = fval
+        elif sreg == 0x6:
+            fval = self.getM() + 0x01
+            self.setauxicarryflag(self.iscaseauxcarry(0x01, self.getM()))
+            self.setM(fval)
+        elif sreg == 0x7:
+            fval = self.A.value + 0x01
+            self.setauxicarryflag(self.iscaseauxcarry(0x01, self.A.value))
             self.A.value = fval
-            return
-        # sub r
-        elif ins & 0xF8 == 0x90:
-            sreg = ins - 0x90
-            opval = 0
-            if sreg == 0x0:
-                opval = self.B.value
-            elif sreg == 0x1:
-                opval = self.C.value
-            elif sreg == 0x2:
-                opval = self.D.value
-            elif sreg == 0x3:
-                opval = self.E.value
-            elif sreg == 0x4:
-                opval = self.H.value
-            elif sreg == 0x5:
-                opval = self.L.value
-            elif sreg == 0x6:
-                opval = self.getM()
-            elif sreg == 0x7:
-                opval = self.A.value
-            fval = self.A.value - opval
-            self.resetflags()
-            self.setsignflag(fval)
-            self.setzeroflag(fval)
+        self.setsignflag(fval)
+        self.setzeroflag(fval)
+        self.setparityflag(fval)
+
+    # dcr r
+    def _op_dcr(self, ins):
+        sreg = ((ins & 0x30) >> 3) + ((ins & 0x08) >> 3)
+        fval = 0
+        if sreg == 0x0:
+            fval = self.B.value - 0x01
             self.setauxicarryflag(
-                self.iscaseauxcarry(self.ln2comp(opval), self.A.value)
+                self.iscaseauxcarry(self.ln2comp(0x01), self.B.value)
             )
-            self.setparityflag(fval)
-            if self.A.value < opval:
-                self.setcarryflag(1)
-            self.A.value = fval
-            return
-        # sui db
-        elif ins == 0xD6:
-            opval = self.memory[self.PC.value].value
-            self.incpc()
-            fval = self.A.value - opval
-            self.resetflags()
-            self.setsignflag(fval)
-            self.setzeroflag(fval)
+            self.B.value = fval
+        elif sreg == 0x1:
+            fval = self.C.value - 0x01
             self.setauxicarryflag(
-                self.iscaseauxcarry(self.ln2comp(opval), self.A.value)
+                self.iscaseauxcarry(self.ln2comp(0x01), self.C.value)
+            )
+            self.C.value = fval
+        elif sreg == 0x2:
+            fval = self.D.value - 0x01
+            self.setauxicarryflag(
+                self.iscaseauxcarry(self.ln2comp(0x01), self.D.value)
+            )
+            self.D.value = fval
+        elif sreg == 0x3:
+            fval = self.E.value - 0x01
+            self.setauxicarryflag(
+                self.iscaseauxcarry(self.ln2comp(0x01), self.E.value)
+            )
+            self.E.value = fval
+        elif sreg == 0x4:
+            fval = self.H.value - 0x01
+            self.setauxicarryflag(
+                self.iscaseauxcarry(self.ln2comp(0x01), self.H.value)
+            )
+            self.H.value = fval
+        elif sreg == 0x5:
+            fval = self.L.value - 0x01
+            self.setauxicarryflag(
+                self.iscaseauxcarry(self.ln2comp(0x01), self.L.value)
+            )
+            self.L.value = fval
+        elif sreg == 0x6:
+            fval = self.getM() - 0x01
+            self.setauxicarryflag(
+                self.iscaseauxcarry(self.ln2comp(0x01), self.getM())
+            )
+            self.setM(fval)
+        elif sreg == 0x7:
+            fval = self.A.value - 0x01
+            self.setauxicarryflag(
+                self.iscaseauxcarry(self.ln2comp(0x01), self.A.value)
             )
-            self.setparityflag(fval)
-            if self.A.value < opval:
-                self.setcarryflag(1)
             self.A.value = fval
-            return
-        # inr r
-        elif (ins & 0xCF == 0x0C) or (ins & 0xCF == 0x04):
-            sreg = ((ins & 0x30) >> 3) + ((ins & 0x08) >> 3)
-            fval = 0
-            if sreg == 0x0:
-                fval = self.B.value + 0x01
-                self.setauxicarryflag(self.iscaseauxcarry(0x01, self.B.value))
-                self.B.value = fval
-            elif sreg == 0x1:
-                fval = self.C.value + 0x01
-                self.setauxicarryflag(self.iscaseauxcarry(0x01, self.C.value))
-                self.C.value = fval
-            elif sreg == 0x2:
-                fval = self.D.value + 0x01
-                self.setauxicarryflag(self.iscaseauxcarry(0x01, self.D.value))
-                self.D.value = fval
-            elif sreg == 0x3:
-                fval = self.E.value + 0x01
-                self.setauxicarryflag(self.iscaseauxcarry(0x01, self.E.value))
-                self.E.value = fval
-            elif sreg == 0x4:
-                fval = self.H.value + 0x01
-                self.setauxicarryflag(self.iscaseauxcarry(0x01, self.H.value))
-                self.H.value = fval
-            elif sreg == 0x5:
-                fval = self.L.value + 0x01
-                self.setauxicarryflag(self.iscaseauxcarry(0x01, self.L.value))
-                self.L.value = fval
-            elif sreg == 0x6:
-                fval = self.getM() + 0x01
-                self.setauxicarryflag(self.iscaseauxcarry(0x01, self.getM()))
-                self.setM(fval)
-            elif sreg == 0x7:
-                fval = self.A.value + 0x01
-                self.setauxicarryflag(self.iscaseauxcarry(0x01, self.A.value))
-                self.A.value = fval
-            self.setsignflag(fval)
-            self.setzeroflag(fval)
-            self.setparityflag(fval)
-            return
-        # dcr r
-        elif (ins & 0xCF == 0x0D) or (ins & 0xCF == 0x05):
-            sreg = ((ins & 0x30) >> 3) + ((ins & 0x08) >> 3)
-            fval = 0
-            if sreg == 0x0:
-                fval = self.B.value - 0x01
-                self.setauxicarryflag(
-                    self.iscaseauxcarry(self.ln2comp(0x01), self.B.value)
-                )
-                self.B.value = fval
-            elif sreg == 0x1:
-                fval = self.C.value - 0x01
-                self.setauxicarryflag(
-                    self.iscaseauxcarry(self.ln2comp(0x01), self.C.value)
-                )
-                self.C.value = fval
-            elif sreg == 0x2:
-                fval = self.D.value - 0x01
-                self.setauxicarryflag(
-                    self.iscaseauxcarry(self.ln2comp(0x01), self.D.value)
-                )
-                self.D.value = fval
-            elif sreg == 0x3:
-                fval = self.E.value - 0x01
-                self.setauxicarryflag(
-                    self.iscaseauxcarry(self.ln2comp(0x01), self.E.value)
-                )
-                self.E.value = fval
-            elif sreg == 0x4:
-                fval = self.H.value - 0x01
-                self.setauxicarryflag(
-                    self.iscaseauxcarry(self.ln2comp(0x01), self.H.value)
-                )
-                self.H.value = fval
-            elif sreg == 0x5:
-                fval = self.L.value - 0x01
-                self.setauxicarryflag(
-                    self.iscaseauxcarry(self.ln2comp(0x01), self.L.value)
-                )
-                self.L.value = fval
-            elif sreg == 0x6:
-                fval = self.getM() - 0x01
-                self.setauxicarryflag(
-                    self.iscaseauxcarry(self.ln2comp(0x01), self.getM())
-                )
-                self.setM(fval)
-            elif sreg == 0x7:
-                fval = self.A.value - 0x01
-                self.setauxicarryflag(
-                    self.iscaseauxcarry(self.ln2comp(0x01), self.A.value)
-                )
-                self.A.value = fval
-            self.setsignflag(fval)
-            self.setzeroflag(fval)
-            self.setparityflag(fval)
-            return
-        # inx rp
-        elif ins & 0xCF == 0x03:
-            sreg = (ins & 0xF0) >> 4
-            if sreg == 0x0:
-                fval = ((self.B.value << 8) + self.C.value) + 1
-                self.B.value = fval >> 8
-                self.C.value = fval & 0xFF
-
-            elif sreg == 0x1:
-                fval = ((self.D.value << 8) + self.E.value) + 1
-                self.D.value = fval >> 8
-                self.E.value = fval & 0xFF
-
-            elif sreg == 0x2:
-                fval = ((self.H.value << 8) + self.L.value) + 1
-                self.H.value = fval >> 8
-                self.L.value = fval & 0xFF
-
-            elif sreg == 0x3:
-                fval = self.SP.value + 1
-                self.SP.value = fval
-            return
-        # dcx rp
-        elif ins & 0xCF == 0x0B:
-            sreg = (ins & 0xF0) >> 4
-            if sreg == 0x0:
-                fval = ((self.B.value << 8) + self.C.value) - 1
-                self.B.value = fval >> 8
-                self.C.value = fval & 0xFF
-
-            elif sreg == 0x1:
-                fval = ((self.D.value << 8) + self.E.value) - 1
-                self.D.value = fval >> 8
-                self.E.value = fval & 0xFF
-
-            elif sreg == 0x2:
-                fval = ((self.H.value << 8) + self.L.value) - 1
-                self.H.value = fval >> 8
-                self.L.value = fval & 0xFF
-
-            elif sreg == 0x3:
-                fval = self.SP.value - 1
-                self.SP.value = fval
-            return
-        # adc r
-        elif ins & 0xFE == 0x88:
-            sreg = ins - 0x88
-            opval = 0
-            if sreg == 0x0:
-                opval = self.B.value + self.getcarryflag()
-            elif sreg == 0x1:
-                opval = self.C.value + self.getcarryflag()
-            elif sreg == 0x2:
-                opval = self.D.value + self.getcarryflag()
-            elif sreg == 0x3:
-                opval = self.E.value + self.getcarryflag()
-            elif sreg == 0x4:
-                opval = self.H.value + self.getcarryflag()
-            elif sreg == 0x5:
-                opval = self.L.value + self.getcarryflag()
-            elif sreg == 0x6:
-                opval = self.getM() + self.getcarryflag()
-            elif sreg == 0x7:
-                opval = self.A.value + self.getcarryflag()
-            fval = self.A.value + opval
-            self.resetflags()
-            self.setsignflag(fval)
-            self.setzeroflag(fval)
-            self.setauxicarryflag(self.iscaseauxcarry(opval, self.A.value))
-            self.setparityflag(fval)
+        self.setsignflag(fval)
+        self.setzeroflag(fval)
+        self.setparityflag(fval)
+
+    # inx rp
+    def _op_inx(self, ins):
+        sreg = (ins & 0xF0) >> 4
+        if sreg == 0x0:
+            fval = ((self.B.value << 8) + self.C.value) + 1
+            self.B.value = fval >> 8
+            self.C.value = fval & 0xFF
+
+        elif sreg == 0x1:
+            fval = ((self.D.value << 8) + self.E.value) + 1
+            self.D.value = fval >> 8
+            self.E.value = fval & 0xFF
+
+        elif sreg == 0x2:
+            fval = ((self.H.value << 8) + self.L.value) + 1
+            self.H.value = fval >> 8
+            self.L.value = fval & 0xFF
+
+        elif sreg == 0x3:
+            fval = self.SP.value + 1
+            self.SP.value = fval
+
+    # dcx rp
+    def _op_dcx(self, ins):
+        sreg = (ins & 0xF0) >> 4
+        if sreg == 0x0:
+            fval = ((self.B.value << 8) + self.C.value) - 1
+            self.B.value = fval >> 8
+            self.C.value = fval & 0xFF
+
+        elif sreg == 0x1:
+            fval = ((self.D.value << 8) + self.E.value) - 1
+            self.D.value = fval >> 8
+            self.E.value = fval & 0xFF
+
+        elif sreg == 0x2:
+            fval = ((self.H.value << 8) + self.L.value) - 1
+            self.H.value = fval >> 8
+            self.L.value = fval & 0xFF
+
+        elif sreg == 0x3:
+            fval = self.SP.value - 1
+            self.SP.value = fval
+
+    # adc r
+    def _op_adc(self, ins):
+        sreg = ins - 0x88
+        opval = 0
+        if sreg == 0x0:
+            opval = self.B.value + self.getcarryflag()
+        elif sreg == 0x1:
+            opval = self.C.value + self.getcarryflag()
+        elif sreg == 0x2:
+            opval = self.D.value + self.getcarryflag()
+        elif sreg == 0x3:
+            opval = self.E.value + self.getcarryflag()
+        elif sreg == 0x4:
+            opval = self.H.value + self.getcarryflag()
+        elif sreg == 0x5:
+            opval = self.L.value + self.getcarryflag()
+        elif sreg == 0x6:
+            opval = self.getM() + self.getcarryflag()
+        elif sreg == 0x7:
+            opval = self.A.value + self.getcarryflag()
+        fval = self.A.value + opval
+        self.resetflags()
+        self.setsignflag(fval)
+        self.setzeroflag(fval)
+        self.setauxicarryflag(self.iscaseauxcarry(opval, self.A.value))
+        self.setparityflag(fval)
+        if fval > 0xFF:
+            self.setcarryflag(1)
+        self.A.value = fval
+
+    # aci db
+    def _op_aci(self, ins):
+        opval = self.mem[self.PC.value] + self.getcarryflag()
+        self.incpc()
+        fval = self.A.value + opval
+        self.resetflags()
+        self.setsignflag(fval)
+        self.setzeroflag(fval)
+        self.setauxicarryflag(self.iscaseauxcarry(opval, self.A.value))
+        self.setparityflag(fval)
+        if fval > 0xFF:
+            self.setcarryflag(1)
+        self.A.value = fval
+
+    # sbb r
+    def _op_sbb(self, ins):
+        sreg = ins - 0x98
+        opval = 0
+        if sreg == 0x0:
+            opval = self.B.value
+        elif sreg == 0x1:
+            opval = self.C.value
+        elif sreg == 0x2:
+            opval = self.D.value
+        elif sreg == 0x3:
+            opval = self.E.value
+        elif sreg == 0x4:
+            opval = self.H.value
+        elif sreg == 0x5:
+            opval = self.L.value
+        elif sreg == 0x6:
+            opval = self.getM()
+        elif sreg == 0x7:
+            opval = self.A.value
+        opval += self.getcarryflag()
+        fval = self.A.value - opval
+        self.resetflags()
+        self.setsignflag(fval)
+        self.setzeroflag(fval)
+        self.setauxicarryflag(
+            self.iscaseauxcarry(self.ln2comp(opval), self.A.value)
+        )
+        self.setparityflag(fval)
+        if self.A.value < opval:
+            self.setcarryflag(1)
+        self.A.value = fval
+
+    # sbb db
+    def _op_sbb_db(self, ins):
+        opval = self.mem[self.PC.value] + self.getcarryflag()
+        self.incpc()
+        fval = self.A.value - opval
+        self.resetflags()
+        self.setsignflag(fval)
+        self.setzeroflag(fval)
+        self.setauxicarryflag(
+            self.iscaseauxcarry(self.ln2comp(opval), self.A.value)
+        )
+        self.setparityflag(fval)
+        if self.A.value < opval:
+            self.setcarryflag(1)
+        self.A.value = fval
+
+    # dad rp
+    def _op_dad(self, ins):
+        sreg = (ins & 0xF0) >> 4
+        fval = (self.H.value << 4) + self.L.value
+        if sreg == 0x0:
+            fval += (self.B.value << 8) + self.C.value
+
+        elif sreg == 0x1:
+            fval += (self.D.value << 8) + self.E.value
+
+        elif sreg == 0x2:
+            fval += (self.H.value << 8) + self.L.value
+
+        elif sreg == 0x3:
+            fval += self.SP.value
+        if fval > 0xFF:
+            self.setcarryflag(1)
+        self.H.value = fval >> 8
+        self.L.value = fval & 0xFF
+
+    # daa
+    def _op_daa(self, ins):
+        acf = self.getauxicarryflag()
+        cf = self.getcarryflag()
+        lval = self.A.value & 0x0F
+        hval = self.A.value & 0xF0
+        fval = 0
+        shouldupdate = 0
+        if acf == 1 or (lval > 0x09):
+            fval = self.A.value + 0x06
+            self.setauxicarryflag(self.iscaseauxcarry(0x06, self.A.value))
             if fval > 0xFF:
                 self.setcarryflag(1)
             self.A.value = fval
-            return
-        # aci db
-        elif ins == 0xCE:
-            opval = self.memory[self.PC.value].value + self.getcarryflag()
-            self.incpc()
-            fval = self.A.value + opval
-            self.resetflags()
-            self.setsignflag(fval)
-            self.setzeroflag(fval)
-            self.setauxicarryflag(self.iscaseauxcarry(opval, self.A.value))
-            self.setparityflag(fval)
+            shouldupdate = 1
+        if cf == 1 or (hval > 0x90):
+            fval = self.A.value + 0x60
             if fval > 0xFF:
                 self.setcarryflag(1)
             self.A.value = fval
-            return
-        # sbb r
-        elif ins & 0xFE == 0x98:
-            sreg = ins - 0x98
-            opval = 0
-            if sreg == 0x0:
-                opval = self.B.value
-            elif sreg == 0x1:
-                opval = self.C.value
-            elif sreg == 0x2:
-                opval = self.D.value
-            elif sreg == 0x3:
-                opval = self.E.value
-            elif sreg == 0x4:
-                opval = self.H.value
-            elif sreg == 0x5:
-                opval = self.L.value
-            elif sreg == 0x6:
-                opval = self.getM()
-            elif sreg == 0x7:
-                opval = self.A.value
-            opval += self.getcarryflag()
-            fval = self.A.value - opval
-            self.resetflags()
-            self.setsignflag(fval)
-            self.setzeroflag(fval)
-            self.setauxicarryflag(
-                self.iscaseauxcarry(self.ln2comp(opval), self.A.value)
-            )
-            self.setparityflag(fval)
-            if self.A.value < opval:
-                self.setcarryflag(1)
-            self.A.value = fval
-            return
-        # sbb db
-        elif ins == 0xCE:
-            opval = self.memory[self.PC.value].value + self.getcarryflag()
-            self.incpc()
-            fval = self.A.value - opval
-            self.resetflags()
+            shouldupdate = 1
+
+        if shouldupdate:
             self.setsignflag(fval)
             self.setzeroflag(fval)
-            self.setauxicarryflag(
-                self.iscaseauxcarry(self.ln2comp(opval), self.A.value)
-            )
             self.setparityflag(fval)
-            if self.A.value < opval:
-                self.setcarryflag(1)
-            self.A.value = fval
-            return
-        # dad rp
-        elif ins & 0xCF == 0x09:
-            sreg = (ins & 0xF0) >> 4
-            fval = (self.H.value << 4) + self.L.value
-            if sreg == 0x0:
-                fval += (self.B.value << 8) + self.C.value
 
-            elif sreg == 0x1:
-                fval += (self.D.value << 8) + self.E.value
+    # jc ds
+    def _op_jc(self, ins):
+        lval = self.mem[self.PC.value]
+        self.incpc()
+        hval = self.mem[self.PC.value]
+        self.incpc()
+        if self.getcarryflag() == 1:
+            self.PC.value = (hval << 8) + lval
 
-            elif sreg == 0x2:
-                fval += (self.H.value << 8) + self.L.value
+    # jm ds
+    def _op_jm(self, ins):
+        lval = self.mem[self.PC.value]
+        self.incpc()
+        hval = self.mem[self.PC.value]
+        self.incpc()
+        if self.getsignflag() == 1:
+            self.PC.value = (hval << 8) + lval
 
-            elif sreg == 0x3:
-                fval += self.SP.value
-            if fval > 0xFF:
-                self.setcarryflag(1)
-            self.H.value = fval >> 8
-            self.L.value = fval & 0xFF
-            return
-        # daa
-        elif ins == 0x27:
-            acf = self.getauxicarryflag()
-            cf = self.getcarryflag()
-            lval = self.A.value & 0x0F
-            hval = self.A.value & 0xF0
-            fval = 0
-            shouldupdate = 0
-            if acf == 1 or (lval > 0x09):
-                fval = self.A.value + 0x06
-                self.setauxicarryflag(self.iscaseauxcarry(0x06, self.A.value))
-                if fval > 0xFF:
-                    self.setcarryflag(1)
-                self.A.value = fval
-                shouldupdate = 1
-            if cf == 1 or (hval > 0x90):
-                fval = self.A.value + 0x60
-                if fval > 0xFF:
-                    self.setcarryflag(1)
-                self.A.value = fval
-                shouldupdate = 1
-
-            if shouldupdate:
-                self.setsignflag(fval)
-                self.setzeroflag(fval)
-                self.setparityflag(fval)
-                return
-        # jc ds
-        elif ins == 0xDA:
-            lval = self.memory[self.PC.value].value
-            self.incpc()
-            hval = self.memory[self.PC.value].value
-            self.incpc()
-            if self.getcarryflag() == 1:
-                self.PC.value = (hval << 8) + lval
-            return
-        # jm ds
-        elif ins == 0xFA:
-            lval = self.memory[self.PC.value].value
-            self.incpc()
-            hval = self.memory[self.PC.value].value
-            self.incpc()
-            if self.getsignflag() == 1:
-                self.PC.value = (hval << 8) + lval
-            return
-        # jmp ds
-        elif ins == 0xC3:
-            lval = self.memory[self.PC.value].value
-            self.incpc()
-            hval = self.memory[self.PC.value].value
-            self.incpc()
+    # jmp ds
+    def _op_jmp(self, ins):
+        lval = self.mem[self.PC.value]
+        self.incpc()
+        hval = self.mem[self.PC.value]
+        self.incpc()
+        self.PC.value = (hval << 8) + lval
+
+    # jnc ds
+    def _op_jnc(self, ins):
+        lval = self.mem[self.PC.value]
+        self.incpc()
+        hval = self.mem[self.PC.value]
+        self.incpc()
+        if self.getcarryflag() == 0:
             self.PC.value = (hval << 8) + lval
-            return
-        # jnc ds
-        elif ins == 0xD2:
-            lval = self.memory[self.PC.value].value
-            self.incpc()
-            hval = self.memory[self.PC.value].value
-            self.incpc()
-            if self.getcarryflag() == 0:
-                self.PC.value = (hval << 8) + lval
-            return
-        # jnz ds
-        elif ins == 0xC2:
-            lval = self.memory[self.PC.value].value
-            self.incpc()
-            hval = self.memory[self.PC.value].value
-            self.incpc()
-            if self.getzeroflag() == 0:
-                self.PC.value = (hval << 8) + lval
-            return
-        # jp ds
-        elif ins == 0xF2:
-            lval = self.memory[self.PC.value].value
-            self.incpc()
-            hval = self.memory[self.PC.value].value
-            self.incpc()
-            if self.getsignflag() == 0:
-                self.PC.value = (hval << 8) + lval
-            return
-        # jpe ds
-        elif ins == 0xEA:
-            lval = self.memory[self.PC.value].value
-            self.incpc()
-            hval = self.memory[self.PC.value].value
-            self.incpc()
-            if self.getparityflag() == 1:
-                self.PC.value = (hval << 8) + lval
-            return
-        # jpo ds
-        elif ins == 0xE2:
-            lval = self.memory[self.PC.value].value
-            self.incpc()
-            hval = self.memory[self.PC.value].value
-            self.incpc()
-            if self.getparityflag() == 0:
-                self.PC.value = (hval << 8) + lval
-            return
-        # jz ds
-        elif ins == 0xCA:
-            lval = self.memory[self.PC.value].value
-            self.incpc()
-            hval = self.memory[self.PC.value].value
-            self.incpc()
-            if self.getzeroflag() == 1:
-                self.PC.value = (hval << 8) + lval
-            return
-        # cc ds
-        elif ins == 0xDC:
-            lval = self.memory[self.PC.value].value
-            self.incpc()
-            hval = self.memory[self.PC.value].value
-            self.incpc()
-            if self.getcarryflag() == 1:
-                self.pushPC()
-                self.PC.value = (hval << 8) + lval
-            return
-        # cm ds
-        elif ins == 0xFC:
-            lval = self.memory[self.PC.value].value
-            self.incpc()
-            hval = self.memory[self.PC.value].value
-            self.incpc()
-            if self.getsignflag() == 1:
-                self.pushPC()
-                self.PC.value = (hval << 8) + lval
-            return
-        # call ds
-        elif ins == 0xCD:
-            lval = self.memory[self.PC.value].value
-            self.incpc()
-            hval = self.memory[self.PC.value].value
-            self.incpc()
+
+    # jnz ds
+    def _op_jnz(self, ins):
+        lval = self.mem[self.PC.value]
+        self.incpc()
+        hval = self.mem[self.PC.value]
+        self.incpc()
+        if self.getzeroflag() == 0:
+            self.PC.value = (hval << 8) + lval
+
+    # jp ds
+    def _op_jp(self, ins):
+        lval = self.mem[self.PC.value]
+        self.incpc()
+        hval = self.mem[self.PC.value]
+        self.incpc()
+        if self.getsignflag() == 0:
+            self.PC.value = (hval << 8) + lval
+
+    # jpe ds
+    def _op_jpe(self, ins):
+        lval = self.mem[self.PC.value]
+        self.incpc()
+        hval = self.mem[self.PC.value]
+        self.incpc()
+        if self.getparityflag() == 1:
+            self.PC.value = (hval << 8) + lval
+
+    # jpo ds
+    def _op_jpo(self, ins):
+        lval = self.mem[self.PC.value]
+        self.incpc()
+        hval = self.mem[self.PC.value]
+        self.incpc()
+        if self.getparityflag() == 0:
+            self.PC.value = (hval << 8) + lval
+
+    # jz ds
+    def _op_jz(self, ins):
+        lval = self.mem[self.PC.value]
+        self.incpc()
+        hval = self.mem[self.PC.value]
+        self.incpc()
+        if self.getzeroflag() == 1:
+            self.PC.value = (hval << 8) + lval
+
+    # cc ds
+    def _op_cc(self, ins):
+        lval = self.mem[self.PC.value]
+        self.incpc()
+        hval = self.mem[self.PC.value]
+        self.incpc()
+        if self.getcarryflag() == 1:
             self.pushPC()
             self.PC.value = (hval << 8) + lval
-            return
-        # cnc ds
-        elif ins == 0xD4:
-            lval = self.memory[self.PC.value].value
-            self.incpc()
-            hval = self.memory[self.PC.value].value
-            self.incpc()
-            if self.getcarryflag() == 0:
-                self.pushPC()
-                self.PC.value = (hval << 8) + lval
-            return
-        # cnz ds
-        elif ins == 0xC4:
-            lval = self.memory[self.PC.value].value
-            self.incpc()
-            hval = self.memory[self.PC.value].value
-            self.incpc()
-            if self.getzeroflag() == 0:
-                self.pushPC()
-                self.PC.value = (hval << 8) + lval
-            return
-        # cp ds
-        elif ins == 0xF4:
-            lval = self.memory[self.PC.value].value
-            self.incpc()
-            hval = self.memory[self.PC.value].value
-            self.incpc()
-            if self.getsignflag() == 0:
-                self.pushPC()
-                self.PC.value = (hval << 8) + lval
-            return
-        # cpe ds
-        elif ins == 0xEC:
-            lval = self.memory[self.PC.value].value
-            self.incpc()
-            hval = self.memory[self.PC.value].value
-            self.incpc()
-            if self.getparityflag() == 1:
-                self.pushPC()
-                self.PC.value = (hval << 8) + lval
-            return
-        # cpo ds
-        elif ins == 0xE4:
-            lval = self.memory[self.PC.value].value
-            self.incpc()
-            hval = self.memory[self.PC.value].value
-            self.incpc()
-            if self.getparityflag() == 0:
-                self.pushPC()
-                self.PC.value = (hval << 8) + lval
-            return
-        # cz ds
-        elif ins == 0xCC:
-            lval = self.memory[self.PC.value].value
-            self.incpc()
-            hval = self.memory[self.PC.value].value
-            self.incpc()
-            if self.getzeroflag() == 1:
-                self.pushPC()
-                self.PC.value = (hval << 8) + lval
-            return
-        # rc
-        elif ins == 0xD8:
-            if self.getcarryflag() == 1:
-                self.popPC()
-            return
-        # rm
-        elif ins == 0xF8:
-            if self.getsignflag() == 1:
-                self.popPC()
-            return
-        # ret
-        elif ins == 0xC9:
+
+    # cm ds
+    def _op_cm(self, ins):
+        lval = self.mem[self.PC.value]
+        self.incpc()
+        hval = self.mem[self.PC.value]
+        self.incpc()
+        if self.getsignflag() == 1:
+            self.pushPC()
+            self.PC.value = (hval << 8) + lval
+
+    # call ds
+    def _op_call(self, ins):
+        lval = self.mem[self.PC.value]
+        self.incpc()
+        hval = self.mem[self.PC.value]
+        self.incpc()
+        self.pushPC()
+        self.PC.value = (hval << 8) + lval
+
+    # cnc ds
+    def _op_cnc(self, ins):
+        lval = self.mem[self.PC.value]
+        self.incpc()
+        hval = self.mem[self.PC.value]
+        self.incpc()
+        if self.getcarryflag() == 0:
+            self.pushPC()
+            self.PC.value = (hval << 8) + lval
+
+    # cnz ds
+    def _op_cnz(self, ins):
+        lval = self.mem[self.PC.value]
+        self.incpc()
+        hval = self.mem[self.PC.value]
+        self.incpc()
+        if self.getzeroflag() == 0:
+            self.pushPC()
+            self.PC.value = (hval << 8) + lval
+
+    # cp ds
+    def _op_cp(self, ins):
+        lval = self.mem[self.PC.value]
+        self.incpc()
+        hval = self.mem[self.PC.value]
+        self.incpc()
+        if self.getsignflag() == 0:
+            self.pushPC()
+            self.PC.value = (hval << 8) + lval
+
+    # cpe ds
+    def _op_cpe(self, ins):
+        lval = self.mem[self.PC.value]
+        self.incpc()
+        hval = self.mem[self.PC.value]
+        self.incpc()
+        if self.getparityflag() == 1:
+            self.pushPC()
+            self.PC.value = (hval << 8) + lval
+
+    # cpo ds
+    def _op_cpo(self, ins):
+        lval = self.mem[self.PC.value]
+        self.incpc()
+        hval = self.mem[self.PC.value]
+        self.incpc()
+        if self.getparityflag() == 0:
+            self.pushPC()
+            self.PC.value = (hval << 8) + lval
+
+    # cz ds
+    def _op_cz(self, ins):
+        lval = self.mem[self.PC.value]
+        self.incpc()
+        hval = self.mem[self.PC.value]
+        self.incpc()
+        if self.getzeroflag() == 1:
+            self.pushPC()
+            self.PC.value = (hval << 8) + lval
+
+    # rc
+    def _op_rc(self, ins):
+        if self.getcarryflag() == 1:
             self.popPC()
-            return
-        # rnc ds
-        elif ins == 0xD0:
-            if self.getcarryflag() == 0:
-                self.popPC()
-            return
-        # rnz ds
-        elif ins == 0xC0:
-            if self.getzeroflag() == 0:
-                self.popPC()
-            return
-        # rp ds
-        elif ins == 0xF0:
-            if self.getsignflag() == 0:
-                self.popPC()
-            return
-        # rpe ds
-        elif ins == 0xE8:
-            if self.getparityflag() == 1:
-                self.popPC()
-            return
-        # rpo ds
-        elif ins == 0xE0:
-            if self.getparityflag() == 0:
-                self.popPC()
-            return
-        # rz ds
-        elif ins == 0xC8:
-            if self.getzeroflag() == 1:
-                self.popPC()
-            return
-        # ana r
-        elif ins & 0xF8 == 0xA0:
-            sreg = ins - 0xA0
-            opval = 0
-            if sreg == 0x0:
-                opval = self.B.value
-            elif sreg == 0x1:
-                opval = self.C.value
-            elif sreg == 0x2:
-                opval = self.D.value
-            elif sreg == 0x3:
-                opval = self.E.value
-            elif sreg == 0x4:
-                opval = self.H.value
-            elif sreg == 0x5:
-                opval = self.L.value
-            elif sreg == 0x6:
-                opval = self.getM()
-            elif sreg == 0x7:
-                opval = self.A.value
-            fval = self.A.value & opval
-            self.resetflags()
-            self.setsignflag(fval)
-            self.setzeroflag(fval)
-            self.setauxicarryflag(
-                self.iscaseauxcarry(self.ln2comp(opval), self.A.value)
-            )
-            self.setparityflag(fval)
-            self.A.value = fval
-            return
-        # ani db
-        elif ins == 0xE6:
-            opval = self.memory[self.PC.value].value
-            self.incpc()
-            fval = self.A.value & opval
-            self.resetflags()
-            self.setsignflag(fval)
-            self.setzeroflag(fval)
-            self.setauxicarryflag(1)
-            self.setparityflag(fval)
-            self.A.value = fval
-            return
-        # ora r
-        elif ins & 0xF8 == 0xB0:
-            sreg = ins - 0xB0
-            opval = 0
-            if sreg == 0x0:
-                opval = self.B.value
-            elif sreg == 0x1:
-                opval = self.C.value
-            elif sreg == 0x2:
-                opval = self.D.value
-            elif sreg == 0x3:
-                opval = self.E.value
-            elif sreg == 0x4:
-                opval = self.H.value
-            elif sreg == 0x5:
-                opval = self.L.value
-            elif sreg == 0x6:
-                opval = self.getM()
-            elif sreg == 0x7:
-                opval = self.A.value
-            fval = self.A.value | opval
-            self.resetflags()
-            self.setsignflag(fval)
-            self.setzeroflag(fval)
-            self.setparityflag(fval)
-            self.A.value = fval
-            return
-        # ori db
-        elif ins == 0xF6:
-            opval = self.memory[self.PC.value].value
-            self.incpc()
-            fval = self.A.value | opval
-            self.resetflags()
-            self.setsignflag(fval)
-            self.setzeroflag(fval)
-            self.setparityflag(fval)
-            self.A.value = fval
-            return
-        # xra r
-        elif ins & 0xF8 == 0xA8:
-            sreg = ins - 0xA8
-            opval = 0
-            if sreg == 0x0:
-                opval = self.B.value
-            elif sreg == 0x1:
-                opval = self.C.value
-            elif sreg == 0x2:
-                opval = self.D.value
-            elif sreg == 0x3:
-                opval = self.E.value
-            elif sreg == 0x4:
-                opval = self.H.value
-            elif sreg == 0x5:
-                opval = self.L.value
-            elif sreg == 0x6:
-                opval = self.getM()
-            elif sreg == 0x7:
-                opval = self.A.value
-            fval = self.A.value ^ opval
-            self.resetflags()
-            self.setsignflag(fval)
-            self.setzeroflag(fval)
-            self.setparityflag(fval)
-            self.A.value = fval
-            return
-        # xri db
-        elif ins == 0xEE:
-            opval = self.memory[self.PC.value].value
-            self.incpc()
-            fval = self.A.value ^ opval
-            self.resetflags()
-            self.setsignflag(fval)
-            self.setzeroflag(fval)
-            self.setparityflag(fval)
-            self.A.value = fval
-            return
-        # cma
-        elif ins == 0x2F:
-            fval = 0
-            for i in range(8):
-                bval = self.A.value & (0x1 << i)
-                if bval == 0:
-                    fval += 0x1 << i
-            self.A.value = fval
-            return
-        # cmp r
-        elif ins & 0xF8 == 0xB8:
-            sreg = ins - 0xB8
-            opval = 0
-            if sreg == 0x0:
-                opval = self.B.value
-            elif sreg == 0x1:
-                opval = self.C.value
-            elif sreg == 0x2:
-                opval = self.D.value
-            elif sreg == 0x3:
-                opval = self.E.value
-            elif sreg == 0x4:
-                opval = self.H.value
-            elif sreg == 0x5:
-                opval = self.L.value
-            elif sreg == 0x6:
-                opval = self.getM()
-            elif sreg == 0x7:
-                opval = self.A.value
-            fval = self.A.value - opval
-            self.resetflags()
-            self.setsignflag(fval)
-            self.setzeroflag(fval)
-            self.setauxicarryflag(
-                self.iscaseauxcarry(self.ln2comp(opval), self.A.value)
-            )
-            if self.A.value < opval:
-                self.setcarryflag(1)
-            self.setparityflag(fval)
-            return
-        # cpi db
-        elif ins == 0xFE:
-            opval = self.memory[self.PC.value].value
-            self.incpc()
-            fval = self.A.value - opval
-            self.resetflags()
-            self.setsignflag(fval)
-            self.setzeroflag(fval)
-            self.setauxicarryflag(
-                self.iscaseauxcarry(self.ln2comp(opval), self.A.value)
-            )
-            if self.A.value < opval:
-                self.setcarryflag(1)
-            self.setparityflag(fval)
-            return
-        # rlc
-        elif ins == 0x07:
-            # d7 = (self.A.value & 0x80)>>7
-            d7 = self.A.value & 0x80
-            self.setcarryflag(d7)
-            self.A.value = self.A.value << 1
-            if d7 != 0:
-                self.A.value = self.A.value | 0x01
-            return
-        # ral
-        elif ins == 0x17:
-            # d7 = (self.A.value & 0x80)>>7
-            d7 = self.A.value & 0x80
-            cf = self.getcarryflag()
-            self.setcarryflag(d7)
-            self.A.value = self.A.value << 1
-            if cf != 0:
-                self.A.value = self.A.value | 0x01
-            return
-        # rrc
-        elif ins == 0x0F:
-            d0 = self.A.value & 0x01
-            self.setcarryflag(d0)
-            self.A.value = self.A.value >> 1
-            if d0 != 0:
-                self.A.value = self.A.value | 0x80
-            return
-        # rar
-        elif ins == 0x1F:
-            d0 = self.A.value & 0x01
-            cf = self.getcarryflag()
-            self.setcarryflag(d0)
-            self.A.value = self.A.value >> 1
-            if cf != 0:
-                self.A.value = self.A.value | 0x80
-            return
-        # cmc
-        elif ins == 0x3F:
-            if self.getcarryflag() == 0:
-                self.setcarryflag(1)
-            else:
-                self.setcarryflag(0)
-            return
-        # stc
-        elif ins == 0x37:
+
+    # rm
+    def _op_rm(self, ins):
+        if self.getsignflag() == 1:
+            self.popPC()
+
+    # ret
+    def _op_ret(self, ins):
+        self.popPC()
+
+    # rnc ds
+    def _op_rnc(self, ins):
+        if self.getcarryflag() == 0:
+            self.popPC()
+
+    # rnz ds
+    def _op_rnz(self, ins):
+        if self.getzeroflag() == 0:
+            self.popPC()
+
+    # rp ds
+    def _op_rp(self, ins):
+        if self.getsignflag() == 0:
+            self.popPC()
+
+    # rpe ds
+    def _op_rpe(self, ins):
+        if self.getparityflag() == 1:
+            self.popPC()
+
+    # rpo ds
+    def _op_rpo(self, ins):
+        if self.getparityflag() == 0:
+            self.popPC()
+
+    # rz ds
+    def _op_rz(self, ins):
+        if self.getzeroflag() == 1:
+            self.popPC()
+
+    # ana r
+    def _op_ana(self, ins):
+        sreg = ins - 0xA0
+        opval = 0
+        if sreg == 0x0:
+            opval = self.B.value
+        elif sreg == 0x1:
+            opval = self.C.value
+        elif sreg == 0x2:
+            opval = self.D.value
+        elif sreg == 0x3:
+            opval = self.E.value
+        elif sreg == 0x4:
+            opval = self.H.value
+        elif sreg == 0x5:
+            opval = self.L.value
+        elif sreg == 0x6:
+            opval = self.getM()
+        elif sreg == 0x7:
+            opval = self.A.value
+        fval = self.A.value & opval
+        self.resetflags()
+        self.setsignflag(fval)
+        self.setzeroflag(fval)
+        self.setauxicarryflag(
+            self.iscaseauxcarry(self.ln2comp(opval), self.A.value)
+        )
+        self.setparityflag(fval)
+        self.A.value = fval
+
+    # ani db
+    def _op_ani(self, ins):
+        opval = self.mem[self.PC.value]
+        self.incpc()
+        fval = self.A.value & opval
+        self.resetflags()
+        self.setsignflag(fval)
+        self.setzeroflag(fval)
+        self.setauxicarryflag(1)
+        self.setparityflag(fval)
+        self.A.value = fval
+
+    # ora r
+    def _op_ora(self, ins):
+        sreg = ins - 0xB0
+        opval = 0
+        if sreg == 0x0:
+            opval = self.B.value
+        elif sreg == 0x1:
+            opval = self.C.value
+        elif sreg == 0x2:
+            opval = self.D.value
+        elif sreg == 0x3:
+            opval = self.E.value
+        elif sreg == 0x4:
+            opval = self.H.value
+        elif sreg == 0x5:
+            opval = self.L.value
+        elif sreg == 0x6:
+            opval = self.getM()
+        elif sreg == 0x7:
+            opval = self.A.value
+        fval = self.A.value | opval
+        self.resetflags()
+        self.setsignflag(fval)
+        self.setzeroflag(fval)
+        self.setparityflag(fval)
+        self.A.value = fval
+
+    # ori db
+    def _op_ori(self, ins):
+        opval = self.mem[self.PC.value]
+        self.incpc()
+        fval = self.A.value | opval
+        self.resetflags()
+        self.setsignflag(fval)
+        self.setzeroflag(fval)
+        self.setparityflag(fval)
+        self.A.value = fval
+
+    # xra r
+    def _op_xra(self, ins):
+        sreg = ins - 0xA8
+        opval = 0
+        if sreg == 0x0:
+            opval = self.B.value
+        elif sreg == 0x1:
+            opval = self.C.value
+        elif sreg == 0x2:
+            opval = self.D.value
+        elif sreg == 0x3:
+            opval = self.E.value
+        elif sreg == 0x4:
+            opval = self.H.value
+        elif sreg == 0x5:
+            opval = self.L.value
+        elif sreg == 0x6:
+            opval = self.getM()
+        elif sreg == 0x7:
+            opval = self.A.value
+        fval = self.A.value ^ opval
+        self.resetflags()
+        self.setsignflag(fval)
+        self.setzeroflag(fval)
+        self.setparityflag(fval)
+        self.A.value = fval
+
+    # xri db
+    def _op_xri(self, ins):
+        opval = self.mem[self.PC.value]
+        self.incpc()
+        fval = self.A.value ^ opval
+        self.resetflags()
+        self.setsignflag(fval)
+        self.setzeroflag(fval)
+        self.setparityflag(fval)
+        self.A.value = fval
+
+    # cma
+    def _op_cma(self, ins):
+        fval = 0
+        for i in range(8):
+            bval = self.A.value & (0x1 << i)
+            if bval == 0:
+                fval += 0x1 << i
+        self.A.value = fval
+
+    # cmp r
+    def _op_cmp(self, ins):
+        sreg = ins - 0xB8
+        opval = 0
+        if sreg == 0x0:
+            opval = self.B.value
+        elif sreg == 0x1:
+            opval = self.C.value
+        elif sreg == 0x2:
+            opval = self.D.value
+        elif sreg == 0x3:
+            opval = self.E.value
+        elif sreg == 0x4:
+            opval = self.H.value
+        elif sreg == 0x5:
+            opval = self.L.value
+        elif sreg == 0x6:
+            opval = self.getM()
+        elif sreg == 0x7:
+            opval = self.A.value
+        fval = self.A.value - opval
+        self.resetflags()
+        self.setsignflag(fval)
+        self.setzeroflag(fval)
+        self.setauxicarryflag(
+            self.iscaseauxcarry(self.ln2comp(opval), self.A.value)
+        )
+        if self.A.value < opval:
             self.setcarryflag(1)
-            return
-        # push rp
-        elif ins & 0xCF == 0xC5:
-            sreg = (ins - 0xC5) >> 4
-            if sreg == 0x0:
-                self.push(self.C.value)
-                self.push(self.B.value)
-            elif sreg == 0x1:
-                self.push(self.E.value)
-                self.push(self.D.value)
-            elif sreg == 0x2:
-                self.push(self.L.value)
-                self.push(self.H.value)
-            elif sreg == 0x3:
-                self.push(self.F.value)
-                self.push(self.A.value)
-            return
-        # pop rp
-        elif ins & 0xCF == 0xC1:
-            sreg = (ins - 0xC1) >> 4
-            if sreg == 0x0:
-                self.B.value = self.pop()
-                self.C.value = self.pop()
-            elif sreg == 0x1:
-                self.D.value = self.pop()
-                self.E.value = self.pop()
-            elif sreg == 0x2:
-                self.H.value = self.pop()
-                self.L.value = self.pop()
-            elif sreg == 0x3:
-                self.A.value = self.pop()
-                self.F.value = self.pop()
-            return
+        self.setparityflag(fval)
+
+    # cpi db
+    def _op_cpi(self, ins):
+        opval = self.mem[self.PC.value]
+        self.incpc()
+        fval = self.A.value - opval
+        self.resetflags()
+        self.setsignflag(fval)
+        self.setzeroflag(fval)
+        self.setauxicarryflag(
+            self.iscaseauxcarry(self.ln2comp(opval), self.A.value)
+        )
+        if self.A.value < opval:
+            self.setcarryflag(1)
+        self.setparityflag(fval)
+
+    # rlc
+    def _op_rlc(self, ins):
+        # d7 = (self.A.value & 0x80)>>7
+        d7 = self.A.value & 0x80
+        self.setcarryflag(d7)
+        self.A.value = self.A.value << 1
+        if d7 != 0:
+            self.A.value = self.A.value | 0x01
+
+    # ral
+    def _op_ral(self, ins):
+        # d7 = (self.A.value & 0x80)>>7
+        d7 = self.A.value & 0x80
+        cf = self.getcarryflag()
+        self.setcarryflag(d7)
+        self.A.value = self.A.value << 1
+        if cf != 0:
+            self.A.value = self.A.value | 0x01
+
+    # rrc
+    def _op_rrc(self, ins):
+        d0 = self.A.value & 0x01
+        self.setcarryflag(d0)
+        self.A.value = self.A.value >> 1
+        if d0 != 0:
+            self.A.value = self.A.value | 0x80
+
+    # rar
+    def _op_rar(self, ins):
+        d0 = self.A.value & 0x01
+        cf = self.getcarryflag()
+        self.setcarryflag(d0)
+        self.A.value = self.A.value >> 1
+        if cf != 0:
+            self.A.value = self.A.value | 0x80
+
+    # cmc
+    def _op_cmc(self, ins):
+        if self.getcarryflag() == 0:
+            self.setcarryflag(1)
+        else:
+            self.setcarryflag(0)
+
+    # stc
+    def _op_stc(self, ins):
+        self.setcarryflag(1)
+
+    # push rp
+    def _op_push(self, ins):
+        sreg = (ins - 0xC5) >> 4
+        if sreg == 0x0:
+            self.push(self.C.value)
+            self.push(self.B.value)
+        elif sreg == 0x1:
+            self.push(self.E.value)
+            self.push(self.D.value)
+        elif sreg == 0x2:
+            self.push(self.L.value)
+            self.push(self.H.value)
+        elif sreg == 0x3:
+            self.push(self.F.value)
+            self.push(self.A.value)
+
+    # pop rp
+    def _op_pop(self, ins):
+        sreg = (ins - 0xC1) >> 4
+        if sreg == 0x0:
+            self.B.value = self.pop()
+            self.C.value = self.pop()
+        elif sreg == 0x1:
+            self.D.value = self.pop()
+            self.E.value = self.pop()
+        elif sreg == 0x2:
+            self.H.value = self.pop()
+            self.L.value = self.pop()
+        elif sreg == 0x3:
+            self.A.value = self.pop()
+            self.F.value = self.pop()
+
 
     def iscaseauxcarry(self, val1, val2):
         n1 = val1 & 0x0F
@@ -1572,11 +1577,11 @@ class emu8085:
 
     def getM(self):
         # print((self.H.value << 8) + self.L.value)
-        return self.memory[(self.H.value << 8) + self.L.value].value
+        return self.mem[(self.H.value << 8) + self.L.value]
 
     def setM(self, val):
         # print((self.H.value << 8) + self.L.value)
-        self.memory[(self.H.value << 8) + self.L.value].value = val
+        self.mem[(self.H.value << 8) + self.L.value] = val & 0xFF
 
     def incpc(self):
         self.PC.value = self.PC.value + 1
@@ -1643,6 +1648,100 @@ class emu8085:
         return r & val
 
 
+# Opcode -> emu8085 handler. Each opcode gets the first pattern it matches,
+# in the order of the original if/elif chain in runcrntins(); opcodes that
+# match nothing (EI, DI, RST, PCHL, ...) execute as no-ops like before.
+_OPCODE_PATTERNS = (
+    (0xFF, 0x00, emu8085._op_nop),
+    (0xF8, 0x40, emu8085._op_mov_b),
+    (0xF8, 0x48, emu8085._op_mov_c),
+    (0xF8, 0x50, emu8085._op_mov_d),
+    (0xF8, 0x58, emu8085._op_mov_e),
+    (0xF8, 0x60, emu8085._op_mov_h),
+    (0xF8, 0x68, emu8085._op_mov_l),
+    (0xF8, 0x70, emu8085._op_mov_m),
+    (0xF8, 0x78, emu8085._op_mov_a),
+    (0xC7, 0x06, emu8085._op_mvi),
+    (0xCF, 0x01, emu8085._op_lxi),
+    (0xFF, 0x3A, emu8085._op_lda),
+    (0xFF, 0x0A, emu8085._op_ldax_b),
+    (0xFF, 0x1A, emu8085._op_ldax_d),
+    (0xFF, 0x32, emu8085._op_sta),
+    (0xFF, 0x02, emu8085._op_stax_b),
+    (0xFF, 0x12, emu8085._op_stax_d),
+    (0xFF, 0xDB, emu8085._op_in),
+    (0xFF, 0xD3, emu8085._op_out),
+    (0xFF, 0x2A, emu8085._op_lhld),
+    (0xFF, 0x22, emu8085._op_shld),
+    (0xFF, 0xEB, emu8085._op_xchg),
+    (0xF8, 0x80, emu8085._op_add),
+    (0xFF, 0xC6, emu8085._op_adi),
+    (0xF8, 0x90, emu8085._op_sub),
+    (0xFF, 0xD6, emu8085._op_sui),
+    (0xC7, 0x04, emu8085._op_inr),
+    (0xC7, 0x05, emu8085._op_dcr),
+    (0xCF, 0x03, emu8085._op_inx),
+    (0xCF, 0x0B, emu8085._op_dcx),
+    (0xFE, 0x88, emu8085._op_adc),
+    (0xFF, 0xCE, emu8085._op_aci),
+    (0xFE, 0x98, emu8085._op_sbb),
+    (0xFF, 0xCE, emu8085._op_sbb_db),  # shadowed by ACI, as in the old chain
+    (0xCF, 0x09, emu8085._op_dad),
+    (0xFF, 0x27, emu8085._op_daa),
+    (0xFF, 0xDA, emu8085._op_jc),
+    (0xFF, 0xFA, emu8085._op_jm),
+    (0xFF, 0xC3, emu8085._op_jmp),
+    (0xFF, 0xD2, emu8085._op_jnc),
+    (0xFF, 0xC2, emu8085._op_jnz),
+    (0xFF, 0xF2, emu8085._op_jp),
+    (0xFF, 0xEA, emu8085._op_jpe),
+    (0xFF, 0xE2, emu8085._op_jpo),
+    (0xFF, 0xCA, emu8085._op_jz),
+    (0xFF, 0xDC, emu8085._op_cc),
+    (0xFF, 0xFC, emu8085._op_cm),
+    (0xFF, 0xCD, emu8085._op_call),
+    (0xFF, 0xD4, emu8085._op_cnc),
+    (0xFF, 0xC4, emu8085._op_cnz),
+    (0xFF, 0xF4, emu8085._op_cp),
+    (0xFF, 0xEC, emu8085._op_cpe),
+    (0xFF, 0xE4, emu8085._op_cpo),
+    (0xFF, 0xCC, emu8085._op_cz),
+    (0xFF, 0xD8, emu8085._op_rc),
+    (0xFF, 0xF8, emu8085._op_rm),
+    (0xFF, 0xC9, emu8085._op_ret),
+    (0xFF, 0xD0, emu8085._op_rnc),
+    (0xFF, 0xC0, emu8085._op_rnz),
+    (0xFF, 0xF0, emu8085._op_rp),
+    (0xFF, 0xE8, emu8085._op_rpe),
+    (0xFF, 0xE0, emu8085._op_rpo),
+    (0xFF, 0xC8, emu8085._op_rz),
+    (0xF8, 0xA0, emu8085._op_ana),
+    (0xFF, 0xE6, emu8085._op_ani),
+    (0xF8, 0xB0, emu8085._op_ora),
+    (0xFF, 0xF6, emu8085._op_ori),
+    (0xF8, 0xA8, emu8085._op_xra),
+    (0xFF, 0xEE, emu8085._op_xri),
+    (0xFF, 0x2F, emu8085._op_cma),
+    (0xF8, 0xB8, emu8085._op_cmp),
+    (0xFF, 0xFE, emu8085._op_cpi),
+    (0xFF, 0x07, emu8085._op_rlc),
+    (0xFF, 0x17, emu8085._op_ral),
+    (0xFF, 0x0F, emu8085._op_rrc),
+    (0xFF, 0x1F, emu8085._op_rar),
+    (0xFF, 0x3F, emu8085._op_cmc),
+    (0xFF, 0x37, emu8085._op_stc),
+    (0xCF, 0xC5, emu8085._op_push),
+    (0xCF, 0xC1, emu8085._op_pop),
+)
+_OPCODE_TABLE = tuple(
+    next(
+        (op_fn for mask, value, op_fn in _OPCODE_PATTERNS if op & mask == value),
+        emu8085._op_nop,
+    )
+    for op in range(0x100)
+)
+
+
 def checkhex(v: str):
     if v[-1] != "H" or not (len(v) == 3 or len(v) == 5):
         return False
@@ -1705,6 +1804,7 @@ class assembler:
         self.pmemory = []
         self.dbglinecache = []
         self.writtenaddresses = []
+        self.writtencount = 0
 
         for i in range(0xFFFF):
             self.pmemory.append(0)
@@ -1727,6 +1827,7 @@ class assembler:
             self.pmemory[i] = 0
             self.dbglinecache[i] = 0
             self.writtenaddresses[i] = 0
+        self.writtencount = 0
 
         self.plsize = []
         self.poffset = []
@@ -2204,6 +2305,7 @@ class assembler:
                 if self.writtenaddresses[self.ploadoff + self.cprogmemoff] != 0:
                     return False, ErrorInfo("memory override on same address", line_num)
                 self.writtenaddresses[self.ploadoff + self.cprogmemoff] = 1
+                self.writtencount += 1
                 self.cprogmemoff += 1
         bl, ml = self.resolvelabels()
         if bl == False:
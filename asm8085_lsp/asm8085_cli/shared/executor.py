@@ -1,10 +1,21 @@
 """Program execution helpers."""
 
+import gc
+from collections import namedtuple
+from contextlib import contextmanager
+
 from . import emu8085
 from .assembly import assemble_or_exit, load_source_file
-from .disasm import disassemble_instruction, get_instruction_cycles
+from .disasm import INSTRUCTION_CYCLES, disassemble_instruction, get_instruction_cycles
 from .registers import snapshot_registers
 
+# Result of ProgramExecutor.step_instruction(); fixed fields so the hot
+# loops read attributes instead of hashing dict keys every step.
+StepResult = namedtuple(
+    "StepResult",
+    "halted pc instr cycles size pc_after branch_taken regs_before regs",
+)
+
 
 def resolve_step_limit(args):
     """Determine step limit and whether a hard cap is enforced."""
@@ -16,6 +27,23 @@ def resolve_step_limit(args):
     return unsafe_value, True
 
 
+@contextmanager
+def gc_paused():
+    """Suspend the cyclic garbage collector for a tight emulation loop.
+
+    Stepping allocates many short-lived objects but no reference cycles, so
+    collections during the loop are pure overhead. The previous GC state is
+    restored on exit.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
 class ProgramExecutor:
     """Utility for loading and stepping through a program."""
 
@@ -33,12 +61,22 @@ class ProgramExecutor:
 
     def reset_state(self):
         self.cpu = emu8085()
-        for i, byte_val in enumerate(self.asm_obj.pmemory):
-            self.cpu.memory[i].value = byte_val
+        self.cpu.loadbinary(self.asm_obj.pmemory)
+        self.cpu.PC.value = self.asm_obj.ploadoff
+        # Immutable 64K snapshot; indexing yields ints like cpu.mem
+        self.initial_memory = bytes(self.cpu.mem)
+        self.total_cycles = 0
+        self.steps_executed = 0
+
+    def reset(self):
+        """Rewind to the freshly loaded program without reassembling.
+
+        Reuses the existing CPU: registers and halt state are cleared and
+        memory is restored from initial_memory.
+        """
+        self.cpu.reset()
+        self.cpu.mem[:] = self.initial_memory
         self.cpu.PC.value = self.asm_obj.ploadoff
-        self.initial_memory = [
-            self.cpu.memory[i].value for i in range(len(self.cpu.memory))
-        ]
         self.total_cycles = 0
         self.steps_executed = 0
 
@@ -50,23 +88,41 @@ class ProgramExecutor:
             return self.asm_obj.labeloff
         return {}
 
+    def step_cycles(self):
+        """Execute one instruction and return only its cycle count.
+
+        Lean variant of step_instruction() for callers that just run the
+        program (benchmarks): no disassembly, register snapshots or dict.
+        """
+        cpu = self.cpu
+        if cpu.haulted:
+            return 0
+        cycles = INSTRUCTION_CYCLES[cpu.mem[cpu.PC.value]]
+        cpu.runcrntins()
+        self.total_cycles += cycles
+        self.steps_executed += 1
+        return cycles
+
     def step_instruction(self):
         """Execute one instruction and return metadata."""
         if self.cpu.haulted:
-            return {
-                "halted": True,
-                "pc": self.cpu.PC.value,
-                "instr": "HLT",
-                "cycles": 0,
-                "size": 1,
-                "pc_after": self.cpu.PC.value,
-                "branch_taken": False,
-                "regs": snapshot_registers(self.cpu),
-            }
+            pc = self.cpu.PC.value
+            regs = snapshot_registers(self.cpu)
+            return StepResult(
+                halted=True,
+                pc=pc,
+                instr="HLT",
+                cycles=0,
+                size=1,
+                pc_after=pc,
+                branch_taken=False,
+                regs_before=regs,
+                regs=regs,
+            )
 
         pc = self.cpu.PC.value
-        instr, size = disassemble_instruction(self.cpu.memory, pc)
-        cycles = get_instruction_cycles(self.cpu.memory, pc)
+        instr, size = disassemble_instruction(self.cpu.mem, pc)
+        cycles = get_instruction_cycles(self.cpu.mem, pc)
         regs_before = snapshot_registers(self.cpu)
         self.cpu.runcrntins()
         pc_after = self.cpu.PC.value
@@ -75,14 +131,14 @@ class ProgramExecutor:
         self.steps_executed += 1
         fallthrough_pc = (pc + size) & 0xFFFF
         branch_taken = pc_after != fallthrough_pc
-        return {
-            "pc": pc,
-            "instr": instr,
-            "cycles": cycles,
-            "size": size,
-            "pc_after": pc_after,
-            "branch_taken": branch_taken,
-            "regs_before": regs_before,
-            "regs": regs_after,
-            "halted": self.cpu.haulted,
-        }
+        return StepResult(
+            halted=self.cpu.haulted,
+            pc=pc,
+            instr=instr,
+            cycles=cycles,
+            size=size,
+            pc_after=pc_after,
+            branch_taken=branch_taken,
+            regs_before=regs_before,
+            regs=regs_after,
+        )
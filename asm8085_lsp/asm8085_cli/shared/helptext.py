@@ -58,6 +58,7 @@ def print_full_help():
   -e, --explain           Mathematical explanations for each operation
   -w, --auto              Auto-reload and re-run when source file changes
       --debug <file>      Interactive REPL debugger with breakpoints
+      --no-reverse        Debugger without step-back history (faster stepping)
 
 {Colors.CYAN}DEBUGGING & ANALYSIS{Colors.RESET}
   -d, --disassemble       Disassembly with opcodes, cycle counts, descriptions
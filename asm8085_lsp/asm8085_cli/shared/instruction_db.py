@@ -1,6 +1,12 @@
-"""Detailed metadata for Intel 8085 instructions."""
+"""Detailed metadata for Intel 8085 instructions.
 
-INSTRUCTION_DB = {
+The table is exposed as ``INSTRUCTION_DB``, a read-only mapping shared by
+every consumer in the process.
+"""
+
+from types import MappingProxyType
+
+_INSTRUCTION_DB = {
     # Data Transfer Instructions
     "MOV": {
         "name": "MOV (Move Register to Register)",
@@ -917,4 +923,8 @@ INSTRUCTION_DB = {
         "notes": "Useful for timing delays or placeholders",
         "related": ["HLT"],
     },
-}
\ No newline at end of file
+}
+
+
+# One read-only view of the table, shared by every consumer in the process
+INSTRUCTION_DB = MappingProxyType(_INSTRUCTION_DB)
@@ -1,19 +1,16 @@
 """registers helpers extracted from asm8085."""
 
+from collections import namedtuple
+
+
+# Immutable register snapshot, so callers can keep one without copying
+Registers = namedtuple("Registers", "A B C D E H L SP FLAGS")
+
 
 def snapshot_registers(cpu):
     """Capture current CPU register state."""
-    return {
-        "A": cpu.A.value,
-        "B": cpu.B.value,
-        "C": cpu.C.value,
-        "D": cpu.D.value,
-        "E": cpu.E.value,
-        "H": cpu.H.value,
-        "L": cpu.L.value,
-        "SP": cpu.SP.value,
-        "FLAGS": cpu.F.value,
-    }
+    a, b, c, d, e, h, l, f = cpu.regs
+    return Registers(a, b, c, d, e, h, l, cpu.SP.value, f)
 
 
 def format_flags(flags_byte):
@@ -27,9 +24,9 @@ def format_register_summary(regs):
     if not regs:
         return "<< halted >>"
     return (
-        f"A={regs['A']:02X} B={regs['B']:02X} C={regs['C']:02X} D={regs['D']:02X} "
-        f"E={regs['E']:02X} H={regs['H']:02X} L={regs['L']:02X} SP={regs['SP']:04X} "
-        f"Flags={format_flags(regs['FLAGS'])}"
+        f"A={regs.A:02X} B={regs.B:02X} C={regs.C:02X} D={regs.D:02X} "
+        f"E={regs.E:02X} H={regs.H:02X} L={regs.L:02X} SP={regs.SP:04X} "
+        f"Flags={format_flags(regs.FLAGS)}"
     )
 
 
@@ -49,8 +46,8 @@ def compute_register_differences(regs_a, regs_b):
         return f"{value:04X}"
 
     for key in keys:
-        val_a = regs_a[key] if regs_a else None
-        val_b = regs_b[key] if regs_b else None
+        val_a = getattr(regs_a, key) if regs_a else None
+        val_b = getattr(regs_b, key) if regs_b else None
         width = 4 if key == "SP" else 2
         if val_a != val_b:
             # Add arrow indicators for better visualization
@@ -65,8 +62,8 @@ def compute_register_differences(regs_a, regs_b):
             else:
                 diff_fields.append(f"{key}: {fmt(val_a, width)} ≠ {fmt(val_b, width)}")
 
-    flags_a = format_flags(regs_a["FLAGS"]) if regs_a else None
-    flags_b = format_flags(regs_b["FLAGS"]) if regs_b else None
+    flags_a = format_flags(regs_a.FLAGS) if regs_a else None
+    flags_b = format_flags(regs_b.FLAGS) if regs_b else None
     if flags_a != flags_b:
         diff_fields.append(f"Flags: {flags_a or '--'} ≠ {flags_b or '--'}")
 
@@ -84,3 +81,36 @@ def decode_flags(flag_byte):
         "P": (flag_byte >> 2) & 1,  # Parity
         "CY": (flag_byte >> 0) & 1,  # Carry
     }
+
+
+def _flag_string(flag_byte):
+    """8-char S Z - A - P - C status string, '-' for clear flags."""
+    flags = decode_flags(flag_byte)
+    return (
+        f"{'S' if flags['S'] else '-'}{'Z' if flags['Z'] else '-'}-"
+        f"{'A' if flags['AC'] else '-'}-{'P' if flags['P'] else '-'}-"
+        f"{'C' if flags['CY'] else '-'}"
+    )
+
+
+# Status strings for every flag byte, so trace loops index instead of format
+FLAG_STRINGS = tuple(_flag_string(f) for f in range(256))
+
+
+def _flag_letters(flag_byte):
+    """5-char SZAPC status string, '-' for clear flags."""
+    flags = decode_flags(flag_byte)
+    return (
+        f"{'S' if flags['S'] else '-'}{'Z' if flags['Z'] else '-'}"
+        f"{'A' if flags['AC'] else '-'}{'P' if flags['P'] else '-'}"
+        f"{'C' if flags['CY'] else '-'}"
+    )
+
+
+# Compact SZAPC strings for every flag byte, for the debugger's table rows
+FLAG_LETTERS = tuple(_flag_letters(f) for f in range(256))
+
+
+def decode_flags_str(flag_byte):
+    """Return the 8-char status string for a flag byte (e.g. "SZ-A-P-C")."""
+    return FLAG_STRINGS[flag_byte & 0xFF]
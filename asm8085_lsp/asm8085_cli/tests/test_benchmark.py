@@ -0,0 +1,47 @@
+from argparse import Namespace
+
+import pytest
+
+from asm8085_lsp.asm8085_cli.commands.benchmark import benchmark
+from asm8085_lsp.asm8085_cli.shared.colors import Colors
+
+GOOD = "ORG 0800H\nMVI A, 01H\nHLT\n"
+BAD = "ORG 0800H\nMVX A, 01H\nHLT\n"
+
+
+def write_programs(tmp_path, *sources):
+    paths = []
+    for number, source in enumerate(sources):
+        path = tmp_path / f"prog{number}.asm"
+        path.write_text(source)
+        paths.append(str(path))
+    return paths
+
+
+def test_worker_job_returns_exit_code_and_output_of_failed_assembly(tmp_path):
+    (bad,) = write_programs(tmp_path, BAD)
+    results, output, exit_code = benchmark._benchmark_job(
+        bad, Namespace(verbose=False), 1
+    )
+    assert results is None
+    assert exit_code == 1
+    assert "ASSEMBLY ERROR" in output
+
+
+@pytest.mark.parametrize("cores", [1, 2])
+def test_failed_assembly_stops_the_benchmark(tmp_path, monkeypatch, capsys, cores):
+    # cores=2 dispatches to the process pool, cores=1 runs in process
+    monkeypatch.setattr(benchmark.os, "cpu_count", lambda: cores)
+    good, bad = write_programs(tmp_path, GOOD, BAD)
+    finished = []
+    with pytest.raises(SystemExit) as exc_info:
+        for index, _, results, error in benchmark._iter_benchmarks(
+            [good, bad], Namespace(verbose=False), 1
+        ):
+            assert error is None
+            finished.append(index)
+    assert exc_info.value.code == 1
+    assert 1 not in finished
+    out = capsys.readouterr().out
+    # The assembler diagnostics follow the failing file's heading
+    assert out.index(f"Benchmarking:{Colors.RESET} {bad}") < out.index("ASSEMBLY ERROR")
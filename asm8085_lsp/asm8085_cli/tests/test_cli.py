@@ -0,0 +1,10 @@
+from asm8085_lsp.asm8085_cli.cli import expand_combined_flags
+
+
+def test_combined_flags_are_expanded():
+    assert expand_combined_flags(["-sr", "prog.asm"]) == ["-s", "-r", "prog.asm"]
+
+
+def test_flags_with_values_are_kept():
+    argv = ["-m", "3000-3010", "-c2", "-u", "--step", "-", "-sq"]
+    assert expand_combined_flags(argv) == argv
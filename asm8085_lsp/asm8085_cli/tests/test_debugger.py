@@ -0,0 +1,133 @@
+from argparse import Namespace
+
+from asm8085_lsp.asm8085_cli.commands.debug.debugger import (
+    InteractiveDebugger,
+    _memory_diff,
+    _step_writes,
+)
+from asm8085_lsp.asm8085_cli.shared.emu import emu8085
+
+
+def make_debugger(tmp_path, source):
+    path = tmp_path / "prog.asm"
+    path.write_text(source)
+    debugger = InteractiveDebugger(str(path), Namespace(verbose=False))
+    debugger.auto_display = False
+    return debugger
+
+
+def test_back_after_continue_undoes_the_run(tmp_path):
+    debugger = make_debugger(
+        tmp_path,
+        "ORG 0800H\nMVI A,11H\nSTA 3000H\nMVI A,22H\nNOP\nSTA 3000H\nHLT\n",
+    )
+    for command in ("s", "s", "s", "s", "u", "c", "u"):
+        debugger.handle_command(command)
+    assert debugger.executor.cpu.mem[0x3000] == 0x11
+
+
+def test_step_writes_cover_every_opcode():
+    cpu = emu8085()
+    for opcode in range(0x100):
+        if opcode == 0xDB:  # IN reads stdin and writes no memory
+            continue
+        cpu.reset()
+        # A B C D E H L F: BC=3010H, DE=3020H, HL=3000H, all flags set
+        cpu.regs[:] = bytes((0x5A, 0x30, 0x10, 0x30, 0x20, 0x30, 0x00, 0xFF))
+        cpu.SP.value = 0x2000
+        cpu.PC.value = 0x0800
+        cpu.mem[0x0800:0x0803] = bytes((opcode, 0x40, 0x30))  # a16 = 3040H
+        before = bytes(cpu.mem)
+        writes = set(_step_writes(cpu))
+        try:
+            cpu.runcrntins()
+        except TypeError:  # emu8085's sign-flag conditionals
+            pass
+        changed = []
+        _memory_diff(before, cpu.mem, changed)
+        assert {addr for addr, _ in changed} <= writes, hex(opcode)
+
+
+
+# emu8085 ignores LXI SP, so the stack stays at its reset value FFFFH
+CALL_PROGRAM = """ORG 0800H
+MVI A, 00H
+CALL SUB1
+NOP
+STA 3000H
+HLT
+SUB1: MVI B, 03H
+LP: INR A
+DCR B
+JNZ LP
+STA 3001H
+RET
+"""
+
+
+def test_next_steps_over_call_and_back_undoes_it(tmp_path):
+    debugger = make_debugger(tmp_path, CALL_PROGRAM)
+    cpu = debugger.executor.cpu
+    for command in ("s", "n"):
+        debugger.handle_command(command)
+    assert cpu.PC.value == 0x0805  # the NOP after the CALL
+    assert (cpu.A.value, cpu.B.value, cpu.mem[0x3001]) == (0x03, 0x00, 0x03)
+    assert cpu.mem[0xFFFE:] == bytes((0x08, 0x05))  # pushed return address
+    assert debugger.executor.steps_executed == 1 + 13
+
+    debugger.handle_command("u")
+    assert cpu.PC.value == 0x0802
+    assert (cpu.A.value, cpu.B.value, cpu.mem[0x3001]) == (0x00, 0x00, 0x00)
+    assert cpu.mem[0xFFFE:] == bytes(2)
+    assert cpu.SP.value == 0xFFFF
+    assert debugger.executor.steps_executed == 1
+
+
+def test_next_on_rst_is_a_single_step(tmp_path):
+    # emu8085 executes RST as a no-op, so there is nothing to step over; the
+    # assembler has no RST, so patch it over the NOP
+    debugger = make_debugger(tmp_path, CALL_PROGRAM)
+    debugger.executor.cpu.mem[0x0805] = 0xCF  # RST 1
+    for command in ("s", "n", "n"):
+        debugger.handle_command(command)
+    assert debugger.executor.cpu.PC.value == 0x0806
+    assert debugger.executor.steps_executed == 1 + 13 + 1
+    debugger.handle_command("u")
+    assert debugger.executor.cpu.PC.value == 0x0805
+
+
+def test_back_after_back_and_next_undoes_the_call(tmp_path):
+    debugger = make_debugger(tmp_path, CALL_PROGRAM)
+    for command in ("s", "s", "u", "n", "u"):
+        debugger.handle_command(command)
+    cpu = debugger.executor.cpu
+    assert cpu.PC.value == 0x0802
+    assert cpu.mem[0x3001] == 0
+    assert cpu.mem[0xFFFE:] == bytes(2)
+
+
+def test_history_ring_wraps_and_backs_out_to_its_oldest_entry(tmp_path):
+    debugger = make_debugger(
+        tmp_path,
+        "ORG 0800H\nLXI H, 3000H\nLP: MOV M, A\nINR A\nINX H\nPUSH H\nPOP B\n"
+        "SHLD 3100H\nJMP LP\n",
+    )
+    debugger.show_context = False
+    cpu = debugger.executor.cpu
+
+    def state():
+        return bytes(cpu.regs), cpu.SP.value, cpu.PC.value, hash(bytes(cpu.mem))
+
+    states = []
+    for _ in range(debugger.max_history + 150):
+        states.append(state())
+        debugger.command_step()
+    assert debugger._hist_len == debugger.max_history
+
+    # Only the newest max_history states can be stepped back to
+    for expected in reversed(states[-debugger.max_history :]):
+        debugger.command_back()
+        assert state() == expected
+    assert debugger.executor.steps_executed == 150
+    debugger.command_back()
+    assert state() == states[150]
@@ -0,0 +1,19 @@
+from array import array
+
+from asm8085_lsp.asm8085_cli.commands.diff.diffing import format_table_row
+
+
+def test_table_row_formats_flags_and_halted_rows():
+    trace = {
+        "count": 1,
+        "pc": array("H", [0x0800]),
+        "instr": ["MVI A, 05H"],
+        "cycles": array("B", [7]),
+        "sp": array("H", [0xFFFF]),
+        # A B C D E H L F
+        "regs": bytearray([0x05, 0x01, 0x02, 0, 0, 0, 0, 0x45]),
+    }
+    row = format_table_row(1, trace, 0)
+    assert "MVI A, 05H" in row
+    assert "05 01 02 -Z-PC" in row
+    assert format_table_row(2, trace, 1).startswith("2    << halted >>")
@@ -0,0 +1,579 @@
+import pytest
+
+from asm8085_lsp.asm8085_cli.shared.disasm import get_instruction_cycles
+from asm8085_lsp.asm8085_cli.shared.emu import emu8085
+
+# Memory the opcode under test finds: its operand bytes give a16 = 3040H,
+# and M (3000H), BC (1234H), DE (5678H), a16 and the stack hold known bytes
+INITIAL_MEMORY = {
+    0x0801: 0x40,
+    0x0802: 0x30,
+    0x3000: 0xA5,
+    0x3040: 0x3C,
+    0x3041: 0xC3,
+    0x1234: 0x7E,
+    0x5678: 0x81,
+    0x2001: 0x0B,
+    0x2002: 0x09,
+}
+
+# One line per opcode (IN, which reads stdin, excepted) and starting flags
+# (none set / S Z AC P CY set), from A=9C B=12 C=34 D=56 E=78 H=30 L=00,
+# SP=2000H and PC=0800H:
+#   "op flags: A B C D E H L F SP PC cycles [HLT] [addr=byte,...]"
+# with the memory bytes the instruction changed, or the exception it raised.
+EXPECTED = """\
+00 00: 9C 12 34 56 78 30 00 00 2000 0801 4
+00 D5: 9C 12 34 56 78 30 00 D5 2000 0801 4
+01 00: 9C 30 40 56 78 30 00 00 2000 0803 10
+01 D5: 9C 30 40 56 78 30 00 D5 2000 0803 10
+02 00: 9C 12 34 56 78 30 00 00 2000 0801 7 1234=9C
+02 D5: 9C 12 34 56 78 30 00 D5 2000 0801 7 1234=9C
+03 00: 9C 12 35 56 78 30 00 00 2000 0801 6
+03 D5: 9C 12 35 56 78 30 00 D5 2000 0801 6
+04 00: 9C 13 34 56 78 30 00 00 2000 0801 4
+04 D5: 9C 13 34 56 78 30 00 01 2000 0801 4
+05 00: 9C 11 34 56 78 30 00 04 2000 0801 4
+05 D5: 9C 11 34 56 78 30 00 05 2000 0801 4
+06 00: 9C 40 34 56 78 30 00 00 2000 0802 7
+06 D5: 9C 40 34 56 78 30 00 D5 2000 0802 7
+07 00: 39 12 34 56 78 30 00 01 2000 0801 4
+07 D5: 39 12 34 56 78 30 00 D5 2000 0801 4
+08 00: 9C 12 34 56 78 30 00 00 2000 0801 4
+08 D5: 9C 12 34 56 78 30 00 D5 2000 0801 4
+09 00: 9C 12 34 56 78 15 34 01 2000 0801 10
+09 D5: 9C 12 34 56 78 15 34 D5 2000 0801 10
+0A 00: 7E 12 34 56 78 30 00 00 2000 0801 7
+0A D5: 7E 12 34 56 78 30 00 D5 2000 0801 7
+0B 00: 9C 12 33 56 78 30 00 00 2000 0801 6
+0B D5: 9C 12 33 56 78 30 00 D5 2000 0801 6
+0C 00: 9C 12 35 56 78 30 00 04 2000 0801 4
+0C D5: 9C 12 35 56 78 30 00 05 2000 0801 4
+0D 00: 9C 12 33 56 78 30 00 04 2000 0801 4
+0D D5: 9C 12 33 56 78 30 00 05 2000 0801 4
+0E 00: 9C 12 40 56 78 30 00 00 2000 0802 7
+0E D5: 9C 12 40 56 78 30 00 D5 2000 0802 7
+0F 00: 4E 12 34 56 78 30 00 00 2000 0801 4
+0F D5: 4E 12 34 56 78 30 00 D4 2000 0801 4
+10 00: 9C 12 34 56 78 30 00 00 2000 0801 4
+10 D5: 9C 12 34 56 78 30 00 D5 2000 0801 4
+11 00: 9C 12 34 30 40 30 00 00 2000 0803 10
+11 D5: 9C 12 34 30 40 30 00 D5 2000 0803 10
+12 00: 9C 12 34 56 78 30 00 00 2000 0801 7 5678=9C
+12 D5: 9C 12 34 56 78 30 00 D5 2000 0801 7 5678=9C
+13 00: 9C 12 34 56 79 30 00 00 2000 0801 6
+13 D5: 9C 12 34 56 79 30 00 D5 2000 0801 6
+14 00: 9C 12 34 57 78 30 00 00 2000 0801 4
+14 D5: 9C 12 34 57 78 30 00 01 2000 0801 4
+15 00: 9C 12 34 55 78 30 00 04 2000 0801 4
+15 D5: 9C 12 34 55 78 30 00 05 2000 0801 4
+16 00: 9C 12 34 40 78 30 00 00 2000 0802 7
+16 D5: 9C 12 34 40 78 30 00 D5 2000 0802 7
+17 00: 38 12 34 56 78 30 00 01 2000 0801 4
+17 D5: 39 12 34 56 78 30 00 D5 2000 0801 4
+18 00: 9C 12 34 56 78 30 00 00 2000 0801 4
+18 D5: 9C 12 34 56 78 30 00 D5 2000 0801 4
+19 00: 9C 12 34 56 78 59 78 01 2000 0801 10
+19 D5: 9C 12 34 56 78 59 78 D5 2000 0801 10
+1A 00: 81 12 34 56 78 30 00 00 2000 0801 7
+1A D5: 81 12 34 56 78 30 00 D5 2000 0801 7
+1B 00: 9C 12 34 56 77 30 00 00 2000 0801 6
+1B D5: 9C 12 34 56 77 30 00 D5 2000 0801 6
+1C 00: 9C 12 34 56 79 30 00 00 2000 0801 4
+1C D5: 9C 12 34 56 79 30 00 01 2000 0801 4
+1D 00: 9C 12 34 56 77 30 00 04 2000 0801 4
+1D D5: 9C 12 34 56 77 30 00 05 2000 0801 4
+1E 00: 9C 12 34 56 40 30 00 00 2000 0802 7
+1E D5: 9C 12 34 56 40 30 00 D5 2000 0802 7
+1F 00: 4E 12 34 56 78 30 00 00 2000 0801 4
+1F D5: CE 12 34 56 78 30 00 D4 2000 0801 4
+20 00: 9C 12 34 56 78 30 00 00 2000 0801 4
+20 D5: 9C 12 34 56 78 30 00 D5 2000 0801 4
+21 00: 9C 12 34 56 78 30 40 00 2000 0803 10
+21 D5: 9C 12 34 56 78 30 40 D5 2000 0803 10
+22 00: 9C 12 34 56 78 30 00 00 2000 0803 16 3040=00,3041=30
+22 D5: 9C 12 34 56 78 30 00 D5 2000 0803 16 3040=00,3041=30
+23 00: 9C 12 34 56 78 30 01 00 2000 0801 6
+23 D5: 9C 12 34 56 78 30 01 D5 2000 0801 6
+24 00: 9C 12 34 56 78 31 00 00 2000 0801 4
+24 D5: 9C 12 34 56 78 31 00 01 2000 0801 4
+25 00: 9C 12 34 56 78 2F 00 00 2000 0801 4
+25 D5: 9C 12 34 56 78 2F 00 01 2000 0801 4
+26 00: 9C 12 34 56 78 40 00 00 2000 0802 7
+26 D5: 9C 12 34 56 78 40 00 D5 2000 0802 7
+27 00: A2 12 34 56 78 30 00 90 2000 0801 4
+27 D5: 02 12 34 56 78 30 00 11 2000 0801 4
+28 00: 9C 12 34 56 78 30 00 00 2000 0801 4
+28 D5: 9C 12 34 56 78 30 00 D5 2000 0801 4
+29 00: 9C 12 34 56 78 33 00 01 2000 0801 10
+29 D5: 9C 12 34 56 78 33 00 D5 2000 0801 10
+2A 00: 9C 12 34 56 78 C3 3C 00 2000 0803 16
+2A D5: 9C 12 34 56 78 C3 3C D5 2000 0803 16
+2B 00: 9C 12 34 56 78 2F FF 00 2000 0801 6
+2B D5: 9C 12 34 56 78 2F FF D5 2000 0801 6
+2C 00: 9C 12 34 56 78 30 01 00 2000 0801 4
+2C D5: 9C 12 34 56 78 30 01 01 2000 0801 4
+2D 00: 9C 12 34 56 78 30 FF 84 2000 0801 4
+2D D5: 9C 12 34 56 78 30 FF 85 2000 0801 4
+2E 00: 9C 12 34 56 78 30 40 00 2000 0802 7
+2E D5: 9C 12 34 56 78 30 40 D5 2000 0802 7
+2F 00: 63 12 34 56 78 30 00 00 2000 0801 4
+2F D5: 63 12 34 56 78 30 00 D5 2000 0801 4
+30 00: 9C 12 34 56 78 30 00 00 2000 0801 4
+30 D5: 9C 12 34 56 78 30 00 D5 2000 0801 4
+31 00: 9C 12 34 56 78 30 00 00 2000 0803 10
+31 D5: 9C 12 34 56 78 30 00 D5 2000 0803 10
+32 00: 9C 12 34 56 78 30 00 00 2000 0803 13 3040=9C
+32 D5: 9C 12 34 56 78 30 00 D5 2000 0803 13 3040=9C
+33 00: 9C 12 34 56 78 30 00 00 2001 0801 6
+33 D5: 9C 12 34 56 78 30 00 D5 2001 0801 6
+34 00: 9C 12 34 56 78 30 00 84 2000 0801 10 3000=A6
+34 D5: 9C 12 34 56 78 30 00 85 2000 0801 10 3000=A6
+35 00: 9C 12 34 56 78 30 00 80 2000 0801 10 3000=A4
+35 D5: 9C 12 34 56 78 30 00 81 2000 0801 10 3000=A4
+36 00: 9C 12 34 56 78 30 00 00 2000 0802 10 3000=40
+36 D5: 9C 12 34 56 78 30 00 D5 2000 0802 10 3000=40
+37 00: 9C 12 34 56 78 30 00 01 2000 0801 4
+37 D5: 9C 12 34 56 78 30 00 D5 2000 0801 4
+38 00: 9C 12 34 56 78 30 00 00 2000 0801 4
+38 D5: 9C 12 34 56 78 30 00 D5 2000 0801 4
+39 00: 9C 12 34 56 78 23 00 01 2000 0801 10
+39 D5: 9C 12 34 56 78 23 00 D5 2000 0801 10
+3A 00: 3C 12 34 56 78 30 00 00 2000 0803 13
+3A D5: 3C 12 34 56 78 30 00 D5 2000 0803 13
+3B 00: 9C 12 34 56 78 30 00 00 1FFF 0801 6
+3B D5: 9C 12 34 56 78 30 00 D5 1FFF 0801 6
+3C 00: 9D 12 34 56 78 30 00 80 2000 0801 4
+3C D5: 9D 12 34 56 78 30 00 81 2000 0801 4
+3D 00: 9B 12 34 56 78 30 00 80 2000 0801 4
+3D D5: 9B 12 34 56 78 30 00 81 2000 0801 4
+3E 00: 40 12 34 56 78 30 00 00 2000 0802 7
+3E D5: 40 12 34 56 78 30 00 D5 2000 0802 7
+3F 00: 9C 12 34 56 78 30 00 01 2000 0801 4
+3F D5: 9C 12 34 56 78 30 00 D4 2000 0801 4
+40 00: 9C 12 34 56 78 30 00 00 2000 0801 4
+40 D5: 9C 12 34 56 78 30 00 D5 2000 0801 4
+41 00: 9C 34 34 56 78 30 00 00 2000 0801 4
+41 D5: 9C 34 34 56 78 30 00 D5 2000 0801 4
+42 00: 9C 56 34 56 78 30 00 00 2000 0801 4
+42 D5: 9C 56 34 56 78 30 00 D5 2000 0801 4
+43 00: 9C 78 34 56 78 30 00 00 2000 0801 4
+43 D5: 9C 78 34 56 78 30 00 D5 2000 0801 4
+44 00: 9C 30 34 56 78 30 00 00 2000 0801 4
+44 D5: 9C 30 34 56 78 30 00 D5 2000 0801 4
+45 00: 9C 00 34 56 78 30 00 00 2000 0801 4
+45 D5: 9C 00 34 56 78 30 00 D5 2000 0801 4
+46 00: 9C A5 34 56 78 30 00 00 2000 0801 7
+46 D5: 9C A5 34 56 78 30 00 D5 2000 0801 7
+47 00: 9C 9C 34 56 78 30 00 00 2000 0801 4
+47 D5: 9C 9C 34 56 78 30 00 D5 2000 0801 4
+48 00: 9C 12 12 56 78 30 00 00 2000 0801 4
+48 D5: 9C 12 12 56 78 30 00 D5 2000 0801 4
+49 00: 9C 12 34 56 78 30 00 00 2000 0801 4
+49 D5: 9C 12 34 56 78 30 00 D5 2000 0801 4
+4A 00: 9C 12 56 56 78 30 00 00 2000 0801 4
+4A D5: 9C 12 56 56 78 30 00 D5 2000 0801 4
+4B 00: 9C 12 78 56 78 30 00 00 2000 0801 4
+4B D5: 9C 12 78 56 78 30 00 D5 2000 0801 4
+4C 00: 9C 12 30 56 78 30 00 00 2000 0801 4
+4C D5: 9C 12 30 56 78 30 00 D5 2000 0801 4
+4D 00: 9C 12 00 56 78 30 00 00 2000 0801 4
+4D D5: 9C 12 00 56 78 30 00 D5 2000 0801 4
+4E 00: 9C 12 A5 56 78 30 00 00 2000 0801 7
+4E D5: 9C 12 A5 56 78 30 00 D5 2000 0801 7
+4F 00: 9C 12 9C 56 78 30 00 00 2000 0801 4
+4F D5: 9C 12 9C 56 78 30 00 D5 2000 0801 4
+50 00: 9C 12 34 12 78 30 00 00 2000 0801 4
+50 D5: 9C 12 34 12 78 30 00 D5 2000 0801 4
+51 00: 9C 12 34 34 78 30 00 00 2000 0801 4
+51 D5: 9C 12 34 34 78 30 00 D5 2000 0801 4
+52 00: 9C 12 34 56 78 30 00 00 2000 0801 4
+52 D5: 9C 12 34 56 78 30 00 D5 2000 0801 4
+53 00: 9C 12 34 78 78 30 00 00 2000 0801 4
+53 D5: 9C 12 34 78 78 30 00 D5 2000 0801 4
+54 00: 9C 12 34 30 78 30 00 00 2000 0801 4
+54 D5: 9C 12 34 30 78 30 00 D5 2000 0801 4
+55 00: 9C 12 34 00 78 30 00 00 2000 0801 4
+55 D5: 9C 12 34 00 78 30 00 D5 2000 0801 4
+56 00: 9C 12 34 A5 78 30 00 00 2000 0801 7
+56 D5: 9C 12 34 A5 78 30 00 D5 2000 0801 7
+57 00: 9C 12 34 9C 78 30 00 00 2000 0801 4
+57 D5: 9C 12 34 9C 78 30 00 D5 2000 0801 4
+58 00: 9C 12 34 56 12 30 00 00 2000 0801 4
+58 D5: 9C 12 34 56 12 30 00 D5 2000 0801 4
+59 00: 9C 12 34 56 34 30 00 00 2000 0801 4
+59 D5: 9C 12 34 56 34 30 00 D5 2000 0801 4
+5A 00: 9C 12 34 56 56 30 00 00 2000 0801 4
+5A D5: 9C 12 34 56 56 30 00 D5 2000 0801 4
+5B 00: 9C 12 34 56 78 30 00 00 2000 0801 4
+5B D5: 9C 12 34 56 78 30 00 D5 2000 0801 4
+5C 00: 9C 12 34 56 30 30 00 00 2000 0801 4
+5C D5: 9C 12 34 56 30 30 00 D5 2000 0801 4
+5D 00: 9C 12 34 56 00 30 00 00 2000 0801 4
+5D D5: 9C 12 34 56 00 30 00 D5 2000 0801 4
+5E 00: 9C 12 34 56 A5 30 00 00 2000 0801 7
+5E D5: 9C 12 34 56 A5 30 00 D5 2000 0801 7
+5F 00: 9C 12 34 56 9C 30 00 00 2000 0801 4
+5F D5: 9C 12 34 56 9C 30 00 D5 2000 0801 4
+60 00: 9C 12 34 56 78 12 00 00 2000 0801 4
+60 D5: 9C 12 34 56 78 12 00 D5 2000 0801 4
+61 00: 9C 12 34 56 78 34 00 00 2000 0801 4
+61 D5: 9C 12 34 56 78 34 00 D5 2000 0801 4
+62 00: 9C 12 34 56 78 56 00 00 2000 0801 4
+62 D5: 9C 12 34 56 78 56 00 D5 2000 0801 4
+63 00: 9C 12 34 56 78 78 00 00 2000 0801 4
+63 D5: 9C 12 34 56 78 78 00 D5 2000 0801 4
+64 00: 9C 12 34 56 78 30 00 00 2000 0801 4
+64 D5: 9C 12 34 56 78 30 00 D5 2000 0801 4
+65 00: 9C 12 34 56 78 00 00 00 2000 0801 4
+65 D5: 9C 12 34 56 78 00 00 D5 2000 0801 4
+66 00: 9C 12 34 56 78 A5 00 00 2000 0801 7
+66 D5: 9C 12 34 56 78 A5 00 D5 2000 0801 7
+67 00: 9C 12 34 56 78 9C 00 00 2000 0801 4
+67 D5: 9C 12 34 56 78 9C 00 D5 2000 0801 4
+68 00: 9C 12 34 56 78 30 12 00 2000 0801 4
+68 D5: 9C 12 34 56 78 30 12 D5 2000 0801 4
+69 00: 9C 12 34 56 78 30 34 00 2000 0801 4
+69 D5: 9C 12 34 56 78 30 34 D5 2000 0801 4
+6A 00: 9C 12 34 56 78 30 56 00 2000 0801 4
+6A D5: 9C 12 34 56 78 30 56 D5 2000 0801 4
+6B 00: 9C 12 34 56 78 30 78 00 2000 0801 4
+6B D5: 9C 12 34 56 78 30 78 D5 2000 0801 4
+6C 00: 9C 12 34 56 78 30 30 00 2000 0801 4
+6C D5: 9C 12 34 56 78 30 30 D5 2000 0801 4
+6D 00: 9C 12 34 56 78 30 00 00 2000 0801 4
+6D D5: 9C 12 34 56 78 30 00 D5 2000 0801 4
+6E 00: 9C 12 34 56 78 30 A5 00 2000 0801 7
+6E D5: 9C 12 34 56 78 30 A5 D5 2000 0801 7
+6F 00: 9C 12 34 56 78 30 9C 00 2000 0801 4
+6F D5: 9C 12 34 56 78 30 9C D5 2000 0801 4
+70 00: 9C 12 34 56 78 30 00 00 2000 0801 7 3000=12
+70 D5: 9C 12 34 56 78 30 00 D5 2000 0801 7 3000=12
+71 00: 9C 12 34 56 78 30 00 00 2000 0801 7 3000=34
+71 D5: 9C 12 34 56 78 30 00 D5 2000 0801 7 3000=34
+72 00: 9C 12 34 56 78 30 00 00 2000 0801 7 3000=56
+72 D5: 9C 12 34 56 78 30 00 D5 2000 0801 7 3000=56
+73 00: 9C 12 34 56 78 30 00 00 2000 0801 7 3000=78
+73 D5: 9C 12 34 56 78 30 00 D5 2000 0801 7 3000=78
+74 00: 9C 12 34 56 78 30 00 00 2000 0801 7 3000=30
+74 D5: 9C 12 34 56 78 30 00 D5 2000 0801 7 3000=30
+75 00: 9C 12 34 56 78 30 00 00 2000 0801 7 3000=00
+75 D5: 9C 12 34 56 78 30 00 D5 2000 0801 7 3000=00
+76 00: 9C 12 34 56 78 30 00 00 2000 0801 5 HLT
+76 D5: 9C 12 34 56 78 30 00 D5 2000 0801 5 HLT
+77 00: 9C 12 34 56 78 30 00 00 2000 0801 7 3000=9C
+77 D5: 9C 12 34 56 78 30 00 D5 2000 0801 7 3000=9C
+78 00: 12 12 34 56 78 30 00 00 2000 0801 4
+78 D5: 12 12 34 56 78 30 00 D5 2000 0801 4
+79 00: 34 12 34 56 78 30 00 00 2000 0801 4
+79 D5: 34 12 34 56 78 30 00 D5 2000 0801 4
+7A 00: 56 12 34 56 78 30 00 00 2000 0801 4
+7A D5: 56 12 34 56 78 30 00 D5 2000 0801 4
+7B 00: 78 12 34 56 78 30 00 00 2000 0801 4
+7B D5: 78 12 34 56 78 30 00 D5 2000 0801 4
+7C 00: 30 12 34 56 78 30 00 00 2000 0801 4
+7C D5: 30 12 34 56 78 30 00 D5 2000 0801 4
+7D 00: 00 12 34 56 78 30 00 00 2000 0801 4
+7D D5: 00 12 34 56 78 30 00 D5 2000 0801 4
+7E 00: A5 12 34 56 78 30 00 00 2000 0801 7
+7E D5: A5 12 34 56 78 30 00 D5 2000 0801 7
+7F 00: 9C 12 34 56 78 30 00 00 2000 0801 4
+7F D5: 9C 12 34 56 78 30 00 D5 2000 0801 4
+80 00: AE 12 34 56 78 30 00 80 2000 0801 4
+80 D5: AE 12 34 56 78 30 00 80 2000 0801 4
+81 00: D0 12 34 56 78 30 00 90 2000 0801 4
+81 D5: D0 12 34 56 78 30 00 90 2000 0801 4
+82 00: F2 12 34 56 78 30 00 90 2000 0801 4
+82 D5: F2 12 34 56 78 30 00 90 2000 0801 4
+83 00: 14 12 34 56 78 30 00 15 2000 0801 4
+83 D5: 14 12 34 56 78 30 00 15 2000 0801 4
+84 00: CC 12 34 56 78 30 00 84 2000 0801 4
+84 D5: CC 12 34 56 78 30 00 84 2000 0801 4
+85 00: 9C 12 34 56 78 30 00 84 2000 0801 4
+85 D5: 9C 12 34 56 78 30 00 84 2000 0801 4
+86 00: 41 12 34 56 78 30 00 15 2000 0801 7
+86 D5: 41 12 34 56 78 30 00 15 2000 0801 7
+87 00: 38 12 34 56 78 30 00 11 2000 0801 4
+87 D5: 38 12 34 56 78 30 00 11 2000 0801 4
+88 00: AE 12 34 56 78 30 00 80 2000 0801 4
+88 D5: AF 12 34 56 78 30 00 84 2000 0801 4
+89 00: D0 12 34 56 78 30 00 90 2000 0801 4
+89 D5: D1 12 34 56 78 30 00 94 2000 0801 4
+8A 00: 9C 12 34 56 78 30 00 00 2000 0801 4
+8A D5: 9C 12 34 56 78 30 00 D5 2000 0801 4
+8B 00: 9C 12 34 56 78 30 00 00 2000 0801 4
+8B D5: 9C 12 34 56 78 30 00 D5 2000 0801 4
+8C 00: 9C 12 34 56 78 30 00 00 2000 0801 4
+8C D5: 9C 12 34 56 78 30 00 D5 2000 0801 4
+8D 00: 9C 12 34 56 78 30 00 00 2000 0801 4
+8D D5: 9C 12 34 56 78 30 00 D5 2000 0801 4
+8E 00: 9C 12 34 56 78 30 00 00 2000 0801 7
+8E D5: 9C 12 34 56 78 30 00 D5 2000 0801 7
+8F 00: 9C 12 34 56 78 30 00 00 2000 0801 4
+8F D5: 9C 12 34 56 78 30 00 D5 2000 0801 4
+90 00: 8A 12 34 56 78 30 00 80 2000 0801 4
+90 D5: 8A 12 34 56 78 30 00 80 2000 0801 4
+91 00: 68 12 34 56 78 30 00 10 2000 0801 4
+91 D5: 68 12 34 56 78 30 00 10 2000 0801 4
+92 00: 46 12 34 56 78 30 00 00 2000 0801 4
+92 D5: 46 12 34 56 78 30 00 00 2000 0801 4
+93 00: 24 12 34 56 78 30 00 14 2000 0801 4
+93 D5: 24 12 34 56 78 30 00 14 2000 0801 4
+94 00: 6C 12 34 56 78 30 00 04 2000 0801 4
+94 D5: 6C 12 34 56 78 30 00 04 2000 0801 4
+95 00: 9C 12 34 56 78 30 00 84 2000 0801 4
+95 D5: 9C 12 34 56 78 30 00 84 2000 0801 4
+96 00: F7 12 34 56 78 30 00 81 2000 0801 7
+96 D5: F7 12 34 56 78 30 00 81 2000 0801 7
+97 00: 00 12 34 56 78 30 00 54 2000 0801 4
+97 D5: 00 12 34 56 78 30 00 54 2000 0801 4
+98 00: 8A 12 34 56 78 30 00 80 2000 0801 4
+98 D5: 89 12 34 56 78 30 00 80 2000 0801 4
+99 00: 68 12 34 56 78 30 00 10 2000 0801 4
+99 D5: 67 12 34 56 78 30 00 00 2000 0801 4
+9A 00: 9C 12 34 56 78 30 00 00 2000 0801 4
+9A D5: 9C 12 34 56 78 30 00 D5 2000 0801 4
+9B 00: 9C 12 34 56 78 30 00 00 2000 0801 4
+9B D5: 9C 12 34 56 78 30 00 D5 2000 0801 4
+9C 00: 9C 12 34 56 78 30 00 00 2000 0801 4
+9C D5: 9C 12 34 56 78 30 00 D5 2000 0801 4
+9D 00: 9C 12 34 56 78 30 00 00 2000 0801 4
+9D D5: 9C 12 34 56 78 30 00 D5 2000 0801 4
+9E 00: 9C 12 34 56 78 30 00 00 2000 0801 7
+9E D5: 9C 12 34 56 78 30 00 D5 2000 0801 7
+9F 00: 9C 12 34 56 78 30 00 00 2000 0801 4
+9F D5: 9C 12 34 56 78 30 00 D5 2000 0801 4
+A0 00: 10 12 34 56 78 30 00 00 2000 0801 4
+A0 D5: 10 12 34 56 78 30 00 00 2000 0801 4
+A1 00: 14 12 34 56 78 30 00 14 2000 0801 4
+A1 D5: 14 12 34 56 78 30 00 14 2000 0801 4
+A2 00: 14 12 34 56 78 30 00 04 2000 0801 4
+A2 D5: 14 12 34 56 78 30 00 04 2000 0801 4
+A3 00: 18 12 34 56 78 30 00 14 2000 0801 4
+A3 D5: 18 12 34 56 78 30 00 14 2000 0801 4
+A4 00: 10 12 34 56 78 30 00 00 2000 0801 4
+A4 D5: 10 12 34 56 78 30 00 00 2000 0801 4
+A5 00: 00 12 34 56 78 30 00 44 2000 0801 4
+A5 D5: 00 12 34 56 78 30 00 44 2000 0801 4
+A6 00: 84 12 34 56 78 30 00 84 2000 0801 7
+A6 D5: 84 12 34 56 78 30 00 84 2000 0801 7
+A7 00: 9C 12 34 56 78 30 00 94 2000 0801 4
+A7 D5: 9C 12 34 56 78 30 00 94 2000 0801 4
+A8 00: 8E 12 34 56 78 30 00 84 2000 0801 4
+A8 D5: 8E 12 34 56 78 30 00 84 2000 0801 4
+A9 00: A8 12 34 56 78 30 00 80 2000 0801 4
+A9 D5: A8 12 34 56 78 30 00 80 2000 0801 4
+AA 00: CA 12 34 56 78 30 00 84 2000 0801 4
+AA D5: CA 12 34 56 78 30 00 84 2000 0801 4
+AB 00: E4 12 34 56 78 30 00 84 2000 0801 4
+AB D5: E4 12 34 56 78 30 00 84 2000 0801 4
+AC 00: AC 12 34 56 78 30 00 84 2000 0801 4
+AC D5: AC 12 34 56 78 30 00 84 2000 0801 4
+AD 00: 9C 12 34 56 78 30 00 84 2000 0801 4
+AD D5: 9C 12 34 56 78 30 00 84 2000 0801 4
+AE 00: 39 12 34 56 78 30 00 04 2000 0801 7
+AE D5: 39 12 34 56 78 30 00 04 2000 0801 7
+AF 00: 00 12 34 56 78 30 00 44 2000 0801 4
+AF D5: 00 12 34 56 78 30 00 44 2000 0801 4
+B0 00: 9E 12 34 56 78 30 00 80 2000 0801 4
+B0 D5: 9E 12 34 56 78 30 00 80 2000 0801 4
+B1 00: BC 12 34 56 78 30 00 80 2000 0801 4
+B1 D5: BC 12 34 56 78 30 00 80 2000 0801 4
+B2 00: DE 12 34 56 78 30 00 84 2000 0801 4
+B2 D5: DE 12 34 56 78 30 00 84 2000 0801 4
+B3 00: FC 12 34 56 78 30 00 84 2000 0801 4
+B3 D5: FC 12 34 56 78 30 00 84 2000 0801 4
+B4 00: BC 12 34 56 78 30 00 80 2000 0801 4
+B4 D5: BC 12 34 56 78 30 00 80 2000 0801 4
+B5 00: 9C 12 34 56 78 30 00 84 2000 0801 4
+B5 D5: 9C 12 34 56 78 30 00 84 2000 0801 4
+B6 00: BD 12 34 56 78 30 00 84 2000 0801 7
+B6 D5: BD 12 34 56 78 30 00 84 2000 0801 7
+B7 00: 9C 12 34 56 78 30 00 84 2000 0801 4
+B7 D5: 9C 12 34 56 78 30 00 84 2000 0801 4
+B8 00: 9C 12 34 56 78 30 00 80 2000 0801 4
+B8 D5: 9C 12 34 56 78 30 00 80 2000 0801 4
+B9 00: 9C 12 34 56 78 30 00 10 2000 0801 4
+B9 D5: 9C 12 34 56 78 30 00 10 2000 0801 4
+BA 00: 9C 12 34 56 78 30 00 00 2000 0801 4
+BA D5: 9C 12 34 56 78 30 00 00 2000 0801 4
+BB 00: 9C 12 34 56 78 30 00 14 2000 0801 4
+BB D5: 9C 12 34 56 78 30 00 14 2000 0801 4
+BC 00: 9C 12 34 56 78 30 00 04 2000 0801 4
+BC D5: 9C 12 34 56 78 30 00 04 2000 0801 4
+BD 00: 9C 12 34 56 78 30 00 84 2000 0801 4
+BD D5: 9C 12 34 56 78 30 00 84 2000 0801 4
+BE 00: 9C 12 34 56 78 30 00 81 2000 0801 7
+BE D5: 9C 12 34 56 78 30 00 81 2000 0801 7
+BF 00: 9C 12 34 56 78 30 00 54 2000 0801 4
+BF D5: 9C 12 34 56 78 30 00 54 2000 0801 4
+C0 00: 9C 12 34 56 78 30 00 00 2002 0B09 12
+C0 D5: 9C 12 34 56 78 30 00 D5 2000 0801 12
+C1 00: 9C 0B 09 56 78 30 00 00 2002 0801 10
+C1 D5: 9C 0B 09 56 78 30 00 D5 2002 0801 10
+C2 00: 9C 12 34 56 78 30 00 00 2000 3040 10
+C2 D5: 9C 12 34 56 78 30 00 D5 2000 0803 10
+C3 00: 9C 12 34 56 78 30 00 00 2000 3040 10
+C3 D5: 9C 12 34 56 78 30 00 D5 2000 3040 10
+C4 00: 9C 12 34 56 78 30 00 00 1FFE 3040 18 1FFF=08,2000=03
+C4 D5: 9C 12 34 56 78 30 00 D5 2000 0803 18
+C5 00: 9C 12 34 56 78 30 00 00 1FFE 0801 12 1FFF=12,2000=34
+C5 D5: 9C 12 34 56 78 30 00 D5 1FFE 0801 12 1FFF=12,2000=34
+C6 00: DC 12 34 56 78 30 00 80 2000 0802 7
+C6 D5: DC 12 34 56 78 30 00 80 2000 0802 7
+C7 00: 9C 12 34 56 78 30 00 00 2000 0801 12
+C7 D5: 9C 12 34 56 78 30 00 D5 2000 0801 12
+C8 00: 9C 12 34 56 78 30 00 00 2000 0801 12
+C8 D5: 9C 12 34 56 78 30 00 D5 2002 0B09 12
+C9 00: 9C 12 34 56 78 30 00 00 2002 0B09 10
+C9 D5: 9C 12 34 56 78 30 00 D5 2002 0B09 10
+CA 00: 9C 12 34 56 78 30 00 00 2000 0803 10
+CA D5: 9C 12 34 56 78 30 00 D5 2000 3040 10
+CB 00: 9C 12 34 56 78 30 00 00 2000 0801 4
+CB D5: 9C 12 34 56 78 30 00 D5 2000 0801 4
+CC 00: 9C 12 34 56 78 30 00 00 2000 0803 18
+CC D5: 9C 12 34 56 78 30 00 D5 1FFE 3040 18 1FFF=08,2000=03
+CD 00: 9C 12 34 56 78 30 00 00 1FFE 3040 18 1FFF=08,2000=03
+CD D5: 9C 12 34 56 78 30 00 D5 1FFE 3040 18 1FFF=08,2000=03
+CE 00: DC 12 34 56 78 30 00 80 2000 0802 7
+CE D5: DD 12 34 56 78 30 00 84 2000 0802 7
+CF 00: 9C 12 34 56 78 30 00 00 2000 0801 12
+CF D5: 9C 12 34 56 78 30 00 D5 2000 0801 12
+D0 00: 9C 12 34 56 78 30 00 00 2002 0B09 12
+D0 D5: 9C 12 34 56 78 30 00 D5 2000 0801 12
+D1 00: 9C 12 34 0B 09 30 00 00 2002 0801 10
+D1 D5: 9C 12 34 0B 09 30 00 D5 2002 0801 10
+D2 00: 9C 12 34 56 78 30 00 00 2000 3040 10
+D2 D5: 9C 12 34 56 78 30 00 D5 2000 0803 10
+D3 00: 9C 12 34 56 78 30 00 00 2000 0802 10
+D3 D5: 9C 12 34 56 78 30 00 D5 2000 0802 10
+D4 00: 9C 12 34 56 78 30 00 00 1FFE 3040 18 1FFF=08,2000=03
+D4 D5: 9C 12 34 56 78 30 00 D5 2000 0803 18
+D5 00: 9C 12 34 56 78 30 00 00 1FFE 0801 12 1FFF=56,2000=78
+D5 D5: 9C 12 34 56 78 30 00 D5 1FFE 0801 12 1FFF=56,2000=78
+D6 00: 5C 12 34 56 78 30 00 04 2000 0802 7
+D6 D5: 5C 12 34 56 78 30 00 04 2000 0802 7
+D7 00: 9C 12 34 56 78 30 00 00 2000 0801 12
+D7 D5: 9C 12 34 56 78 30 00 D5 2000 0801 12
+D8 00: 9C 12 34 56 78 30 00 00 2000 0801 12
+D8 D5: 9C 12 34 56 78 30 00 D5 2002 0B09 12
+D9 00: 9C 12 34 56 78 30 00 00 2000 0801 4
+D9 D5: 9C 12 34 56 78 30 00 D5 2000 0801 4
+DA 00: 9C 12 34 56 78 30 00 00 2000 0803 10
+DA D5: 9C 12 34 56 78 30 00 D5 2000 3040 10
+DC 00: 9C 12 34 56 78 30 00 00 2000 0803 18
+DC D5: 9C 12 34 56 78 30 00 D5 1FFE 3040 18 1FFF=08,2000=03
+DD 00: 9C 12 34 56 78 30 00 00 2000 0801 4
+DD D5: 9C 12 34 56 78 30 00 D5 2000 0801 4
+DE 00: 9C 12 34 56 78 30 00 00 2000 0801 7
+DE D5: 9C 12 34 56 78 30 00 D5 2000 0801 7
+DF 00: 9C 12 34 56 78 30 00 00 2000 0801 12
+DF D5: 9C 12 34 56 78 30 00 D5 2000 0801 12
+E0 00: 9C 12 34 56 78 30 00 00 2002 0B09 12
+E0 D5: 9C 12 34 56 78 30 00 D5 2000 0801 12
+E1 00: 9C 12 34 56 78 0B 09 00 2002 0801 10
+E1 D5: 9C 12 34 56 78 0B 09 D5 2002 0801 10
+E2 00: 9C 12 34 56 78 30 00 00 2000 3040 10
+E2 D5: 9C 12 34 56 78 30 00 D5 2000 0803 10
+E3 00: 9C 12 34 56 78 30 00 00 2000 0801 16
+E3 D5: 9C 12 34 56 78 30 00 D5 2000 0801 16
+E4 00: 9C 12 34 56 78 30 00 00 1FFE 3040 18 1FFF=08,2000=03
+E4 D5: 9C 12 34 56 78 30 00 D5 2000 0803 18
+E5 00: 9C 12 34 56 78 30 00 00 1FFE 0801 12 1FFF=30
+E5 D5: 9C 12 34 56 78 30 00 D5 1FFE 0801 12 1FFF=30
+E6 00: 00 12 34 56 78 30 00 54 2000 0802 7
+E6 D5: 00 12 34 56 78 30 00 54 2000 0802 7
+E7 00: 9C 12 34 56 78 30 00 00 2000 0801 12
+E7 D5: 9C 12 34 56 78 30 00 D5 2000 0801 12
+E8 00: 9C 12 34 56 78 30 00 00 2000 0801 12
+E8 D5: 9C 12 34 56 78 30 00 D5 2002 0B09 12
+E9 00: 9C 12 34 56 78 30 00 00 2000 0801 6
+E9 D5: 9C 12 34 56 78 30 00 D5 2000 0801 6
+EA 00: 9C 12 34 56 78 30 00 00 2000 0803 10
+EA D5: 9C 12 34 56 78 30 00 D5 2000 3040 10
+EB 00: 9C 12 34 30 00 56 78 00 2000 0801 4
+EB D5: 9C 12 34 30 00 56 78 D5 2000 0801 4
+EC 00: 9C 12 34 56 78 30 00 00 2000 0803 18
+EC D5: 9C 12 34 56 78 30 00 D5 1FFE 3040 18 1FFF=08,2000=03
+ED 00: 9C 12 34 56 78 30 00 00 2000 0801 4
+ED D5: 9C 12 34 56 78 30 00 D5 2000 0801 4
+EE 00: DC 12 34 56 78 30 00 80 2000 0802 7
+EE D5: DC 12 34 56 78 30 00 80 2000 0802 7
+EF 00: 9C 12 34 56 78 30 00 00 2000 0801 12
+EF D5: 9C 12 34 56 78 30 00 D5 2000 0801 12
+F0 00: TypeError
+F0 D5: TypeError
+F1 00: 0B 12 34 56 78 30 00 09 2002 0801 10
+F1 D5: 0B 12 34 56 78 30 00 09 2002 0801 10
+F2 00: TypeError
+F2 D5: TypeError
+F3 00: 9C 12 34 56 78 30 00 00 2000 0801 4
+F3 D5: 9C 12 34 56 78 30 00 D5 2000 0801 4
+F4 00: TypeError
+F4 D5: TypeError
+F5 00: 9C 12 34 56 78 30 00 00 1FFE 0801 12 1FFF=9C
+F5 D5: 9C 12 34 56 78 30 00 D5 1FFE 0801 12 1FFF=9C,2000=D5
+F6 00: DC 12 34 56 78 30 00 80 2000 0802 7
+F6 D5: DC 12 34 56 78 30 00 80 2000 0802 7
+F7 00: 9C 12 34 56 78 30 00 00 2000 0801 12
+F7 D5: 9C 12 34 56 78 30 00 D5 2000 0801 12
+F8 00: TypeError
+F8 D5: TypeError
+F9 00: 9C 12 34 56 78 30 00 00 2000 0801 6
+F9 D5: 9C 12 34 56 78 30 00 D5 2000 0801 6
+FA 00: TypeError
+FA D5: TypeError
+FB 00: 9C 12 34 56 78 30 00 00 2000 0801 4
+FB D5: 9C 12 34 56 78 30 00 D5 2000 0801 4
+FC 00: TypeError
+FC D5: TypeError
+FD 00: 9C 12 34 56 78 30 00 00 2000 0801 4
+FD D5: 9C 12 34 56 78 30 00 D5 2000 0801 4
+FE 00: 9C 12 34 56 78 30 00 04 2000 0802 7
+FE D5: 9C 12 34 56 78 30 00 04 2000 0802 7
+FF 00: 9C 12 34 56 78 30 00 00 2000 0801 12
+FF D5: 9C 12 34 56 78 30 00 D5 2000 0801 12
+"""
+
+
+CPU = emu8085()
+
+
+def run_opcode(opcode, flags):
+    cpu = CPU
+    cpu.reset()
+    cpu.regs[:] = bytes((0x9C, 0x12, 0x34, 0x56, 0x78, 0x30, 0x00, flags))
+    cpu.SP.value = 0x2000
+    cpu.PC.value = 0x0800
+    cpu.mem[0x0800] = opcode
+    for addr, value in INITIAL_MEMORY.items():
+        cpu.mem[addr] = value
+    before = bytes(cpu.mem)
+    cycles = get_instruction_cycles(cpu.mem, 0x0800)
+    try:
+        cpu.runcrntins()
+    except Exception as exc:
+        return f"{opcode:02X} {flags:02X}: {type(exc).__name__}"
+    line = (
+        f"{opcode:02X} {flags:02X}: {cpu.regs.hex(' ').upper()} "
+        f"{cpu.SP.value:04X} {cpu.PC.value:04X} {cycles}"
+    )
+    if cpu.haulted:
+        line += " HLT"
+    writes = []
+    for base in range(0, len(before), 0x100):  # scan only the pages that differ
+        if before[base : base + 0x100] != cpu.mem[base : base + 0x100]:
+            writes.extend(
+                f"{addr:04X}={cpu.mem[addr]:02X}"
+                for addr in range(base, base + 0x100)
+                if before[addr] != cpu.mem[addr]
+            )
+    if writes:
+        line += " " + ",".join(writes)
+    return line
+
+
+@pytest.mark.parametrize("expected", EXPECTED.splitlines())
+def test_opcode(expected):
+    opcode, flags = (int(field, 16) for field in expected[:5].split())
+    assert run_opcode(opcode, flags) == expected
@@ -7,7 +7,7 @@ import logging
 import os
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Mapping, Optional
 
 INCLUDE_HOVER_EXAMPLES = os.getenv("ASM8085_HOVER_EXAMPLES", "0").strip().lower() in {
     "1",
@@ -18,7 +18,7 @@ INCLUDE_HOVER_EXAMPLES = os.getenv("ASM8085_HOVER_EXAMPLES", "0").strip().lower(
 
 
 @lru_cache(maxsize=1)
-def load_instruction_metadata() -> Dict[str, Dict[str, Any]]:
+def load_instruction_metadata() -> Mapping[str, Dict[str, Any]]:
     """Load the detailed instruction database with a JSON-to-Python fallback."""
 
     db_path = Path(__file__).parent / "asm8085_cli" / "instruction_db.json"
@@ -38,7 +38,7 @@ def load_instruction_metadata() -> Dict[str, Dict[str, Any]]:
             )
 
     try:
-        from asm8085_cli import INSTRUCTION_DB
+        from .asm8085_cli.shared.instruction_db import INSTRUCTION_DB
 
         logging.info(
             "Instruction metadata loaded from Python module (%d entries)",
@@ -0,0 +1,92 @@
+"""
+Opt-in supervisor for the 8085 Assembly Language Server.
+
+Imports the server (and the instruction metadata it serves) once, then
+forks a child per server lifetime on POSIX systems. When a server instance
+crashes, the replacement is forked from the already-warm parent instead of
+paying the full interpreter start-up and import cost again.
+
+A clean exit of the server (e.g. the client closed stdin) ends the
+supervisor as well. Platforms without fork() simply run the server
+in-process.
+"""
+
+import os
+import sys
+import time
+
+# Give up if the server keeps dying faster than this
+MAX_RAPID_RESTARTS = 5
+RAPID_RESTART_WINDOW = 10.0  # seconds
+
+
+def _prewarm():
+    """Import the server module graph and load the instruction metadata."""
+    from . import server
+    from .instruction_docs import load_instruction_metadata
+
+    load_instruction_metadata()
+    return server
+
+
+def _exit_status(status: int) -> int:
+    if os.WIFEXITED(status):
+        return os.WEXITSTATUS(status)
+    return 128 + os.WTERMSIG(status) if os.WIFSIGNALED(status) else 1
+
+
+def main():
+    """Entry point for the asm8085-lsp-supervisor console script."""
+    server = _prewarm()
+
+    if not hasattr(os, "fork"):
+        return server.main()
+
+    restarts = []
+    while True:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        pid = os.fork()
+        if pid == 0:
+            code = 0
+            try:
+                server.main()
+            except SystemExit as exc:
+                # sys.exit() / sys.exit(None) is a clean exit, not a crash
+                if exc.code is None:
+                    code = 0
+                else:
+                    code = exc.code if isinstance(exc.code, int) else 1
+            except BaseException:
+                import traceback
+
+                traceback.print_exc()
+                code = 1
+            finally:
+                sys.stdout.flush()
+                sys.stderr.flush()
+            os._exit(code)
+
+        _, status = os.waitpid(pid, 0)
+        code = _exit_status(status)
+        if code == 0:
+            return 0
+
+        now = time.monotonic()
+        restarts = [t for t in restarts if now - t < RAPID_RESTART_WINDOW]
+        restarts.append(now)
+        if len(restarts) > MAX_RAPID_RESTARTS:
+            print(
+                f"asm8085-lsp-supervisor: server exited with status {code} "
+                f"{len(restarts)} times in {RAPID_RESTART_WINDOW:.0f}s, giving up",
+                file=sys.stderr,
+            )
+            return code
+        print(
+            f"asm8085-lsp-supervisor: server exited with status {code}, restarting",
+            file=sys.stderr,
+        )
+
+
+if __name__ == "__main__":
+    sys.exit(main() or 0)
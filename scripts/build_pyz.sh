@@ -0,0 +1,63 @@
+#!/usr/bin/env bash
+# Build script for asm8085-lsp zipapp
+# Packs the server as a bytecode-only .pyz so the interpreter never has to
+# tokenize/compile the sources when an editor (re)spawns the language server
+
+set -e
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+PROJECT_ROOT="$(cd "$SCRIPT_DIR/.." && pwd)"
+DIST_DIR="$PROJECT_ROOT/dist"
+STAGE_DIR="$PROJECT_ROOT/build/pyz"
+PYZ_PATH="$DIST_DIR/asm8085-lsp.pyz"
+
+# Colors for output
+RED='\033[0;31m'
+GREEN='\033[0;32m'
+BLUE='\033[0;34m'
+NC='\033[0m' # No Color
+
+echo -e "${BLUE}=== Building asm8085-lsp zipapp ===${NC}"
+
+# Check for Python
+if ! command -v python3 &> /dev/null; then
+    echo -e "${RED}Error: python3 is required but not found${NC}"
+    exit 1
+fi
+
+# Stage a clean copy of the package
+echo -e "${BLUE}Staging package...${NC}"
+rm -rf "$STAGE_DIR" "$PYZ_PATH"
+mkdir -p "$STAGE_DIR" "$DIST_DIR"
+cp -R "$PROJECT_ROOT/asm8085_lsp" "$STAGE_DIR/"
+find "$STAGE_DIR" -type d -name __pycache__ -exec rm -rf {} + 2>/dev/null || true
+rm -rf "$STAGE_DIR/asm8085_lsp/asm8085_cli/tests"
+
+# Compile to legacy (sibling) .pyc files, which zipimport can load without
+# the sources, then drop the sources. -o 2 matches python -OO and strips
+# docstrings, so no __doc__ strings are materialized at import
+echo -e "${BLUE}Compiling bytecode...${NC}"
+python3 -m compileall -q -b -o 2 "$STAGE_DIR/asm8085_lsp"
+find "$STAGE_DIR" -type f -name "*.py" -delete
+
+# Pack the archive
+echo -e "${BLUE}Creating zipapp...${NC}"
+python3 -m zipapp "$STAGE_DIR" \
+    -m "asm8085_lsp.server:main" \
+    -p "/usr/bin/env python3" \
+    -c \
+    -o "$PYZ_PATH"
+
+if [ -f "$PYZ_PATH" ]; then
+    FILE_SIZE=$(du -h "$PYZ_PATH" | cut -f1)
+    echo -e "${GREEN}✓ Build successful!${NC}"
+    echo -e "${GREEN}Zipapp: $PYZ_PATH ($FILE_SIZE)${NC}"
+else
+    echo -e "${RED}✗ Build failed: zipapp not found at $PYZ_PATH${NC}"
+    exit 1
+fi
+
+echo -e "${GREEN}=== Build complete ===${NC}"
+echo -e "Run with: ${BLUE}python3 $PYZ_PATH${NC}"
+echo ""
+echo -e "Note: the bytecode is tied to the Python version used for the build."
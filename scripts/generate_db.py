@@ -11,9 +11,9 @@ from pathlib import Path
 
 def main() -> None:
     repo_root = Path(__file__).resolve().parents[1]
-    lsp_dir = repo_root / "lsp"
+    shared_dir = repo_root / "asm8085_lsp" / "asm8085_cli" / "shared"
 
-    instruction_db_path = lsp_dir / "asm8085_cli" / "instruction_db.py"
+    instruction_db_path = shared_dir / "instruction_db.py"
     spec = spec_from_file_location("asm8085_cli.instruction_db", instruction_db_path)
     if spec is None or spec.loader is None:  # pragma: no cover - build-time script
         raise SystemExit(
@@ -28,9 +28,10 @@ def main() -> None:
     except AttributeError as exc:  # pragma: no cover - build-time script
         raise SystemExit(f"Instruction DB missing in module: {exc}") from exc
 
-    output_path = lsp_dir / "asm8085_cli" / "instruction_db.json"
+    output_path = shared_dir / "instruction_db.json"
     output_path.write_text(
-        json.dumps(INSTRUCTION_DB, indent=2, ensure_ascii=True) + "\n",
+        # INSTRUCTION_DB is a read-only mapping proxy; json needs a real dict
+        json.dumps(dict(INSTRUCTION_DB), indent=2, ensure_ascii=True) + "\n",
         encoding="utf-8",
     )
 
@@ -3,6 +3,7 @@
 Setup configuration for asm8085-lsp Language Server.
 """
 
+import os
 from pathlib import Path
 
 from setuptools import find_packages, setup
@@ -13,6 +14,16 @@ long_description = (
     readme_file.read_text(encoding="utf-8") if readme_file.exists() else ""
 )
 
+# Opt-in: ASM8085_MYPYC=1 compiles the emulator stepping helpers to a C
+# extension with mypyc. mypy must be importable by the build, e.g.
+# `pip install mypy && ASM8085_MYPYC=1 pip install --no-build-isolation .`
+# or `make mypyc`. Without it the pure-Python module is used as before.
+ext_modules = []
+if os.environ.get("ASM8085_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(["asm8085_lsp/asm8085_cli/shared/executor.py"])
+
 setup(
     name="asm8085-lsp",
     version="0.2.1",
@@ -24,14 +35,20 @@ setup(
     url="https://github.com/Restythecake/asm8085-lsp",
     license="MIT",
     packages=find_packages(),
+    ext_modules=ext_modules,
     include_package_data=True,
-    python_requires=">=3.8",
+    python_requires=">=3.9",
     install_requires=[
         # No external dependencies - uses only Python standard library
     ],
+    extras_require={
+        # Event-driven `asm --auto` watch mode (falls back to polling without it)
+        "watch": ["watchdog>=2.0"],
+    },
     entry_points={
         "console_scripts": [
             "asm8085-lsp=asm8085_lsp:main",
+            "asm8085-lsp-supervisor=asm8085_lsp.supervisor:main",
         ],
     },
     classifiers=[
@@ -39,7 +56,6 @@ setup(
         "Intended Audience :: Developers",
         "License :: OSI Approved :: MIT License",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",